@@ -5,73 +5,119 @@ import random
 from . import exception
 from . import config
 import secrets
-from mlx import Mlx
+from typing import Any, Iterable, Iterator
 from .utils.mlx_utils import manage_expose, manage_close, manage_key_simple
 from .utils.mlx_utils import XVar, render_maze_to_mlx, \
-                            calculate_window_size
+                            calculate_window_size, compile_palettes
 from .utils.maze_utils import generate_maze as utils_generate_maze
+from .utils.maze_utils import stream_maze as utils_stream_maze
 from .utils.buttons import mouse_handler, buttons_init, \
                            draw_buttons, button_toggle_path
-from .resolve import resolve
+from .utils.maze_grid import MazeGrid
+from .utils.tasks import manage_loop
+from .resolve import resolve, solve_many, iter_many, Pair, Heuristic
+from . import distance
+from .tree_index import TreeIndex
+from .incremental import DynamicSolver, Wall
+from .analytics import MazeReport, analyze
 from .parser import generate_output as parser_generate_output
+from .parser import format_output as parser_format_output
+
+try:
+    from mlx import Mlx
+except ImportError:
+    Mlx = None
 
 
 class MazeGenerator:
-    """A class to generate, solve, and visualize mazes using MLX."""
+    """A class to generate, solve, and visualize mazes using MLX.
+
+    MLX is only initialized on first use of a drawing method; pass
+    `headless=True` to forbid it entirely (e.g. in batch workers).
+    """
 
     def __init__(
             self,
             path: str,
-            seed: str = "0",
-            size: tuple[int, int] = (-1, -1)
+            seed: str | None = None,
+            size: tuple[int, int] = (-1, -1),
+            headless: bool = False
             ) -> None:
         """
         Initialize the maze generator with a configuration file.
 
+        No graphics state is created here: MLX and the window are only
+        initialized the first time a drawing method (or `run`) needs them.
+
         Args:
             path (str): The path to the configuration file.
-            seed (str): The seed for random number generation. Defaults to "0".
+            seed (str | None): The seed for random number generation, used
+            as is (even "0"). Defaults to None, which keeps the config
+            SEED, where 0 picks a random seed.
             size (tuple[int, int]): Optional override for maze size.
+            headless (bool): Never initialize MLX; generation, solving and
+            output writing only. Forces ANIMATION off.
 
         Raises:
-            exception.ConfigException: If the configuration is invalid or MLX
-            cannot be initialized.
+            exception.ConfigException: If the configuration is invalid.
         """
         self.__xvar = XVar()
-        try:
-            self.__xvar.mlx = Mlx()
-        except Exception as e:
-            raise exception.ConfigException(f"Can't initialize MLX: {e}")
-
+        self.__headless = headless
+        self.__tree_index: tuple[MazeGrid, TreeIndex] | None = None
+        self.__dynamic: DynamicSolver | None = None
         self.__config = config.Config(path)
         self.__xvar.show_path = False
+        if headless:
+            self.__config.ANIMATION = 0
         if (size[0] != -1 and size[1] != -1):
             self.__config.WIDTH, self.__config.HEIGHT = size
 
+        if self.__config.EXIT[0] < 0 or \
+                self.__config.EXIT[0] > self.__config.WIDTH:
+            raise exception.ConfigException(f"EXIT X position is out of \
+range (min 1, max {self.__config.WIDTH})")
+        if self.__config.EXIT[1] < 0 or \
+                self.__config.EXIT[1] > self.__config.HEIGHT:
+            raise exception.ConfigException(f"EXIT Y position is out of \
+range (min 1, max {self.__config.HEIGHT})")
+        if self.__config.ENTRY[0] < 0 or \
+                self.__config.ENTRY[0] > self.__config.WIDTH:
+            raise exception.ConfigException(f"ENTRY X position is out of \
+range (min 1, max {self.__config.WIDTH})")
+        if self.__config.ENTRY[1] < 0 or \
+                self.__config.ENTRY[1] > self.__config.HEIGHT:
+            raise exception.ConfigException(f"ENTRY Y position is out of \
+range (min 1, max {self.__config.HEIGHT})")
+        new_seed = self.__config.SEED
+        if new_seed == "0":
+            new_seed = secrets.token_hex(8)
+        if seed is not None:
+            new_seed = seed
+        random.seed(new_seed)
+        self.__config.SEED = new_seed
+
+    def __init_graphics(self) -> None:
+        """
+        Initialize MLX, open the window and register the hooks, once.
+
+        Raises:
+            exception.ConfigException: If running headless or MLX cannot
+            be initialized.
+        """
+        if self.__xvar.win_1:
+            return
+        if self.__headless:
+            raise exception.ConfigException("Graphics are disabled in \
+headless mode")
+        try:
+            if Mlx is None:
+                raise Exception("the mlx package is not installed")
+            self.__xvar.mlx = Mlx()
+        except Exception as e:
+            raise exception.ConfigException(f"Can't initialize MLX: {e}")
+        self.__xvar.palettes = compile_palettes(self.__config.COLORS)
+
         try:
-            if self.__config.EXIT[0] < 0 or \
-                    self.__config.EXIT[0] > self.__config.WIDTH:
-                raise Exception(f"EXIT X position is out of range \
-(min 1, max {self.__config.WIDTH})")
-            if self.__config.EXIT[1] < 0 or \
-                    self.__config.EXIT[1] > self.__config.HEIGHT:
-                raise Exception(f"EXIT Y position is out of range \
-(min 1, max {self.__config.HEIGHT})")
-            if self.__config.ENTRY[0] < 0 or \
-                    self.__config.ENTRY[0] > self.__config.WIDTH:
-                raise Exception(f"ENTRY X position is out of range \
-(min 1, max {self.__config.WIDTH})")
-            if self.__config.ENTRY[1] < 0 or \
-                    self.__config.ENTRY[1] > self.__config.HEIGHT:
-                raise Exception(f"ENTRY Y position is out of range \
-(min 1, max {self.__config.HEIGHT})")
-            new_seed = self.__config.SEED
-            if new_seed == "0":
-                new_seed = secrets.token_hex(8)
-            if (seed != "0"):
-                new_seed = seed
-            random.seed(new_seed)
-            self.__config.SEED = new_seed
             self.__xvar.mlx_ptr = self.__xvar.mlx.mlx_init()
             ret, self.__xvar.screen_w, self.__xvar.screen_h =\
                 self.__xvar.mlx.mlx_get_screen_size(self.__xvar.mlx_ptr)
@@ -114,6 +160,11 @@ class MazeGenerator:
                 self.__main_expose,
                 self.__xvar
             )
+            self.__xvar.mlx.mlx_loop_hook(
+                self.__xvar.mlx_ptr,
+                manage_loop,
+                self.__xvar
+            )
         except Exception as e:
             raise exception.ConfigException(f"MLX error: {e}")
 
@@ -127,24 +178,26 @@ class MazeGenerator:
         manage_expose(xvar)
         draw_buttons(xvar)
 
-    def generate_maze(self) -> list[list[int]]:
+    def generate_maze(self) -> MazeGrid:
         """
         Generate a maze based on the loaded configuration.
 
         Returns:
-            list[list[int]]: The generated maze as a 2D grid.
+            MazeGrid: The generated maze as a flat row-major grid.
         """
-
+        if self.__config.ANIMATION:
+            self.__init_graphics()
         self.__xvar.maze_data = utils_generate_maze(self.__config, self.__xvar)
         return self.__xvar.maze_data
 
-    def draw_maze(self, maze: list[list[int]]) -> None:
+    def draw_maze(self, maze: MazeGrid) -> None:
         """
         Render the maze to the MLX window.
 
         Args:
-            maze (list[list[int]]): The maze grid to draw.
+            maze (MazeGrid): The maze grid to draw.
         """
+        self.__init_graphics()
         render_maze_to_mlx(
             self.__xvar.mlx,
             self.__xvar.mlx_ptr,
@@ -158,22 +211,40 @@ class MazeGenerator:
         """
         Initialize and draw the control buttons on the window.
         """
+        self.__init_graphics()
         buttons_init(self.__config, self.__xvar)
         draw_buttons(self.__xvar)
 
-    def get_solution(self, maze: list[list[int]]) -> list[str]:
+    def get_solution(self, maze: MazeGrid,
+                     method: str | None = None,
+                     heuristic: Heuristic | None = None) -> list[str]:
         """
         Solve the maze and return the solution path.
 
         Args:
-            maze (list[list[int]]): The maze grid.
+            maze (MazeGrid): The maze grid.
+            method (str | None): Solver from config.SOLVERS, defaults to
+                the SOLVER config entry, or to astar with a heuristic.
+            heuristic (Heuristic | None): A* heuristic, called as
+                heuristic(x, y, exit_x, exit_y); the path is only the
+                shortest if it never overestimates the distance.
 
         Returns:
             list[tuple[int, int]]: The solution path as a list of coordinates.
 
         Raises:
+            exception.ConfigException: If the solver is unknown, or is
+                not astar while a heuristic is given.
             exception.MazeException: If no solution is found.
         """
+        if heuristic is not None:
+            method = method or "astar"
+            if method != "astar":
+                raise exception.ConfigException(
+                    f"Solver '{method}' does not take a heuristic")
+        method = method or self.__config.SOLVER
+        if method not in config.SOLVERS:
+            raise exception.ConfigException(f"Unknown solver: '{method}'")
         pos: tuple[int, int] = (self.__config.ENTRY[0], self.__config.ENTRY[1])
         result = resolve(
             pos,
@@ -181,32 +252,191 @@ class MazeGenerator:
             maze,
             None,
             self.__config,
-            self.__xvar
+            self.__xvar,
+            method,
+            heuristic
         )
         if type(result) is list:
             return result
         else:
             raise exception.MazeException("The maze has no possible solution")
 
+    def edit_walls(self, maze: MazeGrid, opened: Iterable[Wall] = (),
+                   closed: Iterable[Wall] = ()) -> list[str] | None:
+        """
+        Open and close walls, repairing the solution incrementally.
+
+        The first call on a maze runs one full BFS; later calls only
+        revisit the cells whose distance to the entry changed. The
+        repaired solution is cached, so `get_solution` reuses it.
+
+        Args:
+            maze (MazeGrid): The maze grid, edited in place.
+            opened (Iterable[Wall]): Walls to open, as pairs of adjacent
+                (x, y) cells.
+            closed (Iterable[Wall]): Walls to close.
+
+        Returns:
+            list[str] | None: The new solution, None if the exit became
+            unreachable.
+
+        Raises:
+            exception.MazeException: If a wall is not between two adjacent
+                cells.
+        """
+        entry = (self.__config.ENTRY[0], self.__config.ENTRY[1])
+        end = (self.__config.EXIT[0], self.__config.EXIT[1])
+        dynamic = self.__dynamic
+        if dynamic is None or dynamic.maze is not maze \
+                or dynamic.start != entry or dynamic.end != end:
+            dynamic = DynamicSolver(maze, entry, end)
+            self.__dynamic = dynamic
+        result = dynamic.apply(opened, closed)
+        self.__xvar.path = list(maze.solution.cells)
+        return result
+
+    def get_solutions(self, maze: MazeGrid,
+                      pairs: list[Pair]) -> list[str | None]:
+        """
+        Solve many (source, target) pairs at once.
+
+        One BFS runs per distinct source (or per distinct target when
+        there are fewer) and answers every pair sharing it.
+
+        Args:
+            maze (MazeGrid): The maze grid.
+            pairs (list[Pair]): (source, target) cells, as (x, y) tuples.
+
+        Returns:
+            list[str | None]: Directions of every pair, None where no
+            path exists.
+        """
+        return solve_many(maze, pairs)
+
+    def iter_solutions(self, maze: MazeGrid,
+                       pairs: list[Pair]) -> list[Iterator[str] | None]:
+        """
+        Like `get_solutions`, but return lazy direction iterators.
+
+        Args:
+            maze (MazeGrid): The maze grid.
+            pairs (list[Pair]): (source, target) cells, as (x, y) tuples.
+
+        Returns:
+            list[Iterator[str] | None]: One iterator per pair, None where
+            no path exists.
+        """
+        return iter_many(maze, pairs)
+
+    def distance_map(self, maze: MazeGrid,
+                     source: tuple[int, int] | None = None,
+                     wavefront: bool = False) -> Any:
+        """
+        Compute the distance of every cell to `source`.
+
+        Args:
+            maze (MazeGrid): The maze grid.
+            source (tuple[int, int] | None): Source cell, defaults to the
+                entry.
+            wavefront (bool): Use the NumPy wavefront instead of BFS;
+                only faster on shallow mazes, see
+                `distance.distance_field`.
+
+        Returns:
+            ndarray | array: (height, width) uint32 distances,
+            distance.UNREACHABLE for disconnected cells, or a flat
+            row-major array('I') of them without NumPy.
+
+        Raises:
+            exception.MazeException: If `wavefront` is set and NumPy is
+                not installed.
+        """
+        if source is None:
+            source = (self.__config.ENTRY[0], self.__config.ENTRY[1])
+        if wavefront:
+            return distance.distance_field(maze, source)
+        return distance.bfs_field(maze, source)
+
+    def get_descent_solution(self, maze: MazeGrid) -> list[str]:
+        """
+        Solve the maze by descending a distance field built from the exit.
+
+        Args:
+            maze (MazeGrid): The maze grid.
+
+        Returns:
+            list[str]: The directions from the entry to the exit.
+
+        Raises:
+            exception.MazeException: If no solution is found.
+        """
+        field = self.distance_map(
+            maze, (self.__config.EXIT[0], self.__config.EXIT[1]))
+        result = distance.descend(
+            maze, field, (self.__config.ENTRY[0], self.__config.ENTRY[1]))
+        if result is None:
+            raise exception.MazeException("The maze has no possible solution")
+        return result
+
+    def tree_index(self, maze: MazeGrid) -> TreeIndex:
+        """
+        Return the path query index of a perfect maze, built once.
+
+        The index is rebuilt only when another maze or changed walls are
+        passed in.
+
+        Args:
+            maze (MazeGrid): A perfect maze.
+
+        Returns:
+            TreeIndex: The index, rooted at the entry.
+
+        Raises:
+            exception.MazeException: If the maze is not perfect.
+        """
+        index = self.__tree_index
+        if index is None or index[0] is not maze \
+                or index[1].version != maze.version:
+            root = (self.__config.ENTRY[0], self.__config.ENTRY[1])
+            index = (maze, TreeIndex(maze, root))
+            self.__tree_index = index
+        return index[1]
+
+    def analyze(self, maze: MazeGrid) -> MazeReport:
+        """
+        Compute the grading metrics of a maze.
+
+        Args:
+            maze (MazeGrid): The maze grid.
+
+        Returns:
+            MazeReport: Dead ends, junctions, corridor lengths, loops,
+            components, solution length and diameter.
+        """
+        return analyze(maze, (self.__config.ENTRY[0], self.__config.ENTRY[1]),
+                       (self.__config.EXIT[0], self.__config.EXIT[1]))
+
     def draw_solution(self) -> None:
         """
         Highlight the solution path on the window.
         """
+        self.__init_graphics()
         button_toggle_path(self.__config, self.__xvar, True)
 
     def hide_solution(self) -> None:
         """
         Hide the solution path on the window.
         """
+        self.__init_graphics()
         button_toggle_path(self.__config, self.__xvar, False)
 
-    def generate_output(self, maze: list[list[int]],
+    def generate_output(self, maze: MazeGrid,
                         solution: list[str]) -> bool:
         """
         Write the maze and solution to the output file.
 
         Args:
-            maze (list[list[int]]): The maze grid.
+            maze (MazeGrid): The maze grid.
             solution (list[tuple]): The solution path.
 
         Returns:
@@ -218,10 +448,40 @@ class MazeGenerator:
             self.__config
         )
 
+    def stream_output(self) -> bool:
+        """
+        Write a perfect Eller maze to the output file row by row.
+
+        The grid is never built, so HEIGHT is only bounded by the disk;
+        the solution line is left empty since solving needs the grid.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        return utils_stream_maze(self.__config)
+
+    def format_output(self, maze: MazeGrid, solution: list[str]) -> str:
+        """
+        Return the maze and solution in the output file format.
+
+        Args:
+            maze (MazeGrid): The maze grid.
+            solution (list[str]): The solution path.
+
+        Returns:
+            str: The content generate_output would write.
+        """
+        return parser_format_output(
+            maze,
+            solution,
+            self.__config
+        )
+
     def run(self) -> None:
         """
         Start the MLX event loop.
         """
+        self.__init_graphics()
         self.__xvar.mlx.mlx_loop(self.__xvar.mlx_ptr)
         self.__xvar.mlx.mlx_destroy_window(
             self.__xvar.mlx_ptr,
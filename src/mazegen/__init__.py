@@ -1,5 +1,6 @@
 """Maze generation package."""
 from .MazeGenerator import MazeGenerator
+from .utils.maze_grid import MazeGrid
 from typing import Any
 
-__all__: Any = [MazeGenerator]
+__all__: Any = [MazeGenerator, MazeGrid]
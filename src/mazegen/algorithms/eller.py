@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Eller's algorithm for row-streaming maze generation."""
+
+import random
+from ..utils.mlx_utils import XVar
+from ..utils.generate_utils import Bit_position
+from ..utils.maze_grid import MazeGrid
+from ..config import Config
+from .steps import Step, run
+from typing import Callable, Iterator, List, Optional, Sequence
+
+
+def _find(parent: List[int], i: int) -> int:
+    """Return the set representative of label `i` (path halving)."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def rows(width: int, height: int,
+         preset: Optional[Callable[[int], Sequence[int]]] = None
+         ) -> Iterator[bytearray]:
+    """
+    Generate a perfect maze one finished row at a time.
+
+    Only the set labels of the current row are kept, so memory is
+    O(width) whatever the height. Cells whose preset value carries the
+    VISITED bit (e.g. the '42' symbol) are copied as-is and never joined.
+    A set fully enclosed by such cells cannot be joined to the rest of
+    the maze once its row has been emitted.
+
+    Args:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        preset (Callable[[int], Sequence[int]] | None): Returns the
+            initial cell values of a row, or None if no cell is preset.
+
+    Yields:
+        bytearray: The cell bitmasks of each row, from top to bottom.
+    """
+    visited = Bit_position.VISITED.value
+    north = Bit_position.NORTH.value
+    east = Bit_position.EAST.value
+    south = Bit_position.SOUTH.value
+    west = Bit_position.WEST.value
+
+    def blocked_row(y: int) -> bytearray:
+        blocked = bytearray(width)
+        if preset is not None:
+            for x, value in enumerate(preset(y)):
+                if value & visited:
+                    blocked[x] = value
+        return blocked
+
+    labels = [-1] * width
+    from_north = bytearray(width)
+    blocked = blocked_row(0)
+    for y in range(height):
+        last = y == height - 1
+        next_blocked = blocked_row(y + 1) if not last else bytearray(width)
+        parent = list(range(width))
+        row = bytearray(width)
+
+        used = {label for label in labels if label != -1}
+        free_label = 0
+        for x in range(width):
+            if blocked[x]:
+                row[x] = blocked[x]
+                labels[x] = -1
+                continue
+            row[x] = visited
+            if from_north[x]:
+                row[x] |= north
+            if labels[x] == -1:
+                while free_label in used:
+                    free_label += 1
+                labels[x] = free_label
+                free_label += 1
+
+        def join(x: int, a: int, b: int) -> None:
+            parent[b] = a
+            row[x] |= east
+            row[x + 1] |= west
+
+        for x in range(width - 1):
+            if blocked[x] or blocked[x + 1]:
+                continue
+            a = _find(parent, labels[x])
+            b = _find(parent, labels[x + 1])
+            if a != b and (last or random.random() < 0.5):
+                join(x, a, b)
+
+        if last:
+            yield row
+            return
+
+        # Sets that cannot drop below must merge with a neighbouring set.
+        changed = next_blocked.count(0) != width
+        while changed:
+            changed = False
+            can_drop = {_find(parent, labels[x]) for x in range(width)
+                        if not blocked[x] and not next_blocked[x]}
+            for x in range(width - 1):
+                if blocked[x] or blocked[x + 1]:
+                    continue
+                a = _find(parent, labels[x])
+                b = _find(parent, labels[x + 1])
+                if a != b and (a not in can_drop or b not in can_drop):
+                    join(x, a, b)
+                    changed = True
+
+        members: dict[int, List[int]] = {}
+        for x in range(width):
+            if not blocked[x] and not next_blocked[x]:
+                members.setdefault(_find(parent, labels[x]), []).append(x)
+
+        next_labels = [-1] * width
+        from_north = bytearray(width)
+        for label, xs in enumerate(members.values()):
+            drops = [x for x in xs if random.random() < 0.5]
+            if not drops:
+                drops = [random.choice(xs)]
+            for x in drops:
+                row[x] |= south
+                next_labels[x] = label
+                from_north[x] = 1
+
+        yield row
+        labels = next_labels
+        blocked = next_blocked
+
+
+def steps(maze: MazeGrid, _config: Config) -> Iterator[Step]:
+    """
+    Fill the maze grid row by row with Eller's algorithm.
+
+    Args:
+        maze (MazeGrid): The maze grid, preset cells marked VISITED.
+        _config (Config): Configuration object.
+
+    Yields:
+        Step: The cells of every finished row.
+    """
+    w = _config.WIDTH
+    cells = maze.cells
+    # Row y + 1 is read before row y is written back, so the preset
+    # values are always those of the original grid.
+    for y, row in enumerate(rows(w, _config.HEIGHT,
+                                 lambda y: cells[y * w:(y + 1) * w])):
+        cells[y * w:(y + 1) * w] = row
+        yield range(y * w, (y + 1) * w)
+
+
+def generate(maze: MazeGrid, _config: Config,
+             xvar: XVar) -> MazeGrid:
+    """
+    Fill the maze grid row by row with Eller's algorithm.
+
+    Args:
+        maze (MazeGrid): The maze grid, preset cells marked VISITED.
+        _config (Config): Configuration object.
+        xvar (XVar): Graphics context.
+
+    Returns:
+        MazeGrid: The generated maze.
+    """
+    return run(steps(maze, _config), maze, _config, xvar)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Kruskal's algorithm for maze generation."""
+
+import random
+from array import array
+from ..utils.mlx_utils import XVar
+from ..utils.generate_utils import Bit_position
+from ..utils.maze_grid import MazeGrid
+from ..config import Config
+from .steps import Step, run
+from typing import Iterator
+
+
+class DisjointSet:
+    """
+    Array-backed union-find over flat cell indices.
+
+    Parents and ranks live in flat arrays; `find` uses path halving and
+    `union` merges by rank, so both run in near-constant amortized time.
+
+    Attributes:
+        parent (array): Parent index of every cell.
+        rank (bytearray): Upper bound of every tree height.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Create `size` singleton sets.
+
+        Args:
+            size (int): Number of elements.
+        """
+        self.parent = array("l", range(size))
+        self.rank = bytearray(size)
+
+    def find(self, i: int) -> int:
+        """Return the representative of the set containing `i`."""
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the sets containing `a` and `b`.
+
+        Returns:
+            bool: False if they were already in the same set.
+        """
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        rank = self.rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+        return True
+
+
+def steps(maze: MazeGrid, _config: Config) -> Iterator[Step]:
+    """
+    Join cells along shuffled edges (Kruskal), one kept edge per step.
+
+    Every interior edge between two free cells is encoded as
+    `index * 2 + (0 for east, 1 for south)`, shuffled once, then kept if
+    it joins two different sets. Cells marked VISITED beforehand (the
+    '42' symbol) are never joined.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        _config (Config): Configuration object.
+
+    Yields:
+        Step: The two cells of every kept edge.
+    """
+    w = _config.WIDTH
+    h = _config.HEIGHT
+    cells = maze.cells
+    visited = Bit_position.VISITED.value
+    north = Bit_position.NORTH.value
+    east = Bit_position.EAST.value
+    south = Bit_position.SOUTH.value
+    west = Bit_position.WEST.value
+
+    free = bytearray(w * h)
+    for i in range(w * h):
+        if not (cells[i] & visited):
+            free[i] = 1
+            cells[i] = visited
+
+    edges = array("l")
+    for i in range(w * h):
+        if not free[i]:
+            continue
+        if i % w != w - 1 and free[i + 1]:
+            edges.append(i * 2)
+        if i + w < w * h and free[i + w]:
+            edges.append(i * 2 + 1)
+    random.shuffle(edges)
+
+    sets = DisjointSet(w * h)
+    for edge in edges:
+        i = edge >> 1
+        if edge & 1:
+            j = i + w
+            if not sets.union(i, j):
+                continue
+            cells[i] |= south
+            cells[j] |= north
+        else:
+            j = i + 1
+            if not sets.union(i, j):
+                continue
+            cells[i] |= east
+            cells[j] |= west
+        yield (i, j)
+
+
+def generate(maze: MazeGrid, _config: Config,
+             xvar: XVar) -> MazeGrid:
+    """
+    Generate a maze by joining cells along shuffled edges (Kruskal).
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        _config (Config): Configuration object.
+        xvar (XVar): Graphics context.
+
+    Returns:
+        MazeGrid: The generated maze.
+    """
+    return run(steps(maze, _config), maze, _config, xvar)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Loop injection and dead-end removal for imperfect mazes."""
+
+import random
+from array import array
+from ..utils.generate_utils import Bit_position, OPEN_COUNT
+from ..utils.maze_grid import MazeGrid
+from ..config import Config
+
+
+def wall_index(maze: MazeGrid) -> "array[int]":
+    """
+    List every closed wall between two free cells in one pass.
+
+    Walls use the Kruskal edge encoding `index * 2 + (0 for east, 1 for
+    south)`, so each wall appears once. Symbol cells are skipped.
+
+    Args:
+        maze (MazeGrid): The generated maze.
+
+    Returns:
+        array: Encoded closed walls, in cell order.
+    """
+    w, h = maze.width, maze.height
+    cells = maze.cells
+    symbol = Bit_position.VISITED.value
+    east = Bit_position.EAST.value
+    south = Bit_position.SOUTH.value
+    last_row = (h - 1) * w
+    walls = array("l")
+    for i in range(w * h):
+        cell = cells[i]
+        if cell == symbol:
+            continue
+        if not cell & east and i % w != w - 1 and cells[i + 1] != symbol:
+            walls.append(i * 2)
+        if not cell & south and i < last_row and cells[i + w] != symbol:
+            walls.append(i * 2 + 1)
+    return walls
+
+
+def _open(cells: bytearray, w: int, wall: int) -> None:
+    """Open an encoded wall on both of its sides."""
+    i = wall >> 1
+    if wall & 1:
+        cells[i] |= Bit_position.SOUTH.value
+        cells[i + w] |= Bit_position.NORTH.value
+    else:
+        cells[i] |= Bit_position.EAST.value
+        cells[i + 1] |= Bit_position.WEST.value
+
+
+def add_loops(maze: MazeGrid, density: float) -> int:
+    """
+    Open a random share of the closed walls of the maze.
+
+    The walls are drawn without replacement from the wall index, so the
+    cost is one pass over the grid plus one step per opened wall.
+
+    Args:
+        maze (MazeGrid): The generated maze, updated in place.
+        density (float): Share of closed walls to open, from 0 to 1.
+
+    Returns:
+        int: Number of walls opened.
+    """
+    walls = wall_index(maze)
+    count = round(density * len(walls))
+    for wall in random.sample(walls, count):
+        _open(maze.cells, maze.width, wall)
+    if count:
+        maze.bump_version()
+    return count
+
+
+def braid(maze: MazeGrid, ratio: float) -> int:
+    """
+    Remove a random share of the dead ends of the maze.
+
+    Each chosen dead end opens one of its closed walls, preferring a
+    neighbour that is itself a dead end so a single wall fixes both.
+
+    Args:
+        maze (MazeGrid): The generated maze, updated in place.
+        ratio (float): Share of dead ends to remove, from 0 to 1.
+
+    Returns:
+        int: Number of walls opened.
+    """
+    w, h = maze.width, maze.height
+    cells = maze.cells
+    symbol = Bit_position.VISITED.value
+    steps = ((Bit_position.NORTH.value, -w, True),
+             (Bit_position.EAST.value, 1, False),
+             (Bit_position.SOUTH.value, w, True),
+             (Bit_position.WEST.value, -1, False))
+    dead_ends = [i for i in range(w * h)
+                 if cells[i] != symbol and OPEN_COUNT[cells[i]] == 1]
+    random.shuffle(dead_ends)
+    opened = 0
+    for i in dead_ends[:round(ratio * len(dead_ends))]:
+        if OPEN_COUNT[cells[i]] != 1:
+            continue
+        x = i % w
+        candidates = []
+        for bit, step, vertical in steps:
+            j = i + step
+            if cells[i] & bit:
+                continue
+            if vertical and not 0 <= j < w * h:
+                continue
+            if not vertical and not 0 <= x + step < w:
+                continue
+            if cells[j] != symbol:
+                candidates.append(j)
+        if not candidates:
+            continue
+        paired = [j for j in candidates if OPEN_COUNT[cells[j]] == 1]
+        j = random.choice(paired or candidates)
+        a, b = min(i, j), max(i, j)
+        _open(cells, w, a * 2 + (1 if b - a == w else 0))
+        opened += 1
+    if opened:
+        maze.bump_version()
+    return opened
+
+
+def inject(maze: MazeGrid, _config: Config) -> int:
+    """
+    Turn a perfect maze into an imperfect one as set by the config.
+
+    Dead ends are braided first (BRAID), then a share of the remaining
+    closed walls is opened (LOOP_DENSITY). Both bump the maze version
+    when they open a wall, so the cached solution is recomputed.
+
+    Args:
+        maze (MazeGrid): The generated maze, updated in place.
+        _config (Config): Configuration object (BRAID, LOOP_DENSITY).
+
+    Returns:
+        int: Number of walls opened.
+    """
+    opened = 0
+    if _config.BRAID > 0:
+        opened += braid(maze, _config.BRAID)
+    if _config.LOOP_DENSITY > 0:
+        opened += add_loops(maze, _config.LOOP_DENSITY)
+    return opened
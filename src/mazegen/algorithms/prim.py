@@ -2,33 +2,79 @@
 """Prim's algorithm for maze generation."""
 
 import random
-import time
-from ..utils.mlx_utils import XVar, update_cell
+from ..utils.mlx_utils import XVar
 from ..utils.generate_utils import Bit_position, remove_wall
+from ..utils.maze_grid import MazeGrid
 from ..config import Config
-from typing import List
+from .steps import Step, run
+from typing import Iterator, List
 
 
-def generate(maze: List[List[int]], _config: Config,
-             xvar: XVar) -> List[List[int]]:
+class Frontier:
     """
-    Initialize and execute Prim's algorithm.
+    Randomized set of frontier cells with O(1) insertion and removal.
+
+    Cells are stored once by flat index; a random entry is removed by
+    swapping it with the last one, so no list shift ever happens.
+
+    Attributes:
+        items (List[int]): Flat indices of the queued cells.
+        queued (bytearray): Per-cell membership flags.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Create an empty frontier for a grid of `size` cells.
+
+        Args:
+            size (int): Number of cells in the grid.
+        """
+        self.items: List[int] = []
+        self.queued = bytearray(size)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, cell: int) -> bool:
+        return bool(self.queued[cell])
+
+    def add(self, cell: int) -> None:
+        """Queue `cell` unless it is already queued."""
+        if not self.queued[cell]:
+            self.queued[cell] = 1
+            self.items.append(cell)
+
+    def pop_random(self) -> int:
+        """Remove and return a uniformly chosen queued cell."""
+        items = self.items
+        idx = random.randrange(len(items))
+        cell = items[idx]
+        last = items.pop()
+        if idx < len(items):
+            items[idx] = last
+        self.queued[cell] = 0
+        return cell
+
+
+def steps(maze: MazeGrid, _config: Config) -> Iterator[Step]:
+    """
+    Carve the maze with Prim's algorithm, one passage per step.
 
     Args:
-        maze (List[List[int]]): The maze grid.
+        maze (MazeGrid): The maze grid.
         _config (Config): Configuration object.
-        xvar (XVar): Graphics context.
 
-    Returns:
-        List[List[int]]: The generated maze.
+    Yields:
+        Step: The start cell, then each (tree cell, new cell) pair.
     """
     w = _config.WIDTH
     h = _config.HEIGHT
+    cells = maze.cells
+    visited = Bit_position.VISITED.value
 
-    for y in range(h):
-        for x in range(w):
-            if not (maze[y][x] & Bit_position.VISITED.value):
-                maze[y][x] = 0
+    for i in range(w * h):
+        if not (cells[i] & visited):
+            cells[i] = 0
 
     try:
         entry_x = int(_config.ENTRY[0])
@@ -39,43 +85,49 @@ def generate(maze: List[List[int]], _config: Config,
     start_x = max(0, min(entry_x, w - 1))
     start_y = max(0, min(entry_y, h - 1))
 
-    frontier = []
-
-    def add_frontier(fx: int, fy: int) -> None:
-        if not (maze[fy][fx] & Bit_position.VISITED.value):
-            maze[fy][fx] |= Bit_position.VISITED.value
-            if xvar and _config.ANIMATION == 1:
-                update_cell(xvar, fx, fy, maze[fy][fx], _config)
+    frontier = Frontier(w * h)
+    in_tree = bytearray(w * h)
+    directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
 
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+    def add_cell(fx: int, fy: int) -> None:
+        fi = fy * w + fx
+        in_tree[fi] = 1
+        cells[fi] |= visited
         for dx, dy in directions:
             nx, ny = fx + dx, fy + dy
             if 0 <= nx < w and 0 <= ny < h:
-                if not (maze[ny][nx] & Bit_position.VISITED.value):
-                    frontier.append((fx, fy, nx, ny))
+                if not (cells[ny * w + nx] & visited):
+                    frontier.add(ny * w + nx)
 
-    if not (maze[start_y][start_x] & Bit_position.VISITED.value):
-        add_frontier(start_x, start_y)
-    else:
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-        for dx, dy in directions:
-            nx, ny = start_x + dx, start_y + dy
-            if 0 <= nx < w and 0 <= ny < h:
-                if not (maze[ny][nx] & Bit_position.VISITED.value):
-                    frontier.append((start_x, start_y, nx, ny))
+    add_cell(start_x, start_y)
+    yield (start_y * w + start_x,)
 
     while frontier:
-        idx = random.randrange(len(frontier))
-        cx, cy, nx, ny = frontier.pop(idx)
+        ni = frontier.pop_random()
+        nx, ny = ni % w, ni // w
+        parents = []
+        for dx, dy in directions:
+            cx, cy = nx + dx, ny + dy
+            if 0 <= cx < w and 0 <= cy < h and in_tree[cy * w + cx]:
+                parents.append((cx, cy))
+        cx, cy = random.choice(parents)
+
+        remove_wall(maze, cx, cy, nx, ny)
+        add_cell(nx, ny)
+        yield (cy * w + cx, ni)
+
 
-        if not (maze[ny][nx] & Bit_position.VISITED.value):
-            remove_wall(maze, cx, cy, nx, ny)
-            if xvar and _config.ANIMATION == 1:
-                update_cell(xvar, cx, cy, maze[cy][cx], _config)
-                if hasattr(_config, 'DELAY') and _config.DELAY > 0:
-                    time.sleep(_config.DELAY)
-                    xvar.mlx.mlx_do_sync(xvar.mlx_ptr)
+def generate(maze: MazeGrid, _config: Config,
+             xvar: XVar) -> MazeGrid:
+    """
+    Initialize and execute Prim's algorithm.
 
-            add_frontier(nx, ny)
+    Args:
+        maze (MazeGrid): The maze grid.
+        _config (Config): Configuration object.
+        xvar (XVar): Graphics context.
 
-    return maze
+    Returns:
+        MazeGrid: The generated maze.
+    """
+    return run(steps(maze, _config), maze, _config, xvar)
@@ -2,39 +2,40 @@
 """Recursive backtracking algorithm for maze generation."""
 
 import random
-import time
-from ..utils.mlx_utils import XVar, update_cell
+from ..utils.mlx_utils import XVar
 from ..utils.generate_utils import remove_wall, Bit_position
+from ..utils.maze_grid import MazeGrid
 from ..config import Config
-from typing import List
+from .steps import Step, run
+from typing import Iterator, List
 
 
-def get_unvisited_neighbors(x: int, y: int, maze: List[List[int]],
+def get_unvisited_neighbors(x: int, y: int, maze: MazeGrid,
                             width: int, height: int) -> List[tuple[int, int]]:
     """Return a list of unvisited neighbors."""
     neighbors = []
+    cells = maze.cells
     directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
     for dx, dy in directions:
         nx, ny = x + dx, y + dy
         if 0 <= nx < width and 0 <= ny < height:
-            if not (maze[ny][nx] & Bit_position.VISITED.value):
+            if not (cells[ny * width + nx] & Bit_position.VISITED.value):
                 neighbors.append((nx, ny))
     return neighbors
 
 
-def stacking(x: int, y: int, maze: List[List[int]], width: int, height: int,
-             _config: Config, xvar: XVar) -> None:
+def stacking(x: int, y: int, maze: MazeGrid, width: int,
+             height: int) -> Iterator[Step]:
     """
-    Generate a maze using the iterative algorithm with stack.
+    Carve the maze from (x, y) with an explicit stack, one edge per step.
+
+    Yields:
+        Step: The start cell, then each (current cell, new cell) pair.
     """
+    cells = maze.cells
     stack = [(x, y)]
-    maze[y][x] |= Bit_position.VISITED.value
-
-    if xvar and _config.ANIMATION == 1:
-        update_cell(xvar, x, y, maze[y][x], _config)
-        if hasattr(_config, 'DELAY') and _config.DELAY > 0:
-            time.sleep(_config.DELAY)
-            xvar.mlx.mlx_do_sync(xvar.mlx_ptr)
+    cells[y * width + x] |= Bit_position.VISITED.value
+    yield (y * width + x,)
 
     while stack:
         cx, cy = stack[-1]
@@ -43,30 +44,24 @@ def stacking(x: int, y: int, maze: List[List[int]], width: int, height: int,
         if neighbors:
             nx, ny = random.choice(neighbors)
             remove_wall(maze, cx, cy, nx, ny)
-            maze[ny][nx] |= Bit_position.VISITED.value
-            if xvar and _config.ANIMATION == 1:
-                update_cell(xvar, cx, cy, maze[cy][cx], _config)
-                update_cell(xvar, nx, ny, maze[ny][nx], _config)
-                if hasattr(_config, 'DELAY') and _config.DELAY > 0:
-                    time.sleep(_config.DELAY)
-                    xvar.mlx.mlx_do_sync(xvar.mlx_ptr)
+            cells[ny * width + nx] |= Bit_position.VISITED.value
+            yield (cy * width + cx, ny * width + nx)
             stack.append((nx, ny))
         else:
             stack.pop()
 
 
-def generate(maze: List[List[int]], _config: Config,
-             xvar: XVar) -> List[List[int]]:
+def steps(maze: MazeGrid, _config: Config) -> Iterator[Step]:
     """
-    Initialize and execute the backtracking generation algorithm.
+    Initialize the grid and yield the backtracking steps from the entry.
     """
     w = _config.WIDTH
     h = _config.HEIGHT
+    cells = maze.cells
 
-    for y in range(h):
-        for x in range(w):
-            if not (maze[y][x] & Bit_position.VISITED.value):
-                maze[y][x] = 0
+    for i in range(w * h):
+        if not (cells[i] & Bit_position.VISITED.value):
+            cells[i] = 0
 
     try:
         entry_x = int(_config.ENTRY[0])
@@ -79,6 +74,12 @@ def generate(maze: List[List[int]], _config: Config,
     start_x = max(0, min(entry_x, w - 1))
     start_y = max(0, min(entry_y, h - 1))
 
-    stacking(start_x, start_y, maze, w, h, _config, xvar)
+    yield from stacking(start_x, start_y, maze, w, h)
+
 
-    return maze
+def generate(maze: MazeGrid, _config: Config,
+             xvar: XVar) -> MazeGrid:
+    """
+    Initialize and execute the backtracking generation algorithm.
+    """
+    return run(steps(maze, _config), maze, _config, xvar)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Step iterators shared by the generation algorithms."""
+
+from ..utils.mlx_utils import XVar, update_cell, wait_frame
+from ..utils.maze_grid import MazeGrid
+from ..config import Config
+from typing import Callable, Generator, Iterable, Iterator, Sequence, TypeVar
+
+# Flat indices of the cells changed by one step (usually a carved edge).
+Step = Sequence[int]
+StepSource = Callable[[MazeGrid, Config], Iterator[Step]]
+
+T = TypeVar("T")
+
+
+def animate(steps: Iterable[Step], maze: MazeGrid, _config: Config,
+            xvar: XVar) -> Iterator[Step]:
+    """
+    Pass steps through, drawing their cells when animation is enabled.
+
+    Args:
+        steps (Iterable[Step]): The step iterator of an algorithm.
+        maze (MazeGrid): The maze being generated.
+        _config (Config): Configuration object.
+        xvar (XVar): Graphics context.
+
+    Yields:
+        Step: Every step, after its cells were queued for drawing.
+    """
+    if not (xvar and _config.ANIMATION == 1):
+        yield from steps
+        return
+    w = _config.WIDTH
+    cells = maze.cells
+    for step in steps:
+        for i in step:
+            update_cell(xvar, i % w, i // w, cells[i], _config)
+        yield step
+
+
+def run(steps: Iterable[Step], maze: MazeGrid, _config: Config,
+        xvar: XVar) -> MazeGrid:
+    """
+    Run a step iterator to completion at full speed.
+
+    When animated, the run waits between frames of a cells-per-frame
+    budget, as the MLX loop would between two hook calls.
+
+    Args:
+        steps (Iterable[Step]): The step iterator of an algorithm.
+        maze (MazeGrid): The maze being generated.
+        _config (Config): Configuration object.
+        xvar (XVar): Graphics context.
+
+    Returns:
+        MazeGrid: The generated maze.
+    """
+    if xvar and _config.ANIMATION == 1:
+        for _ in animate(steps, maze, _config, xvar):
+            wait_frame(xvar)
+    else:
+        for _ in steps:
+            pass
+    return maze
+
+
+def finish(task: Generator[Step, None, T]) -> T:
+    """
+    Exhaust a generator and return its return value.
+
+    Args:
+        task (Generator): A step generator returning a result.
+
+    Returns:
+        The value returned by the generator.
+    """
+    while True:
+        try:
+            next(task)
+        except StopIteration as stop:
+            result: T = stop.value
+            return result
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Tiled multi-process maze generation."""
+
+import copy
+import random
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from ..utils.mlx_utils import XVar
+from ..utils.generate_utils import Bit_position, remove_wall
+from ..utils.maze_grid import MazeGrid
+from ..config import Config
+from .kruskal import DisjointSet
+from typing import Any, Callable, List, Optional
+
+Algorithm = Callable[[MazeGrid, Config, Any], MazeGrid]
+
+UNVISITED_TABLE = bytes(
+    0 if cell & Bit_position.VISITED.value else 1 for cell in range(256))
+
+
+class TileResult:
+    """
+    Generated tile returned by a worker.
+
+    Attributes:
+        cells (bytes): Row-major cell bitmasks of the tile.
+        components (int): Number of connected components in the tile.
+        top, bottom, left, right (List[int]): Component label of every
+            border cell, -1 for preset cells.
+    """
+
+    def __init__(self, cells: bytes, components: int, top: List[int],
+                 bottom: List[int], left: List[int],
+                 right: List[int]) -> None:
+        self.cells = cells
+        self.components = components
+        self.top = top
+        self.bottom = bottom
+        self.left = left
+        self.right = right
+
+
+def _label_components(tile: MazeGrid) -> tuple["array[int]", int]:
+    """
+    Label the connected components of a tile with a BFS.
+
+    Args:
+        tile (MazeGrid): The generated tile.
+
+    Returns:
+        tuple[array, int]: Per-cell labels (-1 for preset cells) and the
+        number of components.
+    """
+    w, h = tile.width, tile.height
+    cells = tile.cells
+    labels = array("i", [-1]) * (w * h)
+    steps = ((Bit_position.NORTH.value, -w), (Bit_position.EAST.value, 1),
+             (Bit_position.SOUTH.value, w), (Bit_position.WEST.value, -1))
+    count = 0
+    for start in range(w * h):
+        if labels[start] != -1 or cells[start] == Bit_position.VISITED.value:
+            continue
+        labels[start] = count
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            for bit, step in steps:
+                if cells[i] & bit and labels[i + step] == -1:
+                    labels[i + step] = count
+                    queue.append(i + step)
+        count += 1
+    return labels, count
+
+
+def _generate_tile(algo: Algorithm, tile_config: Config, preset: bytes,
+                   seed: str) -> TileResult:
+    """
+    Generate one tile in a worker process.
+
+    The algorithm is restarted from any free cell it could not reach
+    (e.g. cut off by the symbol), so every free cell ends up carved.
+
+    Args:
+        algo (Algorithm): Generation function of the base algorithm.
+        tile_config (Config): Configuration sized to the tile.
+        preset (bytes): Initial cell values of the tile.
+        seed (str): Seed derived for this tile.
+
+    Returns:
+        TileResult: The carved tile and its border component labels.
+    """
+    w, h = tile_config.WIDTH, tile_config.HEIGHT
+    tile = MazeGrid(w, h)
+    tile.cells[:] = preset
+    random.seed(seed)
+    start = tile.cells.translate(UNVISITED_TABLE).find(1)
+    while start != -1:
+        tile_config.ENTRY = [start % w, start // w]
+        algo(tile, tile_config, None)
+        start = tile.cells.translate(UNVISITED_TABLE).find(1)
+
+    labels, count = _label_components(tile)
+    return TileResult(
+        bytes(tile.cells),
+        count,
+        list(labels[0:w]),
+        list(labels[(h - 1) * w:h * w]),
+        list(labels[0:w * h:w]),
+        list(labels[w - 1:w * h:w])
+    )
+
+
+def _run_tile(job: tuple[Algorithm, Config, bytes, str]) -> TileResult:
+    """Unpack a tile job for `ProcessPoolExecutor.map`."""
+    return _generate_tile(*job)
+
+
+def generate(maze: MazeGrid, _config: Config, xvar: Optional[XVar],
+             algo: Algorithm) -> MazeGrid:
+    """
+    Generate the maze tile by tile in a process pool and stitch the tiles.
+
+    Each tile is generated by `algo` with a seed derived from the config
+    SEED and the tile position, so the result is reproducible whatever
+    the number of workers. Tiles are then joined by a random spanning
+    tree over their components, opening one border passage per tree
+    edge, which keeps a perfect maze perfect.
+
+    Args:
+        maze (MazeGrid): The maze grid, preset cells marked VISITED.
+        _config (Config): Configuration object (TILE_SIZE, WORKERS).
+        xvar (XVar | None): Graphics context (not animated).
+        algo (Algorithm): Generation function run on every tile.
+
+    Returns:
+        MazeGrid: The generated maze.
+    """
+    w, h = _config.WIDTH, _config.HEIGHT
+    size = _config.TILE_SIZE
+    cells = maze.cells
+    tiles = [(tx, ty, min(size, w - tx), min(size, h - ty))
+             for ty in range(0, h, size) for tx in range(0, w, size)]
+    jobs = []
+    for tx, ty, tw, th in tiles:
+        tile_config = copy.copy(_config)
+        tile_config.WIDTH, tile_config.HEIGHT = tw, th
+        tile_config.ANIMATION = 0
+        tile_config.DELAY = 0
+        tile_config.TILE_SIZE = 0
+        preset = b"".join(cells[(ty + y) * w + tx:(ty + y) * w + tx + tw]
+                          for y in range(th))
+        jobs.append((algo, tile_config, preset,
+                     f"{_config.SEED}:{tx}:{ty}"))
+
+    with ProcessPoolExecutor(_config.WORKERS or None) as executor:
+        results = list(executor.map(_run_tile, jobs))
+
+    offsets = []
+    nodes = 0
+    for (tx, ty, tw, th), result in zip(tiles, results):
+        for y in range(th):
+            cells[(ty + y) * w + tx:(ty + y) * w + tx + tw] = \
+                result.cells[y * tw:(y + 1) * tw]
+        offsets.append(nodes)
+        nodes += result.components
+
+    per_row = (w + size - 1) // size
+    edges = []
+    for t, (tx, ty, tw, th) in enumerate(tiles):
+        result = results[t]
+        if tx + tw < w:
+            right = results[t + 1]
+            for y in range(th):
+                a, b = result.right[y], right.left[y]
+                if a != -1 and b != -1:
+                    edges.append((offsets[t] + a, offsets[t + 1] + b,
+                                  tx + tw - 1, ty + y, True))
+        if ty + th < h:
+            below = results[t + per_row]
+            for x in range(tw):
+                a, b = result.bottom[x], below.top[x]
+                if a != -1 and b != -1:
+                    edges.append((offsets[t] + a, offsets[t + per_row] + b,
+                                  tx + x, ty + th - 1, False))
+
+    random.Random(f"{_config.SEED}:stitch").shuffle(edges)
+    components = DisjointSet(nodes)
+    joined = 0
+    for a, b, x, y, horizontal in edges:
+        if not components.union(a, b):
+            continue
+        if horizontal:
+            remove_wall(maze, x, y, x + 1, y)
+        else:
+            remove_wall(maze, x, y, x, y + 1)
+        joined += 1
+        if joined == nodes - 1:
+            break
+    return maze
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""NumPy-backed binary tree and sidewinder maze generation."""
+
+import random
+from ..utils.mlx_utils import XVar
+from ..utils.generate_utils import Bit_position
+from ..utils.maze_grid import MazeGrid
+from ..config import Config
+from .. import exception
+from .steps import Step, run
+from typing import Any, Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+def _require_numpy() -> None:
+    """Raise a MazeException if NumPy is not installed."""
+    if np is None:
+        raise exception.MazeException("NumPy is required for the \
+vectorized generators (pip install numpy)")
+
+
+def _prepare(maze: MazeGrid) -> tuple[Any, Any, Any]:
+    """
+    Return the writable cell view, the preset mask and a seeded RNG.
+
+    Args:
+        maze (MazeGrid): The maze grid, preset cells marked VISITED.
+
+    Returns:
+        tuple: (cells 2D uint8 view, blocked 2D bool mask, numpy Generator).
+    """
+    cells = np.frombuffer(maze.cells, dtype=np.uint8).reshape(
+        maze.height, maze.width)
+    blocked = (cells & Bit_position.VISITED.value) != 0
+    # Seeded from `random` so the config SEED drives the result.
+    rng = np.random.default_rng(random.getrandbits(64))
+    return cells, blocked, rng
+
+
+def _moves(blocked: Any) -> tuple[Any, Any]:
+    """
+    Compute where carving north and east is allowed.
+
+    Args:
+        blocked (ndarray): Preset cells mask.
+
+    Returns:
+        tuple: (can_north, can_east) boolean masks.
+    """
+    free = ~blocked
+    can_north = free.copy()
+    can_north[0, :] = False
+    can_north[1:, :] &= free[:-1, :]
+    can_east = free.copy()
+    can_east[:, -1] = False
+    can_east[:, :-1] &= free[:, 1:]
+    return can_north, can_east
+
+
+def _carve(cells: Any, blocked: Any, north: Any, east: Any) -> None:
+    """
+    Write the carved north/east passages into the cell bitmasks.
+
+    Args:
+        cells (ndarray): 2D uint8 cell view, updated in place.
+        blocked (ndarray): Preset cells mask, left untouched.
+        north (ndarray): Cells opened towards their north neighbour.
+        east (ndarray): Cells opened towards their east neighbour.
+    """
+    bits = north.astype(np.uint8) * Bit_position.NORTH.value
+    bits |= east.astype(np.uint8) * Bit_position.EAST.value
+    bits[:-1, :] |= north[1:, :].astype(np.uint8) * Bit_position.SOUTH.value
+    bits[:, 1:] |= east[:, :-1].astype(np.uint8) * Bit_position.WEST.value
+    bits |= Bit_position.VISITED.value
+    np.copyto(cells, bits, where=~blocked)
+
+
+def _connect(cells: Any, blocked: Any, parent: Any) -> None:
+    """
+    Join every tree of a carved forest into a single spanning tree.
+
+    Preset cells may leave some cells without a legal move, which turns
+    them into extra roots. Each extra tree is joined to a neighbouring
+    tree through one new passage, so the maze stays perfect.
+
+    Args:
+        cells (ndarray): 2D uint8 cell view, updated in place.
+        blocked (ndarray): Preset cells mask.
+        parent (ndarray): Flat index of each cell's parent (self if root).
+    """
+    h, w = cells.shape
+    root = parent
+    while True:
+        nxt = root[root]
+        if np.array_equal(nxt, root):
+            break
+        root = nxt
+    comp = root.reshape(h, w)
+    free = ~blocked
+    roots = np.unique(comp[free])
+    if len(roots) <= 1:
+        return
+    sizes = np.bincount(comp[free], minlength=h * w)
+    main = int(np.argmax(sizes))
+    flat = cells.reshape(-1)
+    for label in roots:
+        if label == main:
+            continue
+        inside = comp == label
+        east = inside[:, :-1] ^ inside[:, 1:]
+        east &= free[:, :-1] & free[:, 1:]
+        south = inside[:-1, :] ^ inside[1:, :]
+        south &= free[:-1, :] & free[1:, :]
+        ys, xs = np.nonzero(east)
+        if len(ys):
+            i = int(ys[0]) * w + int(xs[0])
+            flat[i] |= Bit_position.EAST.value
+            flat[i + 1] |= Bit_position.WEST.value
+            other = comp[ys[0], xs[0] + (1 if inside[ys[0], xs[0]] else 0)]
+        else:
+            ys, xs = np.nonzero(south)
+            if not len(ys):
+                continue
+            i = int(ys[0]) * w + int(xs[0])
+            flat[i] |= Bit_position.SOUTH.value
+            flat[i + w] |= Bit_position.NORTH.value
+            other = comp[ys[0] + (1 if inside[ys[0], xs[0]] else 0), xs[0]]
+        comp[inside] = other
+
+
+def _rows(maze: MazeGrid) -> Iterator[Step]:
+    """Yield the cells of every row, once the whole grid is carved."""
+    for y in range(maze.height):
+        yield range(y * maze.width, (y + 1) * maze.width)
+
+
+def binary_tree_steps(maze: MazeGrid, _config: Config) -> Iterator[Step]:
+    """
+    Generate a maze with the binary tree algorithm in a few array passes.
+
+    Every cell opens either its north or its east wall, drawn for the
+    whole grid at once.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        _config (Config): Configuration object.
+
+    Yields:
+        Step: The cells of every row, once the grid is carved.
+    """
+    _require_numpy()
+    cells, blocked, rng = _prepare(maze)
+    h, w = cells.shape
+    can_north, can_east = _moves(blocked)
+    coin = rng.random((h, w)) < 0.5
+    north = can_north & (coin | ~can_east)
+    east = can_east & ~north
+    _carve(cells, blocked, north, east)
+
+    # Without preset cells the forest already has a single root.
+    if blocked.any():
+        idx = np.arange(h * w).reshape(h, w)
+        parent = np.where(north, idx - w, np.where(east, idx + 1, idx))
+        _connect(cells, blocked, parent.reshape(-1))
+    yield from _rows(maze)
+
+
+def binary_tree(maze: MazeGrid, _config: Config,
+                xvar: XVar) -> MazeGrid:
+    """
+    Generate a maze with the binary tree algorithm (see `binary_tree_steps`).
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        _config (Config): Configuration object.
+        xvar (XVar): Graphics context.
+
+    Returns:
+        MazeGrid: The generated maze.
+    """
+    return run(binary_tree_steps(maze, _config), maze, _config, xvar)
+
+
+def sidewinder_steps(maze: MazeGrid, _config: Config) -> Iterator[Step]:
+    """
+    Generate a maze with the sidewinder algorithm in a few array passes.
+
+    Rows are cut into runs of east passages from one batch of random
+    draws; each run then opens north from one random member, picked for
+    all runs at once with a segmented maximum.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        _config (Config): Configuration object.
+
+    Yields:
+        Step: The cells of every row, once the grid is carved.
+    """
+    _require_numpy()
+    cells, blocked, rng = _prepare(maze)
+    h, w = cells.shape
+    can_north, can_east = _moves(blocked)
+
+    east = can_east & (rng.random((h, w)) < 0.5)
+    east[0, :] = can_east[0, :]
+    free = ~blocked
+    flat_free = free.reshape(-1)
+    flat_east = east.reshape(-1)
+
+    # A run starts on a free cell whose west cell does not open east.
+    starts = flat_free.copy()
+    starts[1:] &= ~flat_east[:-1]
+    run_start = np.flatnonzero(starts)
+    run_id = np.cumsum(starts) - 1
+
+    key = np.where(can_north.reshape(-1), rng.random(h * w), -1.0)
+    best = np.maximum.reduceat(key, run_start)
+    north_flat = (key >= 0) & (key == best[run_id]) & flat_free
+    north = north_flat.reshape(h, w)
+    _carve(cells, blocked, north, east)
+
+    if blocked.any():
+        idx = np.arange(h * w)
+        carver_cells = np.flatnonzero(north_flat)
+        carver_of_run = run_start.copy()
+        carver_of_run[run_id[carver_cells]] = carver_cells
+        carver = carver_of_run[run_id]
+        parent = np.where(idx < carver, idx + 1,
+                          np.where(idx > carver, idx - 1, idx))
+        parent = np.where(north_flat, idx - w, parent)
+        parent = np.where(flat_free, parent, idx)
+        _connect(cells, blocked, parent)
+    yield from _rows(maze)
+
+
+def sidewinder(maze: MazeGrid, _config: Config,
+               xvar: XVar) -> MazeGrid:
+    """
+    Generate a maze with the sidewinder algorithm (see `sidewinder_steps`).
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        _config (Config): Configuration object.
+        xvar (XVar): Graphics context.
+
+    Returns:
+        MazeGrid: The generated maze.
+    """
+    return run(sidewinder_steps(maze, _config), maze, _config, xvar)
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""Structural metrics and endpoint placement for generated mazes."""
+
+from array import array
+from collections import deque
+from typing import Any, Iterable
+from .utils.generate_utils import Bit_position, OPEN_COUNT
+from .utils.maze_grid import MazeGrid
+from . import exception
+from .resolve import Solution, ROOT, UNREACHED, move_steps, \
+    build_solution, trace_codes
+
+
+class MazeReport:
+    """
+    Metrics used to grade a maze.
+
+    Attributes:
+        cells (int): Free cells (symbol cells excluded).
+        passages (int): Open walls between two cells.
+        components (int): Connected groups of free cells.
+        loops (int): Independent cycles, passages - cells + components.
+        dead_ends (int): Cells with a single opening.
+        junctions (int): Cells with three or four openings.
+        corridors (dict[int, int]): Corridor length (moves between two
+            cells that are not plain corridor cells) to count.
+        solution_length (int | None): Moves from entry to exit, None if
+            not requested or unreachable.
+        diameter (int): Longest shortest path found by a double BFS from
+            the entry component (exact on perfect mazes).
+        diameter_ends (tuple[tuple[int, int], tuple[int, int]]): The two
+            cells at the ends of the diameter.
+    """
+
+    def __init__(self, cells: int, passages: int, components: int,
+                 dead_ends: int, junctions: int, corridors: dict[int, int],
+                 solution_length: int | None, diameter: int,
+                 diameter_ends: tuple[tuple[int, int], tuple[int, int]]
+                 ) -> None:
+        """Store the computed metrics."""
+        self.cells = cells
+        self.passages = passages
+        self.components = components
+        self.loops = passages - cells + components
+        self.dead_ends = dead_ends
+        self.junctions = junctions
+        self.corridors = corridors
+        self.solution_length = solution_length
+        self.diameter = diameter
+        self.diameter_ends = diameter_ends
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a JSON serialisable dict."""
+        return {
+            "cells": self.cells,
+            "passages": self.passages,
+            "components": self.components,
+            "loops": self.loops,
+            "dead_ends": self.dead_ends,
+            "junctions": self.junctions,
+            "corridors": {str(k): v for k, v in self.corridors.items()},
+            "solution_length": self.solution_length,
+            "diameter": self.diameter,
+            "diameter_ends": [list(self.diameter_ends[0]),
+                              list(self.diameter_ends[1])],
+        }
+
+
+OPEN_BITS = bytes(cell & 15 for cell in range(256))
+
+
+def _clear(bit: int) -> bytes:
+    """Return a translate table clearing `bit` from a cell."""
+    return bytes(cell & ~bit for cell in range(256))
+
+
+def open_moves(maze: MazeGrid) -> bytes:
+    """
+    Return the open walls of every cell, border walls always closed.
+
+    The four low bits are kept and the border is cleared with translate
+    on row and column slices, so the table is built at C speed and
+    searches index it without bounds checks.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+
+    Returns:
+        bytes: One wall mask per cell.
+    """
+    w, h = maze.width, maze.height
+    masks = bytearray(maze.cells.translate(OPEN_BITS))
+    masks[:w] = masks[:w].translate(_clear(Bit_position.NORTH.value))
+    last = (h - 1) * w
+    masks[last:] = masks[last:].translate(_clear(Bit_position.SOUTH.value))
+    masks[::w] = masks[::w].translate(_clear(Bit_position.WEST.value))
+    masks[w - 1::w] = masks[w - 1::w].translate(
+        _clear(Bit_position.EAST.value))
+    return bytes(masks)
+
+
+def move_table(width: int) -> list[tuple[tuple[int, int], ...]]:
+    """Return the (move code, index offset) moves of every wall mask."""
+    steps = move_steps(width)
+    return [tuple((code, step) for code, (bit, step) in enumerate(steps)
+                  if mask & bit) for mask in range(16)]
+
+
+def bfs_distances(maze: MazeGrid, start: int,
+                  dist: "array[int] | None" = None,
+                  masks: bytes | None = None) -> tuple["array[int]", int]:
+    """
+    Breadth-first distances from flat cell `start`.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        start (int): Flat index of the source cell.
+        dist (array | None): Distance array to fill, where -1 marks
+            unvisited cells; a new one is made if None. Cells already
+            visited are not entered again, so successive calls label
+            successive components in one array.
+        masks (bytes | None): `open_moves` of the maze, to share it
+            between calls.
+
+    Returns:
+        tuple[array, int]: The distance array and the last cell reached,
+        which is one of the farthest from `start`.
+    """
+    if masks is None:
+        masks = open_moves(maze)
+    table = [tuple(step for _, step in moves)
+             for moves in move_table(maze.width)]
+    if dist is None:
+        dist = array("l", [-1]) * len(masks)
+    dist[start] = 0
+    last = start
+    queue = deque([start])
+    while queue:
+        last = queue.popleft()
+        d = dist[last] + 1
+        for step in table[masks[last]]:
+            j = last + step
+            if dist[j] == -1:
+                dist[j] = d
+                queue.append(j)
+    return dist, last
+
+
+def _sweep(masks: bytes, width: int, start: int,
+           border: bool) -> tuple[bytearray, int]:
+    """
+    BFS from `start` recording move codes, as `resolve.bfs_moves` does.
+
+    Cells leave the queue in distance order, so the last one popped (or
+    the last border one with `border`) is the farthest.
+
+    Returns:
+        tuple[bytearray, int]: The move codes and the farthest cell.
+    """
+    table = move_table(width)
+    size = len(masks)
+    last_row = size - width
+    moves = bytearray([UNREACHED]) * size
+    moves[start] = ROOT
+    far = start
+    queue = deque([start])
+    while queue:
+        i = queue.popleft()
+        if not border or i < width or i >= last_row \
+                or i % width in (0, width - 1):
+            far = i
+        for code, step in table[masks[i]]:
+            j = i + step
+            if moves[j] == UNREACHED:
+                moves[j] = code
+                queue.append(j)
+    return moves, far
+
+
+def place_endpoints(maze: MazeGrid, border: bool = False) -> Solution:
+    """
+    Find an entry and exit at the ends of the longest shortest path.
+
+    A first BFS from any free cell finds one end, a second BFS from that
+    end finds the other and keeps its move codes, so the path between
+    them is traced from the same arrays and cached on the maze for the
+    BFS solver. The result is exact on perfect mazes and the usual
+    double-sweep estimate when loops exist.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        border (bool): Only consider cells on the outer border.
+
+    Returns:
+        Solution: The BFS solution between the two ends, its `start` and
+        `end` being the chosen entry and exit.
+
+    Raises:
+        exception.MazeException: If the maze has no free cell.
+    """
+    w, h = maze.width, maze.height
+    cells = maze.cells
+    symbol = Bit_position.VISITED.value
+    candidates: Iterable[int] = range(len(cells))
+    if border:
+        candidates = [*range(w), *range((h - 1) * w, h * w),
+                      *range(0, h * w, w), *range(w - 1, h * w, w)]
+    seed = next((i for i in candidates if cells[i] != symbol), -1)
+    if seed == -1:
+        raise exception.MazeException("The maze has no free cell to \
+place the entry and exit on")
+    masks = open_moves(maze)
+    _, a = _sweep(masks, w, seed, border)
+    moves, b = _sweep(masks, w, a, border)
+    solution = build_solution(maze, "bfs", (a % w, a // w),
+                              (b % w, b // w), trace_codes(moves, w, b),
+                              moves)
+    maze.solution = solution
+    return solution
+
+
+def _corridors(maze: MazeGrid, masks: bytes) -> dict[int, int]:
+    """
+    Histogram the corridor lengths of the maze.
+
+    A corridor runs between two nodes (cells that do not have exactly
+    two openings) through plain corridor cells; its length is the number
+    of moves. Each corridor is walked once, from the end it is first
+    met at; rings with no node at all are collected afterwards.
+    """
+    table = move_table(maze.width)
+    seen = bytearray(len(masks))
+    histogram: dict[int, int] = {}
+
+    def walk(i: int, code: int, step: int) -> int:
+        """Follow corridor cells from `i` by one move, return the moves."""
+        length = 0
+        while True:
+            i += step
+            length += 1
+            moves = table[masks[i]]
+            if len(moves) != 2 or seen[i]:
+                return length
+            seen[i] = 1
+            code, step = moves[0] if moves[1][0] == code ^ 2 else moves[1]
+
+    for i, mask in enumerate(masks):
+        moves = table[mask]
+        if len(moves) in (0, 2):
+            continue
+        for code, step in moves:
+            j = i + step
+            if len(table[masks[j]]) == 2:
+                if seen[j]:
+                    continue
+            elif j < i:
+                continue
+            length = walk(i, code, step)
+            histogram[length] = histogram.get(length, 0) + 1
+    for i, mask in enumerate(masks):
+        if len(table[mask]) == 2 and not seen[i]:
+            seen[i] = 1
+            length = walk(i, *table[mask][0])
+            histogram[length] = histogram.get(length, 0) + 1
+    return dict(sorted(histogram.items()))
+
+
+def analyze(maze: MazeGrid, entry: tuple[int, int] | None = None,
+            end: tuple[int, int] | None = None) -> MazeReport:
+    """
+    Compute the grading metrics of a maze.
+
+    The border-masked walls are counted per mask value, one BFS sweep over
+    every component (started from the entry) gives the components and
+    the solution length, and a second BFS from the farthest cell gives
+    the diameter; the corridor walk visits each corridor cell once.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        entry (tuple[int, int] | None): Entry cell, defaults to the first
+            free cell.
+        end (tuple[int, int] | None): Exit cell, needed for the
+            solution length.
+
+    Returns:
+        MazeReport: The metrics.
+    """
+    w = maze.width
+    cells = maze.cells
+    symbol = Bit_position.VISITED.value
+    masks = open_moves(maze)
+    degrees = [0] * 5
+    for mask in range(16):
+        degrees[OPEN_COUNT[mask]] += masks.count(mask)
+    free = len(cells) - cells.count(symbol)
+    degrees[0] -= len(cells) - free
+    passages = sum(d * n for d, n in enumerate(degrees)) // 2
+
+    if entry is not None:
+        start = entry[1] * w + entry[0]
+    elif free:
+        start = next(i for i, c in enumerate(cells) if c != symbol)
+    else:
+        start = 0
+    dist, far = bfs_distances(maze, start, masks=masks)
+    solution_length = None
+    if end is not None and dist[end[1] * w + end[0]] != -1:
+        solution_length = dist[end[1] * w + end[0]]
+    components = 1 if free else 0
+    for i, d in enumerate(dist):
+        if d == -1 and cells[i] != symbol:
+            components += 1
+            bfs_distances(maze, i, dist, masks)
+
+    sweep, other = bfs_distances(maze, far, masks=masks)
+    return MazeReport(
+        cells=free,
+        passages=passages,
+        components=components,
+        dead_ends=degrees[1],
+        junctions=degrees[3] + degrees[4],
+        corridors=_corridors(maze, masks),
+        solution_length=solution_length,
+        diameter=sweep[other],
+        diameter_ends=((far % w, far // w), (other % w, other // w)),
+    )
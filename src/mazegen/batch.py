@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Batch maze generation over seeds and sizes with a process pool."""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, Optional, TextIO
+from . import exception
+from .MazeGenerator import MazeGenerator
+
+Job = tuple[str, str, tuple[int, int], Optional[str], bool]
+JobResult = tuple[str, tuple[int, int], str, Optional[str]]
+
+
+def parse_seeds(spec: str) -> list[str]:
+    """
+    Parse a seed list such as "1-100" or "4,8,15".
+
+    Args:
+        spec (str): Comma separated seeds or inclusive integer ranges.
+
+    Returns:
+        list[str]: The seeds, in order.
+
+    Raises:
+        exception.ArgsException: If a range is malformed.
+    """
+    seeds: list[str] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, sep, last = part.partition("-")
+        if sep and first.isdigit() and last.isdigit():
+            if int(first) > int(last):
+                raise exception.ArgsException(f"Invalid seed range: {part}")
+            seeds.extend(str(s) for s in range(int(first), int(last) + 1))
+        else:
+            seeds.append(part)
+    return seeds
+
+
+def parse_sizes(spec: str) -> list[tuple[int, int]]:
+    """
+    Parse a size list such as "21x21,51x31".
+
+    Args:
+        spec (str): Comma separated WIDTHxHEIGHT sizes.
+
+    Returns:
+        list[tuple[int, int]]: The sizes, in order.
+
+    Raises:
+        exception.ArgsException: If a size is malformed.
+    """
+    sizes = []
+    for part in spec.split(","):
+        try:
+            w, h = part.lower().split("x")
+            sizes.append((int(w), int(h)))
+        except ValueError:
+            raise exception.ArgsException(f"Invalid size: '{part}'")
+    return sizes
+
+
+def _silence_worker() -> None:
+    """Discard the per-maze prints of worker processes."""
+    sys.stdout = open(os.devnull, "w")
+
+
+def _run_job(job: Job) -> JobResult:
+    """
+    Generate and solve one maze in a worker process.
+
+    The seed is used as is, "0" included, so every job is reproducible.
+    Any failure is reported in the result instead of stopping the batch.
+
+    Args:
+        job (Job): (config path, seed, size, output directory or None,
+            report instead of the maze).
+
+    Returns:
+        JobResult: (seed, generated size, output text or file path, error
+        or None).
+    """
+    config_path, seed, size, output_dir, report = job
+    try:
+        generator = MazeGenerator(config_path, seed=seed, size=size,
+                                  headless=True)
+        maze = generator.generate_maze()
+        if report:
+            text = json.dumps(generator.analyze(maze).as_dict())
+        else:
+            solution = generator.get_solution(maze)
+            text = generator.format_output(maze, solution)
+    except (exception.MazeException, exception.ConfigException) as e:
+        return seed, size, "", str(e.args[0])
+    except Exception as e:
+        return seed, size, "", f"{type(e).__name__}: {e}"
+    size = (maze.width, maze.height)
+    if output_dir is None:
+        return seed, size, text, None
+    extension = "json" if report else "txt"
+    path = os.path.join(output_dir,
+                        f"maze_{seed}_{size[0]}x{size[1]}.{extension}")
+    try:
+        with open(path, "w") as f:
+            f.write(text)
+    except OSError as e:
+        return seed, size, "", str(e)
+    return seed, size, path, None
+
+
+def run_batch(config_path: str, seeds: list[str],
+              sizes: list[tuple[int, int]], workers: int = 0,
+              output_dir: Optional[str] = None,
+              stream: Optional[TextIO] = None,
+              report: bool = False) -> Iterator[JobResult]:
+    """
+    Generate every (size, seed) maze across a process pool.
+
+    Results are yielded as jobs finish, so a slow maze does not hold back
+    the ones after it.
+    With `output_dir`, workers write one file per maze; otherwise the
+    text of each maze is returned and, if `stream` is given, appended to
+    it behind a "# seed=... size=WxH" header line. With `report`, the
+    text is the JSON analytics report of the maze instead.
+
+    Args:
+        config_path (str): Path to the configuration file.
+        seeds (list[str]): Seeds to generate.
+        sizes (list[tuple[int, int]]): Sizes to sweep, (-1, -1) keeps the
+            config size.
+        workers (int): Number of worker processes, 0 for all CPUs.
+        output_dir (str | None): Directory for per-seed output files.
+        stream (TextIO | None): Concatenated output stream.
+        report (bool): Produce analytics reports instead of mazes.
+
+    Yields:
+        JobResult: (seed, size, output text or file path, error or None).
+    """
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+    jobs: list[Job] = [(config_path, seed, size, output_dir, report)
+                       for size in sizes for seed in seeds]
+    with ProcessPoolExecutor(workers or None,
+                             initializer=_silence_worker) as executor:
+        for future in as_completed([executor.submit(_run_job, job)
+                                    for job in jobs]):
+            result = future.result()
+            seed, size, text, error = result
+            if stream is not None and error is None and output_dir is None:
+                stream.write(f"# seed={seed} size={size[0]}x{size[1]}\n")
+                stream.write(text)
+                stream.write("\n")
+            yield result
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Command line entry point for batch generation.
+
+    Args:
+        argv (list[str] | None): Arguments, defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status, 1 if any maze failed.
+    """
+    parser = argparse.ArgumentParser(
+        prog="mazegen-batch",
+        description="Generate many mazes from one config file.")
+    parser.add_argument("config", help="path to the configuration file")
+    parser.add_argument("--seeds", required=True,
+                        help="seeds, e.g. '1-1000' or '4,8,15'")
+    parser.add_argument("--sizes", default=None,
+                        help="size sweep, e.g. '21x21,51x51'")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="worker processes (default: all CPUs)")
+    parser.add_argument("--report", action="store_true",
+                        help="output a JSON analytics report per maze")
+    out = parser.add_mutually_exclusive_group()
+    out.add_argument("--output-dir", default=None,
+                     help="write one output file per maze in this directory")
+    out.add_argument("--stream", default="-",
+                     help="concatenated output file ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        seeds = parse_seeds(args.seeds)
+        sizes = parse_sizes(args.sizes) if args.sizes else [(-1, -1)]
+    except exception.ArgsException as e:
+        exception.display_errors(e.args[0])
+        return 2
+    stream: Optional[TextIO] = None
+    if args.output_dir is None:
+        stream = sys.stdout if args.stream == "-" else open(args.stream, "w")
+
+    done = 0
+    failed = 0
+    start = time.perf_counter()
+    try:
+        for seed, size, _, error in run_batch(args.config, seeds, sizes,
+                                              args.workers, args.output_dir,
+                                              stream, args.report):
+            if error is not None:
+                failed += 1
+                exception.display_errors(f"seed {seed} size {size}: {error}")
+            else:
+                done += 1
+    finally:
+        if stream is not None and stream is not sys.stdout:
+            stream.close()
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    sys.stderr.write(f"Generated {done} mazes ({failed} failed) in "
+                     f"{elapsed:.2f}s: {done / elapsed:.1f} mazes/s\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
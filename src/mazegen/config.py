@@ -11,6 +11,10 @@ COLOR_ENDING = "\033[31m"
 COLOR_FT = "\033[0;36m"
 COLOR_RESET = "\033[0m"
 
+ALGORITHMS = ("auto", "eller", "kruskal", "binary_tree", "sidewinder")
+SOLVERS = ("bfs", "bidirectional", "astar", "bitboard")
+PLACEMENTS = ("fixed", "diameter", "border")
+
 
 class Config:
     """
@@ -23,7 +27,22 @@ class Config:
         EXIT (list[int]): Exit coordinates [x, y].
         OUTPUT_FILE (str): Path to output file.
         PERFECT (int): Algorithm choice (False=Eller/Prim, True=stacking).
+        ALGORITHM (str): Generator name, "auto" lets PERFECT choose.
+        SOLVER (str): Solving algorithm, one of SOLVERS.
+        PLACEMENT (str): "fixed" keeps ENTRY and EXIT, "diameter" moves
+            them to the ends of the longest shortest path and "border"
+            does the same among border cells.
+        TILE_SIZE (int): Tile side for multi-process generation, 0 is off.
+        WORKERS (int): Worker processes for tiled generation, 0 is all CPUs.
+        LOOP_DENSITY (float): Share of closed walls opened in imperfect
+            mazes, from 0 to 1.
+        BRAID (float): Share of dead ends removed in imperfect mazes,
+            from 0 to 1.
         ANIMATION (int): Animation check.
+        ANIMATION_FPS (float): Frames per second pushed while animating.
+        CELLS_PER_FRAME (int): Cell updates shown per animation frame,
+            0 runs generation at full speed and shows a frame every
+            1 / ANIMATION_FPS seconds.
         COLORS (list[dict]): List of color palettes.
     """
 
@@ -57,7 +76,16 @@ class Config:
         self.EXIT = [0, 0]
         self.OUTPUT_FILE = ""
         self.PERFECT = False
+        self.ALGORITHM = "auto"
+        self.SOLVER = "bfs"
+        self.PLACEMENT = "fixed"
+        self.TILE_SIZE = 0
+        self.WORKERS = 0
+        self.LOOP_DENSITY = 0.0
+        self.BRAID = 0.0
         self.ANIMATION = 1
+        self.ANIMATION_FPS = 60.0
+        self.CELLS_PER_FRAME = 0
         self.DELAY = 0.001
         self.SEED = "0"
         self.COLORS = [
@@ -143,6 +171,37 @@ class Config:
                             else:
                                 raise ValueError(f"Unknown bool value:\
  '{right_arg}'")
+                        elif left_arg == "ALGORITHM":
+                            if right_arg not in ALGORITHMS:
+                                raise ValueError(f"Unknown algorithm:\
+ '{right_arg}'")
+                            self.ALGORITHM = right_arg
+                        elif left_arg == "SOLVER":
+                            if right_arg not in SOLVERS:
+                                raise ValueError(f"Unknown solver:\
+ '{right_arg}'")
+                            self.SOLVER = right_arg
+                        elif left_arg == "PLACEMENT":
+                            if right_arg not in PLACEMENTS:
+                                raise ValueError(f"Unknown placement:\
+ '{right_arg}'")
+                            self.PLACEMENT = right_arg
+                        elif left_arg in ("TILE_SIZE", "WORKERS",
+                                          "CELLS_PER_FRAME"):
+                            if int(right_arg) < 0:
+                                raise ValueError(f"{left_arg} must be \
+positive: '{right_arg}'")
+                            setattr(self, left_arg, int(right_arg))
+                        elif left_arg in ("LOOP_DENSITY", "BRAID"):
+                            if not 0 <= float(right_arg) <= 1:
+                                raise ValueError(f"{left_arg} must be \
+between 0 and 1: '{right_arg}'")
+                            setattr(self, left_arg, float(right_arg))
+                        elif left_arg == "ANIMATION_FPS":
+                            if float(right_arg) <= 0:
+                                raise ValueError(f"{left_arg} must be \
+strictly positive: '{right_arg}'")
+                            self.ANIMATION_FPS = float(right_arg)
                         elif left_arg == "ANIMATION":
                             self.ANIMATION = int(right_arg)
                         elif left_arg == "SEED":
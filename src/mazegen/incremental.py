@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""Incremental shortest-path repair after wall edits."""
+
+import heapq
+from array import array
+from collections import deque
+from typing import Iterable
+from .utils.maze_grid import MazeGrid
+from .resolve import Solution, build_solution, neighbors, move_steps, \
+    trace_codes, ROOT, UNREACHED
+from . import exception
+
+Wall = tuple[tuple[int, int], tuple[int, int]]
+
+
+class DynamicSolver:
+    """
+    Shortest-path tree from the entry kept up to date under wall edits.
+
+    The first solve is a full BFS recording distances and parents. Each
+    later batch of opened and closed walls is repaired locally: closing a
+    tree edge only invalidates the subtree hanging below it, and opening
+    a wall only relaxes distances outward from its two cells, so the cost
+    follows the size of the change rather than the maze.
+
+    Attributes:
+        maze (MazeGrid): The edited maze.
+        start (tuple[int, int]): Entry cell.
+        end (tuple[int, int]): Exit cell.
+        dist (array): Distance of every cell to the entry, `unreachable`
+            if disconnected.
+        moves (bytearray): Move code from the parent of every cell, as in
+            `resolve.Solution`.
+    """
+
+    def __init__(self, maze: MazeGrid, start: tuple[int, int],
+                 end: tuple[int, int]) -> None:
+        """
+        Solve the maze from scratch.
+
+        Args:
+            maze (MazeGrid): The maze grid.
+            start (tuple[int, int]): Entry cell (x, y).
+            end (tuple[int, int]): Exit cell (x, y).
+        """
+        self.maze = maze
+        self.start = start
+        self.end = end
+        self.unreachable = len(maze.cells) + 1
+        self.dist = array("l")
+        self.moves = bytearray()
+        self.version = -1
+        self._steps = move_steps(maze.width)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Run a full BFS from the entry."""
+        maze = self.maze
+        size = len(maze.cells)
+        root = self.start[1] * maze.width + self.start[0]
+        self.dist = array("l", [self.unreachable]) * size
+        self.moves = bytearray([UNREACHED]) * size
+        self.dist[root] = 0
+        self.moves[root] = ROOT
+        queue = deque([root])
+        while queue:
+            i = queue.popleft()
+            d = self.dist[i] + 1
+            for code, j in neighbors(maze.cells, i, maze.width, self._steps):
+                if self.moves[j] == UNREACHED:
+                    self.moves[j] = code
+                    self.dist[j] = d
+                    queue.append(j)
+        self.version = maze.version
+
+    def _wall(self, wall: Wall) -> tuple[int, int, int]:
+        """
+        Return (cell a, cell b, move code from a to b) for a wall.
+
+        Raises:
+            exception.MazeException: If the cells are not adjacent.
+        """
+        (x1, y1), (x2, y2) = wall
+        w, h = self.maze.width, self.maze.height
+        if not (0 <= x1 < w and 0 <= y1 < h and 0 <= x2 < w and 0 <= y2 < h
+                and abs(x1 - x2) + abs(y1 - y2) == 1):
+            raise exception.MazeException(f"Invalid wall {wall}")
+        code = {(0, -1): 0, (1, 0): 1, (0, 1): 2, (-1, 0): 3}[
+            (x2 - x1, y2 - y1)]
+        return y1 * w + x1, y2 * w + x2, code
+
+    def _subtree(self, roots: list[int]) -> list[int]:
+        """Return `roots` and every cell whose parent chain crosses them."""
+        w = self.maze.width
+        size = len(self.moves)
+        moves = self.moves
+        stack = list(roots)
+        result = []
+        while stack:
+            i = stack.pop()
+            result.append(i)
+            column = i % w
+            # j is a child of i exactly when it was entered by that move.
+            for code, j in ((0, i - w), (1, i + 1 if column != w - 1 else -1),
+                            (2, i + w), (3, i - 1 if column else -1)):
+                if 0 <= j < size and moves[j] == code:
+                    stack.append(j)
+        return result
+
+    def apply(self, opened: Iterable[Wall] = (),
+              closed: Iterable[Wall] = ()) -> list[str] | None:
+        """
+        Open and close walls, then repair the shortest-path tree.
+
+        Args:
+            opened (Iterable[Wall]): Walls to open, as pairs of adjacent
+                cells.
+            closed (Iterable[Wall]): Walls to close.
+
+        Returns:
+            list[str] | None: The new path from entry to exit, None if the
+            exit became unreachable.
+
+        Raises:
+            exception.MazeException: If a wall is not between two adjacent
+                cells.
+        """
+        maze = self.maze
+        if maze.version != self.version:
+            self._rebuild()
+        cells = maze.cells
+        moves = self.moves
+        steps = self._steps
+
+        orphans = []
+        for wall in closed:
+            i, j, code = self._wall(wall)
+            if not cells[i] & steps[code][0]:
+                continue
+            cells[i] &= ~steps[code][0]
+            cells[j] &= ~steps[code ^ 2][0]
+            if moves[j] == code:
+                orphans.append(j)
+            elif moves[i] == code ^ 2:
+                orphans.append(i)
+        new_edges = []
+        for wall in opened:
+            i, j, code = self._wall(wall)
+            if cells[i] & steps[code][0]:
+                continue
+            cells[i] |= steps[code][0]
+            cells[j] |= steps[code ^ 2][0]
+            new_edges.append((i, j, code))
+        return self._repair(orphans, new_edges)
+
+    def relax(self, opened: Iterable[Wall]) -> list[str] | None:
+        """
+        Repair the tree after walls were opened on the maze directly.
+
+        For callers that open walls themselves (e.g. `make_non_perfect`);
+        the tree must still describe the maze as it was before.
+
+        Args:
+            opened (Iterable[Wall]): The walls already opened.
+
+        Returns:
+            list[str] | None: The new path from entry to exit, None if the
+            exit is unreachable.
+
+        Raises:
+            exception.MazeException: If a wall is not between two adjacent
+                cells.
+        """
+        return self._repair([], [self._wall(wall) for wall in opened])
+
+    def _repair(self, orphans: list[int],
+                new_edges: list[tuple[int, int, int]]) -> list[str] | None:
+        """
+        Fix distances and parents after cut tree edges and new walls.
+
+        Args:
+            orphans (list[int]): Cells whose parent edge was closed.
+            new_edges (list[tuple[int, int, int]]): Opened walls, as
+                `_wall` returns them.
+
+        Returns:
+            list[str] | None: The new path, None if unreachable.
+        """
+        maze = self.maze
+        cells = maze.cells
+        dist, moves = self.dist, self.moves
+        steps = self._steps
+        unreachable = self.unreachable
+        heap: list[tuple[int, int]] = []
+        # Cut subtrees lose their distances, then take the best one
+        # offered by an intact neighbour.
+        affected = self._subtree(orphans)
+        for i in affected:
+            dist[i] = unreachable
+            moves[i] = UNREACHED
+        for i in affected:
+            for code, j in neighbors(cells, i, maze.width, steps):
+                if dist[j] + 1 < dist[i]:
+                    dist[i] = dist[j] + 1
+                    moves[i] = code ^ 2
+            if dist[i] != unreachable:
+                heap.append((dist[i], i))
+        for i, j, code in new_edges:
+            for a, b, move in ((i, j, code), (j, i, code ^ 2)):
+                if dist[a] + 1 < dist[b]:
+                    dist[b] = dist[a] + 1
+                    moves[b] = move
+                    heap.append((dist[b], b))
+        heapq.heapify(heap)
+
+        while heap:
+            d, i = heapq.heappop(heap)
+            if d != dist[i]:
+                continue
+            for code, j in neighbors(cells, i, maze.width, steps):
+                if d + 1 < dist[j]:
+                    dist[j] = d + 1
+                    moves[j] = code
+                    heapq.heappush(heap, (d + 1, j))
+
+        maze.bump_version()
+        self.version = maze.version
+        solution = self.solution()
+        maze.solution = solution
+        return solution.path
+
+    def solution(self, snapshot: bool = False) -> Solution:
+        """
+        Return the current entry to exit path as a Solution.
+
+        The parent moves are shared with the solver unless `snapshot` is
+        set, so this costs O(path). A shared Solution goes stale with the
+        next edit, which its version check already reports.
+
+        Args:
+            snapshot (bool): Copy the parent moves, O(cells), so the
+                Solution survives later edits.
+
+        Returns:
+            Solution: The current solution.
+        """
+        goal = self.end[1] * self.maze.width + self.end[0]
+        route = None
+        if self.moves[goal] != UNREACHED:
+            route = trace_codes(self.moves, self.maze.width, goal)
+        moves = bytearray(self.moves) if snapshot else self.moves
+        return build_solution(self.maze, "bfs", self.start, self.end,
+                              route, moves)
@@ -2,16 +2,74 @@
 """Output file generation for maze data."""
 
 from .config import Config
+from typing import Iterable, Iterator, Union
 from .utils.mlx_utils import Bit_position
+from .utils.maze_grid import MazeGrid
 
 
-def generate_output(maze: list[list[int]], path: list[str],
-                    config: Config) -> bool:
+def _build_hex_table() -> bytes:
     """
-    Generate the output file containing maze details and solution.
+    Build the cell bitmask -> hexadecimal wall digit translation table.
+
+    Returns:
+        bytes: A 256-entry table usable with `bytes.translate`.
+    """
+    hex_charset = "0123456789ABCDEF"
+    table = bytearray(256)
+    for cell in range(256):
+        n = 0 if (cell & Bit_position.NORTH.value) else 1
+        e = 0 if (cell & Bit_position.EAST.value) else 1
+        s = 0 if (cell & Bit_position.SOUTH.value) else 1
+        w = 0 if (cell & Bit_position.WEST.value) else 1
+        hexa = (w << 3) | (s << 2) | (e << 1) | n
+        table[cell] = ord(hex_charset[hexa])
+    return bytes(table)
+
+
+HEX_TABLE = _build_hex_table()
+
+
+def output_lines(rows: Iterable[Union[bytes, bytearray]],
+                 path: list[str],
+                 config: Config) -> Iterator[str]:
+    """
+    Yield the lines of the output format one at a time.
+
+    Args:
+        rows (Iterable[bytes | bytearray]): Cell bitmasks of each row.
+        path (list[str]): The solution path as a string of directions.
+        config (Config): The configuration object (entry and exit).
+
+    Yields:
+        str: Each output line, newline included.
+    """
+    for row in rows:
+        yield row.translate(HEX_TABLE).decode("ascii") + "\n"
+    yield "\n"
+    yield f"{config.ENTRY[0]},{config.ENTRY[1]}\n"
+    yield f"{config.EXIT[0]},{config.EXIT[1]}\n"
+    yield "".join(path)+"\n"
+
+
+def _grid_rows(maze: MazeGrid, config: Config) -> Iterator[bytearray]:
+    """Yield the rows of a maze grid as bytearray slices."""
+    w = config.WIDTH
+    cells = maze.cells
+    for y in range(config.HEIGHT):
+        yield cells[y * w:(y + 1) * w]
+
+
+def stream_output(rows: Iterable[Union[bytes, bytearray]],
+                  path: list[str],
+                  config: Config) -> bool:
+    """
+    Write maze rows to the output file as they are produced.
+
+    Each row is written as soon as it is received, so generators that
+    yield finished rows never need the full grid in memory.
 
     Args:
-        maze (list[list[int]]): The maze grid.
+        rows (Iterable[bytes | bytearray]): Cell bitmasks of each row.
         path (list[str]): The solution path as a string of directions.
         config (Config): The configuration object containing output file path.
 
@@ -20,21 +78,38 @@ def generate_output(maze: list[list[int]], path: list[str],
     """
     try:
         with open(config.OUTPUT_FILE, "w") as f:
-            for y in range(config.HEIGHT):
-                line = ""
-                for x in range(config.WIDTH):
-                    n = 0 if (maze[y][x] & Bit_position.NORTH.value) else 1
-                    e = 0 if (maze[y][x] & Bit_position.EAST.value) else 1
-                    s = 0 if (maze[y][x] & Bit_position.SOUTH.value) else 1
-                    w = 0 if (maze[y][x] & Bit_position.WEST.value) else 1
-                    hexa = (w << 3) | (s << 2) | (e << 1) | n
-                    hex_charset = "0123456789ABCDEF"
-                    line += hex_charset[hexa]
-                f.write(line+"\n")
-            f.write("\n")
-            f.write(f"{config.ENTRY[0]},{config.ENTRY[1]}\n")
-            f.write(f"{config.EXIT[0]},{config.EXIT[1]}\n")
-            f.write("".join(path)+"\n")
+            f.writelines(output_lines(rows, path, config))
         return True
     except Exception:
         return False
+
+
+def format_output(maze: MazeGrid, path: list[str], config: Config) -> str:
+    """
+    Return the output file content of a maze as a string.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        path (list[str]): The solution path as a string of directions.
+        config (Config): The configuration object (size, entry and exit).
+
+    Returns:
+        str: The maze and solution in the output file format.
+    """
+    return "".join(output_lines(_grid_rows(maze, config), path, config))
+
+
+def generate_output(maze: MazeGrid, path: list[str],
+                    config: Config) -> bool:
+    """
+    Generate the output file containing maze details and solution.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        path (list[str]): The solution path as a string of directions.
+        config (Config): The configuration object containing output file path.
+
+    Returns:
+        bool: True if file generation succeeded, False otherwise.
+    """
+    return stream_output(_grid_rows(maze, config), path, config)
@@ -1,90 +1,674 @@
 #!/usr/bin/env python3
-"""Maze solving algorithm (BFS)."""
+"""Maze solving algorithms (BFS, bidirectional BFS, A*, bitboard)."""
 
+import heapq
+from array import array
+from itertools import groupby
+from typing import Callable, Iterable, Iterator
 from .config import Config
 from collections import deque
 from .utils.mlx_utils import XVar, Bit_position
+from .utils.maze_grid import MazeGrid
 
+Pair = tuple[tuple[int, int], tuple[int, int]]
+# A* heuristic, called as heuristic(x, y, exit_x, exit_y).
+Heuristic = Callable[[int, int, int, int], int]
 
-def resolve(pos: tuple[int, int], direction: int,
-            maze: list[list[int]],
-            visited: list[list[bool]] | None,
-            config: Config, xvar: XVar) -> list[str] | bool:
+# A cell's move code is the direction taken from its parent to reach it.
+DIRECTIONS = "NESW"
+ROOT = 4
+UNREACHED = 0xFF
+CODE_NAMES = bytes.maketrans(b"\x00\x01\x02\x03", b"NESW")
+DELTAS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+def run_length(path: Iterable[str]) -> str:
+    """Return a path in run-length form, e.g. "E12 S3 W1"."""
+    return " ".join(f"{name}{len(list(run))}" for name, run in groupby(path))
+
+
+class Solution:
+    """
+    Search result cached on a maze for one entry/exit pair.
+
+    It stays valid while the maze `version` it was computed for matches,
+    so generation, `get_solution`, drawing and output share one search.
+    The path is stored as one move code per step and the parent map as
+    one move code per cell, so a solved million-cell maze costs about a
+    megabyte.
+
+    Attributes:
+        version (int): Maze version the search ran on.
+        method (str): Solver that produced the result.
+        start (tuple[int, int]): Entry cell.
+        end (tuple[int, int]): Exit cell.
+        route (bytes | None): Move codes (0=N, 1=E, 2=S, 3=W) from start
+            to end, None if the exit is unreachable.
+        moves (bytearray | None): Move code of every cell reached from the
+            entry, ROOT for the entry and UNREACHED otherwise; None for
+            solvers that keep no parent map.
+    """
+
+    def __init__(self, version: int, method: str, start: tuple[int, int],
+                 end: tuple[int, int], route: bytes | None,
+                 moves: bytearray | None) -> None:
+        self.version = version
+        self.method = method
+        self.start = start
+        self.end = end
+        self.route = route
+        self.moves = moves
+        self._cells: list[tuple[int, int]] | None = None
+
+    def matches(self, maze: MazeGrid, method: str, start: tuple[int, int],
+                end: tuple[int, int]) -> bool:
+        """Return True if this result still answers the query."""
+        return (self.version == maze.version and self.method == method
+                and self.start == start and self.end == end)
+
+    @property
+    def path(self) -> list[str] | None:
+        """Directions from start to end, None if unreachable."""
+        if self.route is None:
+            return None
+        return list(self.route.translate(CODE_NAMES).decode())
+
+    def iter_path(self) -> Iterator[str]:
+        """Lazily yield the directions from start to end."""
+        for code in self.route or b"":
+            yield DIRECTIONS[code]
+
+    def rle(self) -> str | None:
+        """Return the path in run-length form, e.g. "E12 S3"."""
+        if self.route is None:
+            return None
+        return run_length(self.iter_path())
+
+    @property
+    def cells(self) -> list[tuple[int, int]]:
+        """Cells of the path without its ends, from exit to entry."""
+        if self._cells is None:
+            x, y = self.start
+            cells = []
+            for code in (self.route or b"")[:-1]:
+                dx, dy = DELTAS[code]
+                x, y = x + dx, y + dy
+                cells.append((x, y))
+            cells.reverse()
+            self._cells = cells
+        return self._cells
+
+
+def move_steps(width: int) -> tuple[tuple[int, int], ...]:
+    """Return (wall bit, index offset) for every move, by move code."""
+    return ((Bit_position.NORTH.value, -width),
+            (Bit_position.EAST.value, 1),
+            (Bit_position.SOUTH.value, width),
+            (Bit_position.WEST.value, -1))
+
+
+def neighbors(cells: bytearray, i: int, width: int,
+              steps: tuple[tuple[int, int], ...]) -> list[tuple[int, int]]:
+    """Return (move code, flat index) of every cell one move from `i`."""
+    cell = cells[i]
+    size = len(cells)
+    column = i % width
+    result = []
+    for code, (bit, step) in enumerate(steps):
+        if not cell & bit:
+            continue
+        j = i + step
+        if not 0 <= j < size:
+            continue
+        if step == 1 and column == width - 1 or step == -1 and column == 0:
+            continue
+        result.append((code, j))
+    return result
+
+
+def parent_of(moves: bytearray, width: int, i: int) -> int:
+    """Return the parent of cell `i`, -1 for the root or unreached."""
+    code = moves[i]
+    if code >= ROOT:
+        return -1
+    return i - (-width, 1, width, -1)[code]
+
+
+def trace_codes(moves: bytearray, width: int, i: int) -> bytearray:
+    """Return the move codes from the search root to cell `i`."""
+    offsets = (-width, 1, width, -1)
+    route = bytearray()
+    code = moves[i]
+    while code != ROOT:
+        route.append(code)
+        i -= offsets[code]
+        code = moves[i]
+    route.reverse()
+    return route
+
+
+def build_solution(maze: MazeGrid, method: str, pos: tuple[int, int],
+                   end_pos: tuple[int, int],
+                   route: bytes | bytearray | None,
+                   moves: bytearray | None) -> Solution:
     """
-    Solve the maze using Breadth-First Search (BFS).
+    Wrap a search result into a Solution for the current maze version.
 
     Args:
-        pos (tuple[int, int]): The starting position (x, y).
-        direction (int): Initial direction (unused in BFS implementation).
-        maze (list[list[int]]): The maze grid.
-        visited (list[list[bool]] | None): Matrix of visited cells.
-        config (Config): Configuration object containing exit coordinates.
-        xvar (XVar): XVar object for rendering (unused in logic).
+        maze (MazeGrid): The maze grid.
+        method (str): Solver name.
+        pos (tuple[int, int]): The entry position.
+        end_pos (tuple[int, int]): The exit position.
+        route (bytes | bytearray | None): Move codes from entry to exit,
+            None if unreachable.
+        moves (bytearray | None): Forward move codes of the search.
 
     Returns:
-        list[str] | bool: A list of directions ('N', 'S', 'E', 'W') \
-representing the path,
-                          or False if no solution is found.
+        Solution: The search result.
+    """
+    return Solution(maze.version, method, pos, end_pos,
+                    None if route is None else bytes(route), moves)
+
+
+def bfs_moves(maze: MazeGrid, start: int, goal: int = -1) -> bytearray:
     """
-    queue = deque([pos])
-    visited_set = {pos}
-    came_from: dict[tuple[int, int], tuple[int, int] | None] = {pos: None}
-    end_pos = tuple(config.EXIT)
+    Run a BFS from flat cell `start`, stopping once `goal` is dequeued.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        start (int): Flat index of the source cell.
+        goal (int): Flat index of the target cell, -1 to reach every cell.
 
-    final_node: tuple[int, int] | None = None
+    Returns:
+        bytearray: Move code of every reached cell, ROOT for the source
+        and UNREACHED for the others.
+    """
+    cells = maze.cells
+    width = maze.width
+    steps = move_steps(width)
+    moves = bytearray([UNREACHED]) * len(cells)
+    moves[start] = ROOT
+    queue = deque([start])
 
     while queue:
         current = queue.popleft()
-
-        if current == end_pos:
-            final_node = current
+        if current == goal:
             break
+        for code, j in neighbors(cells, current, width, steps):
+            if moves[j] == UNREACHED:
+                moves[j] = code
+                queue.append(j)
+    return moves
 
-        x, y = current
-        movements = [
-            (0, -1, Bit_position.NORTH.value),
-            (1, 0, Bit_position.EAST.value),
-            (0, 1, Bit_position.SOUTH.value),
-            (-1, 0, Bit_position.WEST.value)
-        ]
 
-        for dx, dy, direction_bit in movements:
-            if not (maze[y][x] & direction_bit):
-                continue
+class PathTree:
+    """
+    Full BFS tree grown from one root cell.
+
+    One tree answers the shortest path between its root and every other
+    cell by following the move codes, without searching again.
+
+    Attributes:
+        width (int): Maze width.
+        root (int): Flat index of the root cell.
+        moves (bytearray): Move code of every cell, UNREACHED if
+            disconnected.
+    """
+
+    def __init__(self, maze: MazeGrid, root: tuple[int, int]) -> None:
+        """
+        Grow the tree from `root`.
+
+        Args:
+            maze (MazeGrid): The maze grid.
+            root (tuple[int, int]): The root cell (x, y).
+        """
+        self.width = maze.width
+        self.root = root[1] * maze.width + root[0]
+        self.moves = bfs_moves(maze, self.root)
+
+    def _index(self, cell: tuple[int, int]) -> int:
+        """Return the flat index of `cell`, -1 if outside the grid."""
+        if not 0 <= cell[0] < self.width:
+            return -1
+        i = cell[1] * self.width + cell[0]
+        return i if 0 <= i < len(self.moves) else -1
+
+    def reaches(self, cell: tuple[int, int]) -> bool:
+        """Return True if `cell` is connected to the root."""
+        i = self._index(cell)
+        return i != -1 and self.moves[i] != UNREACHED
+
+    def path_to(self, cell: tuple[int, int]) -> str | None:
+        """Return the directions from the root to `cell`, or None."""
+        if not self.reaches(cell):
+            return None
+        route = trace_codes(self.moves, self.width, self._index(cell))
+        return route.translate(CODE_NAMES).decode()
+
+    def iter_from(self, cell: tuple[int, int]) -> Iterator[str]:
+        """Lazily yield the directions from `cell` to the root."""
+        offsets = (-self.width, 1, self.width, -1)
+        moves = self.moves
+        i = self._index(cell)
+        code = moves[i]
+        while code != ROOT:
+            yield DIRECTIONS[code ^ 2]
+            i -= offsets[code]
+            code = moves[i]
+
+
+def _plan(maze: MazeGrid,
+          pairs: list[Pair]) -> tuple[dict[tuple[int, int], PathTree], bool]:
+    """
+    Grow one tree per distinct source, or per distinct target if fewer.
+
+    Returns:
+        tuple: (tree by root cell, True if the trees are rooted at the
+        targets).
+    """
+    sources = {(a[0], a[1]) for a, _ in pairs}
+    targets = {(b[0], b[1]) for _, b in pairs}
+    by_target = len(targets) < len(sources)
+    roots = targets if by_target else sources
+    return {root: PathTree(maze, root) for root in roots}, by_target
+
+
+def solve_many(maze: MazeGrid, pairs: list[Pair]) -> list[str | None]:
+    """
+    Solve many (source, target) pairs with one BFS per shared endpoint.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        pairs (list): (source, target) cells, as (x, y) tuples.
+
+    Returns:
+        list[str | None]: Directions ("NNES...") of every pair in order,
+        None where the target is unreachable.
+    """
+    trees, by_target = _plan(maze, pairs)
+    results: list[str | None] = []
+    for a, b in pairs:
+        if by_target:
+            tree = trees[(b[0], b[1])]
+            results.append("".join(tree.iter_from(a))
+                           if tree.reaches(a) else None)
+        else:
+            results.append(trees[(a[0], a[1])].path_to(b))
+    return results
+
+
+def _deferred(tree: PathTree, cell: tuple[int, int]) -> Iterator[str]:
+    """Yield the path from the root to `cell`, traced on first use."""
+    yield from tree.path_to(cell) or ""
+
+
+def iter_many(maze: MazeGrid,
+              pairs: list[Pair]) -> list[Iterator[str] | None]:
+    """
+    Like `solve_many`, but return lazy iterators over the directions.
+
+    Trees rooted at the targets are walked step by step as the iterator
+    is consumed; trees rooted at the sources trace a path on first use.
+
+    Args:
+        maze (MazeGrid): The maze grid.
+        pairs (list): (source, target) cells, as (x, y) tuples.
+
+    Returns:
+        list[Iterator[str] | None]: One iterator per pair in order, None
+        where the target is unreachable.
+    """
+    trees, by_target = _plan(maze, pairs)
+    results: list[Iterator[str] | None] = []
+    for a, b in pairs:
+        if by_target:
+            tree = trees[(b[0], b[1])]
+            results.append(tree.iter_from(a) if tree.reaches(a) else None)
+        else:
+            tree = trees[(a[0], a[1])]
+            results.append(_deferred(tree, b) if tree.reaches(b) else None)
+    return results
+
+
+def _search(pos: tuple[int, int], end_pos: tuple[int, int],
+            maze: MazeGrid) -> Solution:
+    """
+    Run a BFS from `pos` until `end_pos` is dequeued.
+
+    Args:
+        pos (tuple[int, int]): The starting position (x, y).
+        end_pos (tuple[int, int]): The exit position (x, y).
+        maze (MazeGrid): The maze grid.
+
+    Returns:
+        Solution: The search result for the current maze version.
+    """
+    width = maze.width
+    goal = end_pos[1] * width + end_pos[0]
+    moves = bfs_moves(maze, pos[1] * width + pos[0], goal)
+    route = None
+    if moves[goal] != UNREACHED:
+        route = trace_codes(moves, width, goal)
+    return build_solution(maze, "bfs", pos, end_pos, route, moves)
+
+
+def _search_bidirectional(pos: tuple[int, int], end_pos: tuple[int, int],
+                          maze: MazeGrid) -> Solution:
+    """
+    Run a BFS from both `pos` and `end_pos` until the frontiers meet.
+
+    The smaller frontier is expanded one full layer at a time; once a
+    layer touches the other side, the meeting cell minimizing the summed
+    depth is kept, so the path is as short as with a plain BFS.
+
+    Args:
+        pos (tuple[int, int]): The starting position (x, y).
+        end_pos (tuple[int, int]): The exit position (x, y).
+        maze (MazeGrid): The maze grid.
+
+    Returns:
+        Solution: The search result for the current maze version.
+    """
+    cells = maze.cells
+    width = maze.width
+    steps = move_steps(width)
+    start = pos[1] * width + pos[0]
+    goal = end_pos[1] * width + end_pos[0]
+    forward = bytearray([UNREACHED]) * len(cells)
+    backward = bytearray([UNREACHED]) * len(cells)
+    forward[start] = ROOT
+    backward[goal] = ROOT
+    depth_f = array("l", [0]) * len(cells)
+    depth_b = array("l", [0]) * len(cells)
+    front_f = [start]
+    front_b = [goal]
+    meet = start if start == goal else -1
+
+    while meet == -1 and front_f and front_b:
+        if len(front_f) <= len(front_b):
+            moves, other, depth, other_depth = (forward, backward,
+                                                depth_f, depth_b)
+            frontier = front_f
+        else:
+            moves, other, depth, other_depth = (backward, forward,
+                                                depth_b, depth_f)
+            frontier = front_b
+        layer = []
+        best = -1
+        for i in frontier:
+            d = depth[i] + 1
+            for code, j in neighbors(cells, i, width, steps):
+                if moves[j] != UNREACHED:
+                    continue
+                moves[j] = code
+                depth[j] = d
+                layer.append(j)
+                if other[j] != UNREACHED and (
+                        best == -1 or other_depth[j] < other_depth[best]):
+                    best = j
+        meet = best
+        if frontier is front_f:
+            front_f = layer
+        else:
+            front_b = layer
+
+    if meet == -1:
+        return build_solution(maze, "bidirectional", pos, end_pos, None,
+                              forward)
+    route = trace_codes(forward, width, meet)
+    # The backward tree points at the exit, so walk it with reversed moves.
+    offsets = (-width, 1, width, -1)
+    i = meet
+    code = backward[i]
+    while code != ROOT:
+        route.append(code ^ 2)
+        i -= offsets[code]
+        code = backward[i]
+    return build_solution(maze, "bidirectional", pos, end_pos, route,
+                          forward)
+
 
-            nx, ny = x + dx, y + dy
+def manhattan(x1: int, y1: int, x2: int, y2: int) -> int:
+    """Return the Manhattan distance, admissible on a 4-connected grid."""
+    return abs(x1 - x2) + abs(y1 - y2)
 
-            if not (0 <= nx < config.WIDTH and 0 <= ny < config.HEIGHT):
+
+def astar(pos: tuple[int, int], end_pos: tuple[int, int], maze: MazeGrid,
+          heuristic: Heuristic = manhattan) -> Solution:
+    """
+    Run an A* search from `pos` to `end_pos`.
+
+    Open cells sit in a binary heap ordered by (f, h), so ties go to the
+    cell closest to the exit. g-scores and move codes live in flat
+    arrays indexed by y * width + x. With an admissible `heuristic` the
+    path is as short as with BFS.
+
+    Args:
+        pos (tuple[int, int]): The starting position (x, y).
+        end_pos (tuple[int, int]): The exit position (x, y).
+        maze (MazeGrid): The maze grid.
+        heuristic (Heuristic): Lower bound of the distance between two
+            cells, called as heuristic(x, y, exit_x, exit_y).
+
+    Returns:
+        Solution: The search result for the current maze version.
+    """
+    cells = maze.cells
+    width = maze.width
+    steps = move_steps(width)
+    ex, ey = end_pos
+    start = pos[1] * width + pos[0]
+    goal = ey * width + ex
+    moves = bytearray([UNREACHED]) * len(cells)
+    g_score = array("l", [-1]) * len(cells)
+    closed = bytearray(len(cells))
+    moves[start] = ROOT
+    g_score[start] = 0
+    h = heuristic(pos[0], pos[1], ex, ey)
+    heap = [(h, h, start)]
+
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        if current == goal:
+            return build_solution(maze, "astar", pos, end_pos,
+                                  trace_codes(moves, width, goal), moves)
+        if closed[current]:
+            continue
+        closed[current] = 1
+        g = g_score[current] + 1
+        for code, j in neighbors(cells, current, width, steps):
+            if closed[j] or 0 <= g_score[j] <= g:
                 continue
+            g_score[j] = g
+            moves[j] = code
+            h = heuristic(j % width, j // width, ex, ey)
+            heapq.heappush(heap, (g + h, h, j))
+    return build_solution(maze, "astar", pos, end_pos, None, moves)
+
+
+def _bit_table(bit: int) -> bytes:
+    """Translate table mapping a cell to b"1" if `bit` is open."""
+    return bytes(ord("1") if cell & bit else ord("0") for cell in range(256))
+
+
+BIT_TABLES = tuple(_bit_table(bit.value) for bit in (
+    Bit_position.NORTH, Bit_position.EAST,
+    Bit_position.SOUTH, Bit_position.WEST))
+
+
+def move_masks(maze: MazeGrid) -> tuple[int, int, int, int]:
+    """
+    Pack the open walls of every cell into four big-integer bitmaps.
+
+    Cell `y * width + x` is bit `y * width + x`. Bits whose move would
+    leave the grid are cleared, so shifting a masked set never wraps
+    around a row.
+
+    Args:
+        maze (MazeGrid): The maze grid.
 
-            if (nx, ny) not in visited_set:
-                visited_set.add((nx, ny))
-                came_from[(nx, ny)] = current
-                queue.append((nx, ny))
-
-    if final_node:
-        path = []
-        curr = final_node
-        while curr != pos:
-            parent = came_from[curr]
-            if parent is None:
-                break
-            dx, dy = curr[0] - parent[0], curr[1] - parent[1]
-
-            d = ""
-            if dx == 0 and dy == -1:
-                d = "N"
-            elif dx == 1 and dy == 0:
-                d = "E"
-            elif dx == 0 and dy == 1:
-                d = "S"
-            elif dx == -1 and dy == 0:
-                d = "W"
-            path.append(d)
-
-            if curr != end_pos:
-                xvar.path.append((curr[0], curr[1]))
-            curr = parent
-        path.reverse()
-        return path
-    return False
+    Returns:
+        tuple[int, int, int, int]: Cells that can move north, east, south
+        and west.
+    """
+    w = maze.width
+    size = len(maze.cells)
+    north, east, south, west = (int(maze.cells.translate(table)[::-1], 2)
+                                for table in BIT_TABLES)
+    full = (1 << size) - 1
+    first_column = full // ((1 << w) - 1)
+    north &= full ^ ((1 << w) - 1)
+    east &= full ^ (first_column << (w - 1))
+    south &= full >> w
+    west &= full ^ first_column
+    return north, east, south, west
+
+
+def bitboard(pos: tuple[int, int], end_pos: tuple[int, int],
+             maze: MazeGrid) -> Solution:
+    """
+    Flood fill the maze one BFS layer at a time on big-integer bitmaps.
+
+    Each layer is the previous one moved through the four move masks
+    with whole-grid shifts, minus the cells already reached, so the inner
+    loop runs in C over 64 cells per machine word. Every layer costs
+    O(cells / 64) whatever its size, so this beats `bfs` only when the
+    path is short compared to the grid (open, loopy mazes); on long
+    perfect-maze paths it is slower.
+
+    Only every k-th layer is kept as a checkpoint, k doubling whenever
+    there are more than 2k of them, so about sqrt(L) bitmaps of L layers
+    are held. The walk back recomputes the layers between two
+    checkpoints from the later one down.
+
+    Args:
+        pos (tuple[int, int]): The starting position (x, y).
+        end_pos (tuple[int, int]): The exit position (x, y).
+        maze (MazeGrid): The maze grid.
+
+    Returns:
+        Solution: The search result, without a parent map.
+    """
+    w = maze.width
+    north, east, south, west = move_masks(maze)
+
+    def expand(frontier: int, unreached: int) -> int:
+        """Return the next layer: the unreached cells next to `frontier`."""
+        return ((((frontier & north) >> w) | ((frontier & south) << w)
+                 | ((frontier & east) << 1) | ((frontier & west) >> 1))
+                & unreached)
+
+    start = pos[1] * w + pos[0]
+    goal = end_pos[1] * w + end_pos[0]
+    target = 1 << goal
+    frontier = 1 << start
+    unreached = ((1 << len(maze.cells)) - 1) ^ frontier
+    every = 1
+    checkpoints = [(frontier, unreached)]
+    depth = 0
+    while not frontier & target:
+        frontier = expand(frontier, unreached)
+        if not frontier:
+            return build_solution(maze, "bitboard", pos, end_pos, None, None)
+        unreached ^= frontier
+        depth += 1
+        if depth % every == 0:
+            checkpoints.append((frontier, unreached))
+            if len(checkpoints) > 2 * every:
+                checkpoints = checkpoints[::2]
+                every *= 2
+
+    steps = move_steps(w)
+    route = bytearray()
+    i = goal
+    for index in range(len(checkpoints) - 1, -1, -1):
+        base = index * every
+        if base >= depth:
+            continue
+        frontier, unreached = checkpoints[index]
+        segment = [frontier]
+        for _ in range(base + 1, depth):
+            frontier = expand(frontier, unreached)
+            unreached ^= frontier
+            segment.append(frontier)
+        for layer in reversed(segment):
+            for code, j in neighbors(maze.cells, i, w, steps):
+                if layer >> j & 1:
+                    route.append(code ^ 2)
+                    i = j
+                    break
+        depth = base
+    route.reverse()
+    return build_solution(maze, "bitboard", pos, end_pos, route, None)
+
+
+SOLVERS: dict[str, Callable[[tuple[int, int], tuple[int, int], MazeGrid],
+                            Solution]] = {
+    "bfs": _search,
+    "bidirectional": _search_bidirectional,
+    "astar": astar,
+    "bitboard": bitboard,
+}
+
+
+def cached_solution(maze: MazeGrid, pos: tuple[int, int],
+                    end_pos: tuple[int, int],
+                    method: str = "bfs") -> Solution | None:
+    """Return the cached solution of `maze` if it is still valid."""
+    cached = maze.solution
+    if isinstance(cached, Solution) and cached.matches(maze, method, pos,
+                                                       end_pos):
+        return cached
+    return None
+
+
+def resolve(pos: tuple[int, int], direction: int,
+            maze: MazeGrid,
+            visited: list[list[bool]] | None,
+            config: Config, xvar: XVar,
+            method: str = "bfs",
+            heuristic: Heuristic | None = None) -> list[str] | bool:
+    """
+    Solve the maze with the chosen search.
+
+    The result is cached on the maze and reused until its walls change,
+    so repeated calls cost a version check. `xvar.path` is replaced with
+    the cells of the path.
+
+    A custom `heuristic` runs A* whatever `method` is. Its result is
+    neither read from nor stored in the cache, since an inadmissible
+    heuristic may return a longer path than the built-in solvers.
+
+    Args:
+        pos (tuple[int, int]): The starting position (x, y).
+        direction (int): Initial direction (unused in BFS implementation).
+        maze (MazeGrid): The maze grid.
+        visited (list[list[bool]] | None): Matrix of visited cells.
+        config (Config): Configuration object containing exit coordinates.
+        xvar (XVar): XVar object receiving the path cells for rendering.
+        method (str): Solver name, a key of SOLVERS (see config.SOLVERS).
+        heuristic (Heuristic | None): A* heuristic replacing `manhattan`.
+
+    Returns:
+        list[str] | bool: A list of directions ('N', 'S', 'E', 'W') \
+representing the path,
+                          or False if no solution is found.
+    """
+    end_pos = (config.EXIT[0], config.EXIT[1])
+    cached = None
+    if heuristic is None:
+        cached = cached_solution(maze, pos, end_pos, method)
+    if cached is not None:
+        solution = cached
+    elif heuristic is not None:
+        solution = astar(pos, end_pos, maze, heuristic)
+    else:
+        solution = SOLVERS[method](pos, end_pos, maze)
+        maze.solution = solution
+    if xvar:
+        xvar.path = list(solution.cells)
+    path = solution.path
+    if path is None:
+        return False
+    return path
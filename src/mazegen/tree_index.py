@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Lowest common ancestor index for path queries on perfect mazes."""
+
+from array import array
+from collections import deque
+from .utils.generate_utils import Bit_position, OPEN_COUNT
+from .utils.maze_grid import MazeGrid
+from . import exception
+
+
+class TreeIndex:
+    """
+    Rooted spanning tree of a perfect maze with binary lifting.
+
+    Built once in O(n log n); afterwards the distance between two cells
+    costs O(log n) and a path O(log n) plus its length, without walking
+    the grid again.
+
+    Attributes:
+        width (int): Maze width.
+        version (int): Maze version the index was built on.
+        root (int): Flat index of the root cell.
+        parent (array): Parent of every cell, the root for itself and -1
+            for cells outside the tree (the symbol).
+        depth (array): Distance of every cell to the root.
+        up (list[array]): `up[k][i]` is the 2**k-th ancestor of cell i.
+    """
+
+    def __init__(self, maze: MazeGrid,
+                 root: tuple[int, int] | None = None) -> None:
+        """
+        Root the maze tree and build the lifting tables.
+
+        Args:
+            maze (MazeGrid): A perfect maze.
+            root (tuple[int, int] | None): Root cell, defaults to the
+                first free cell.
+
+        Raises:
+            exception.MazeException: If the maze is not a tree.
+        """
+        w = maze.width
+        cells = maze.cells
+        size = len(cells)
+        self.width = w
+        self.version = maze.version
+        if root is None:
+            free = [i for i in range(size)
+                    if cells[i] != Bit_position.VISITED.value]
+            self.root = free[0] if free else 0
+        else:
+            self.root = root[1] * w + root[0]
+
+        steps = ((Bit_position.NORTH.value, -w),
+                 (Bit_position.EAST.value, 1),
+                 (Bit_position.SOUTH.value, w),
+                 (Bit_position.WEST.value, -1))
+        parent = array("l", [-1]) * size
+        depth = array("l", [0]) * size
+        parent[self.root] = self.root
+        queue = deque([self.root])
+        reached = 0
+        passages = 0
+        while queue:
+            i = queue.popleft()
+            reached += 1
+            cell = cells[i]
+            passages += OPEN_COUNT[cell]
+            column = i % w
+            for bit, step in steps:
+                if not cell & bit:
+                    continue
+                j = i + step
+                if not 0 <= j < size or (step == 1 and column == w - 1) \
+                        or (step == -1 and column == 0):
+                    continue
+                if parent[j] == -1:
+                    parent[j] = i
+                    depth[j] = depth[i] + 1
+                    queue.append(j)
+        if passages // 2 != reached - 1:
+            raise exception.MazeException("The maze is not perfect, no tree \
+index can be built")
+        self.parent = parent
+        self.depth = depth
+
+        # Cells outside the tree point at the root so lifting stays total.
+        first = array("l", (p if p != -1 else self.root for p in parent))
+        self.up = [first]
+        for _ in range(max(1, max(depth).bit_length()) - 1):
+            prev = self.up[-1]
+            self.up.append(array("l", map(prev.__getitem__, prev)))
+
+    def _index(self, cell: tuple[int, int]) -> int:
+        """Return the flat index of a cell of the tree."""
+        i = cell[1] * self.width + cell[0]
+        if not 0 <= cell[0] < self.width or not 0 <= i < len(self.parent) \
+                or self.parent[i] == -1:
+            raise exception.MazeException(f"Cell {cell} is not in the maze")
+        return i
+
+    def _ancestor(self, i: int, steps: int) -> int:
+        """Return the ancestor `steps` levels above cell `i`."""
+        k = 0
+        while steps:
+            if steps & 1:
+                i = self.up[k][i]
+            steps >>= 1
+            k += 1
+        return i
+
+    def _lca(self, a: int, b: int) -> int:
+        """Return the lowest common ancestor of flat cells `a` and `b`."""
+        depth = self.depth
+        if depth[a] < depth[b]:
+            a, b = b, a
+        a = self._ancestor(a, depth[a] - depth[b])
+        if a == b:
+            return a
+        for level in reversed(self.up):
+            if level[a] != level[b]:
+                a, b = level[a], level[b]
+        return self.up[0][a]
+
+    def lca(self, a: tuple[int, int], b: tuple[int, int]) -> tuple[int, int]:
+        """Return the deepest cell shared by the root paths of a and b."""
+        i = self._lca(self._index(a), self._index(b))
+        return i % self.width, i // self.width
+
+    def distance(self, a: tuple[int, int], b: tuple[int, int]) -> int:
+        """Return the number of moves between cells `a` and `b`."""
+        i, j = self._index(a), self._index(b)
+        depth = self.depth
+        return depth[i] + depth[j] - 2 * depth[self._lca(i, j)]
+
+    def path(self, a: tuple[int, int], b: tuple[int, int]) -> list[str]:
+        """
+        Return the only path from cell `a` to cell `b`.
+
+        Args:
+            a (tuple[int, int]): Start cell (x, y).
+            b (tuple[int, int]): Target cell (x, y).
+
+        Returns:
+            list[str]: Directions ('N', 'E', 'S', 'W') from `a` to `b`.
+
+        Raises:
+            exception.MazeException: If a cell is outside the tree.
+        """
+        i, j = self._index(a), self._index(b)
+        top = self._lca(i, j)
+        w = self.width
+        names = {-w: "N", 1: "E", w: "S", -1: "W"}
+        parent = self.parent
+        up = []
+        while i != top:
+            up.append(names[parent[i] - i])
+            i = parent[i]
+        down = []
+        while j != top:
+            down.append(names[j - parent[j]])
+            j = parent[j]
+        down.reverse()
+        return up + down
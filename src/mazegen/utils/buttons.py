@@ -1,9 +1,9 @@
 """Button handling utilities for the maze UI."""
 
 from ..utils.mlx_utils import XVar, manage_close, create_path_image, \
-                            render_maze_to_mlx
+                            show_path_overlay, recolor_maze
 from .. import exception
-from ..utils.maze_utils import generate_maze
+from ..utils.tasks import start_generation, cancel_generation
 from ..config import Config
 from typing import Any
 
@@ -151,16 +151,14 @@ def button_exit(xvar: XVar) -> None:
 
 def button_restart(config: Config, xvar: XVar) -> None:
     """
-    Callback to generate a new maze.
+    Callback to generate a new maze, or cancel the one in progress.
 
     Args:
         config (Config): The configuration object.
         xvar (XVar): The graphics context.
     """
-    xvar.maze_data = generate_maze(config, xvar)
-    render_maze_to_mlx(xvar.mlx, xvar.mlx_ptr, xvar.win_1, xvar.maze_data,
-                       config, xvar)
-    create_path_image(xvar, config)
+    if not cancel_generation(config, xvar):
+        start_generation(config, xvar)
 
 
 def button_color_maze(config: Config, xvar: XVar) -> None:
@@ -173,11 +171,7 @@ def button_color_maze(config: Config, xvar: XVar) -> None:
     """
     color_max = len(config.COLORS)
     xvar.color_palette = (xvar.color_palette + 1) % color_max
-    render_maze_to_mlx(xvar.mlx, xvar.mlx_ptr, xvar.win_1, xvar.maze_data,
-                       config, xvar)
-    create_path_image(xvar, config)
-    if xvar.show_path:
-        button_toggle_path(config, xvar, xvar.show_path)
+    recolor_maze(xvar, config)
 
 
 def button_toggle_path(config: Config, xvar: XVar,
@@ -195,14 +189,10 @@ def button_toggle_path(config: Config, xvar: XVar,
     else:
         xvar.show_path = not xvar.show_path
 
-    if not xvar.path_img:
+    if xvar.overlay is None:
         create_path_image(xvar, config)
-
-    target_img = xvar.path_img if (
-        xvar.show_path and xvar.path_img) else xvar.img
-    if target_img:
-        xvar.mlx.mlx_put_image_to_window(
-            xvar.mlx_ptr, xvar.win_1, target_img, 0, 0)
+    else:
+        show_path_overlay(xvar, config, xvar.show_path)
 
 
 def buttons_init(config: Config, xvar: XVar) -> None:
@@ -1,7 +1,7 @@
 """Shared utilities for maze generation algorithms."""
 
-from typing import List
 from enum import Enum
+from .maze_grid import MazeGrid
 
 
 class Direction(Enum):
@@ -19,29 +19,37 @@ class Bit_position(Enum):
     WEST = 0b01000
 
 
-def remove_wall(maze: List[List[int]], x1: int,
+# Number of open walls of every cell value.
+OPEN_COUNT = bytes(bin(cell & 15).count("1") for cell in range(256))
+
+
+def remove_wall(maze: MazeGrid, x1: int,
                 y1: int, x2: int, y2: int) -> None:
     """
     Carve connection between two adjacent cells.
 
     Args:
-        maze (List[List[int]]): The maze grid.
+        maze (MazeGrid): The maze grid.
         x1 (int): The x-coordinate of the first cell.
         y1 (int): The y-coordinate of the first cell.
         x2 (int): The x-coordinate of the second cell.
         y2 (int): The y-coordinate of the second cell.
     """
+    cells = maze.cells
+    maze.version += 1
+    i1 = y1 * maze.width + x1
+    i2 = y2 * maze.width + x2
     if x1 == x2:
         if y1 > y2:  # Neighbor is North
-            maze[y1][x1] |= Bit_position.NORTH.value
-            maze[y2][x2] |= Bit_position.SOUTH.value
+            cells[i1] |= Bit_position.NORTH.value
+            cells[i2] |= Bit_position.SOUTH.value
         else:        # Neighbor is South
-            maze[y1][x1] |= Bit_position.SOUTH.value
-            maze[y2][x2] |= Bit_position.NORTH.value
+            cells[i1] |= Bit_position.SOUTH.value
+            cells[i2] |= Bit_position.NORTH.value
     elif y1 == y2:
         if x1 > x2:  # Neighbor is West
-            maze[y1][x1] |= Bit_position.WEST.value
-            maze[y2][x2] |= Bit_position.EAST.value
+            cells[i1] |= Bit_position.WEST.value
+            cells[i2] |= Bit_position.EAST.value
         else:        # Neighbor is East
-            maze[y1][x1] |= Bit_position.EAST.value
-            maze[y2][x2] |= Bit_position.WEST.value
+            cells[i1] |= Bit_position.EAST.value
+            cells[i2] |= Bit_position.WEST.value
@@ -0,0 +1,123 @@
+"""Compact flat-array storage for maze cells."""
+
+from typing import Any, Iterator, List
+
+
+class MazeGrid:
+    """
+    Maze grid stored as one contiguous byte per cell.
+
+    Cells are laid out row-major (index = y * width + x) and hold the
+    `Bit_position` bitmask of the cell. The raw storage is `cells`, a
+    bytearray: pass it (not the grid) to `memoryview`, `np.frombuffer`
+    and other buffer consumers. `grid[y][x]` is kept as a compatibility
+    accessor returning read-only row views; writes go through `set`.
+
+    `version` is bumped on every wall change so derived data, such as the
+    cached solution, can tell when it is stale. Code writing `cells`
+    directly after a solve must call `bump_version`.
+
+    Attributes:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        cells (bytearray): Row-major cell bitmasks.
+        version (int): Wall change counter.
+        solution (Any): Solver cache, owned by the resolve module.
+    """
+
+    __slots__ = ("width", "height", "cells", "version", "solution")
+
+    def __init__(self, width: int, height: int, fill: int = 0) -> None:
+        """
+        Allocate a grid with every cell set to `fill`.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+            fill (int): Initial bitmask of every cell.
+        """
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+        self.version = 0
+        self.solution: Any = None
+
+    @classmethod
+    def from_rows(cls, rows: List[List[int]]) -> "MazeGrid":
+        """
+        Build a grid from a nested list of cell bitmasks.
+
+        Args:
+            rows (List[List[int]]): Rows of cell bitmasks.
+
+        Returns:
+            MazeGrid: The equivalent flat grid.
+        """
+        height = len(rows)
+        width = len(rows[0]) if height else 0
+        grid = cls(width, height)
+        for y, row in enumerate(rows):
+            grid.cells[y * width:(y + 1) * width] = bytes(row)
+        return grid
+
+    def to_rows(self) -> List[List[int]]:
+        """
+        Convert the grid to a nested list of cell bitmasks.
+
+        Returns:
+            List[List[int]]: Rows of cell bitmasks.
+        """
+        w = self.width
+        return [list(self.cells[y * w:(y + 1) * w])
+                for y in range(self.height)]
+
+    def bump_version(self) -> None:
+        """Mark the walls as changed, invalidating cached solutions."""
+        self.version += 1
+
+    def index(self, x: int, y: int) -> int:
+        """Return the flat index of cell (x, y)."""
+        return y * self.width + x
+
+    def get(self, x: int, y: int) -> int:
+        """Return the bitmask of cell (x, y)."""
+        return self.cells[y * self.width + x]
+
+    def set(self, x: int, y: int, value: int) -> None:
+        """Set the bitmask of cell (x, y)."""
+        self.cells[y * self.width + x] = value
+        self.version += 1
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Return True if (x, y) lies inside the grid."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def copy(self) -> "MazeGrid":
+        """Return an independent copy of the grid."""
+        grid = MazeGrid(self.width, self.height)
+        grid.cells[:] = self.cells
+        return grid
+
+    def row(self, y: int) -> memoryview:
+        """Return a read-only view over row `y`, see `set` for writes."""
+        w = self.width
+        return memoryview(self.cells)[y * w:(y + 1) * w].toreadonly()
+
+    def __getitem__(self, y: int) -> memoryview:
+        return self.row(y)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for y in range(self.height):
+            yield self.row(y)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MazeGrid):
+            return NotImplemented
+        return (self.width == other.width and self.height == other.height
+                and self.cells == other.cells)
+
+    def __repr__(self) -> str:
+        return f"MazeGrid({self.width}x{self.height})"
@@ -4,13 +4,23 @@ import secrets
 from .. import config
 from ..algorithms import stacking as stacking
 from ..algorithms import prim as prim
-from ..utils.mlx_utils import XVar, render_maze_to_mlx
+from ..algorithms import eller as eller
+from ..algorithms import kruskal as kruskal
+from ..algorithms import vectorized as vectorized
+from ..algorithms import tiled as tiled
+from ..algorithms import loops as loops
+from ..utils.mlx_utils import XVar, render_maze_to_mlx, flush_frame
 from ..utils.generate_utils import Bit_position
+from ..utils.maze_grid import MazeGrid
 from .. import exception
 from ..resolve import resolve
-from typing import List
+from ..incremental import DynamicSolver, Wall
+from ..analytics import place_endpoints
+from ..parser import stream_output
+from ..algorithms.steps import Step, StepSource, animate
+from typing import Callable, Generator, List
 
-maze: List[List[int]] = []
+maze: MazeGrid = MazeGrid(0, 0)
 
 ft_symbol = [
     [16, 31, 31, 29, 16, 16, 16],
@@ -21,36 +31,32 @@ ft_symbol = [
 ]
 
 
-def maze_mold(maze: List[List[int]],
-              _config: config.Config) -> List[List[int]]:
+def maze_mold(_config: config.Config) -> MazeGrid:
     """
-    Initialize the maze grid with full walls.
+    Allocate a new maze grid with full walls.
 
     Args:
-        maze (List[List[int]]): The maze structure.
         _config (config.Config): The configuration object.
 
     Returns:
-        List[List[int]]: The initialized maze grid.
+        MazeGrid: The initialized maze grid.
     """
-    maze.clear()
     full_connections = (Bit_position.NORTH.value | Bit_position.EAST.value |
                         Bit_position.SOUTH.value | Bit_position.WEST.value)
-    for _ in range(_config.HEIGHT):
-        maze.append([full_connections for _ in range(_config.WIDTH)])
-    return maze
+    return MazeGrid(_config.WIDTH, _config.HEIGHT, full_connections)
 
 
-def add_symbol(maze: List[List[int]], symbol: List[List[int]]) -> None:
+def add_symbol(maze: MazeGrid, symbol: List[List[int]]) -> None:
     """
     Embed a custom symbol (e.g., '42') into the maze.
 
     Args:
-        maze (List[List[int]]): The maze grid.
+        maze (MazeGrid): The maze grid.
         symbol (List[List[int]]): The symbol pattern to embed (bitmasks).
     """
-    maze_h = len(maze)
-    maze_w = len(maze[0])
+    cells = maze.cells
+    maze_h = maze.height
+    maze_w = maze.width
     sym_h = len(symbol)
     sym_w = len(symbol[0])
     y_start = (maze_h - sym_h) // 2
@@ -58,17 +64,67 @@ def add_symbol(maze: List[List[int]], symbol: List[List[int]]) -> None:
     for y in range(len(symbol)):
         last_x = x_start
         for x in range(len(symbol[y])):
+            i = y_start * maze_w + last_x
             if symbol[y][x] == 16:
-                maze[y_start][last_x] = symbol[y][x]
+                cells[i] = symbol[y][x]
             else:
-                maze[y_start][last_x] = symbol[y][x] & (
-                    ~Bit_position.VISITED.value)
+                cells[i] = symbol[y][x] & (~Bit_position.VISITED.value)
             last_x += 1
         y_start += 1
 
 
-def make_non_perfect(maze: list[list[int]],
-                     path: list[tuple[int, int]]) -> None:
+def symbol_preset(width: int, height: int, symbol: List[List[int]]
+                  ) -> Callable[[int], bytes]:
+    """
+    Return the symbol cells of each row, placed as `add_symbol` does.
+
+    Only rows are built, never the grid, so streamed generators can
+    keep the symbol at O(width) memory.
+
+    Args:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        symbol (List[List[int]]): The symbol pattern (bitmasks).
+
+    Returns:
+        Callable[[int], bytes]: Row y to its preset cells, the symbol
+        cells set to VISITED and the others 0.
+    """
+    y_start = (height - len(symbol)) // 2
+    x_start = (width - len(symbol[0])) // 2
+    blank = bytes(width)
+    rows = {}
+    for dy, pattern in enumerate(symbol):
+        row = bytearray(width)
+        for dx, value in enumerate(pattern):
+            if value == Bit_position.VISITED.value:
+                row[x_start + dx] = value
+        rows[y_start + dy] = bytes(row)
+    return lambda y: rows.get(y, blank)
+
+
+def stream_maze(_config: config.Config) -> bool:
+    """
+    Write a perfect maze to the output file without building its grid.
+
+    Eller's algorithm yields finished rows that are written right away,
+    so memory stays O(WIDTH) whatever the HEIGHT. The solution line is
+    left empty: finding the path needs the whole maze.
+
+    Args:
+        _config (config.Config): The configuration object.
+
+    Returns:
+        bool: True if the file was written.
+    """
+    random.seed(_config.SEED)
+    preset = symbol_preset(_config.WIDTH, _config.HEIGHT, ft_symbol)
+    return stream_output(eller.rows(_config.WIDTH, _config.HEIGHT, preset),
+                         [], _config)
+
+
+def make_non_perfect(maze: MazeGrid,
+                     path: list[tuple[int, int]]) -> list[Wall]:
     """
     Modify the maze to make it non-perfect.
 
@@ -76,11 +132,16 @@ def make_non_perfect(maze: list[list[int]],
     and ensure multiple possible paths exist.
 
     Args:
-        maze (list[list[int]]): The maze grid.
+        maze (MazeGrid): The maze grid.
         path (list[tuple[int, int]]): The solution path coordinates.
+
+    Returns:
+        list[Wall]: The opened walls, for `DynamicSolver.relax`.
     """
-    h = len(maze)
-    w = len(maze[0])
+    cells = maze.cells
+    opened: list[Wall] = []
+    h = maze.height
+    w = maze.width
     loops_added = 0
     target_loops = max(2, min(w, h) // 4)
 
@@ -103,36 +164,72 @@ def make_non_perfect(maze: list[list[int]],
             nx, ny = cx + dx, cy + dy
             if not (0 <= nx < w and 0 <= ny < h):
                 continue
-            if not (maze[cy][cx] & bit_curr) and \
-                    (maze[ny][nx] != 16 and maze[cy][cx] != 16):
-                maze[cy][cx] |= bit_curr
-                maze[ny][nx] |= bit_neigh
+            ci = cy * w + cx
+            ni = ny * w + nx
+            if not (cells[ci] & bit_curr) and \
+                    (cells[ni] != 16 and cells[ci] != 16):
+                cells[ci] |= bit_curr
+                cells[ni] |= bit_neigh
+                opened.append(((cx, cy), (nx, ny)))
                 loops_added += 1
                 break
+    if loops_added:
+        maze.bump_version()
+    return opened
 
 
-def generate_maze(_config: config.Config, xvar: XVar) -> List[List[int]]:
+def select_algorithm(_config: config.Config) -> tiled.Algorithm:
     """
-    Orchestrate the maze generation process.
-
-    Initializes the maze, adds symbols, calls the selected algorithm,
-    and validates entry/exit points.
+    Return the generation function chosen by the configuration.
 
     Args:
         _config (config.Config): The configuration object.
-        xvar (XVar): The graphics context.
 
     Returns:
-        List[List[int]]: The final generated maze.
+        tiled.Algorithm: The generation function to run on the grid.
+    """
+    algo_list: dict[bool, tiled.Algorithm] = {
+        False: prim.generate,
+        True: stacking.generate,
+    }
+    named_algos: dict[str, tiled.Algorithm] = {
+        "eller": eller.generate,
+        "kruskal": kruskal.generate,
+        "binary_tree": vectorized.binary_tree,
+        "sidewinder": vectorized.sidewinder,
+    }
+    return named_algos.get(_config.ALGORITHM, algo_list[_config.PERFECT])
 
-    Raises:
-        exception.ConfigException: If entry/exit points are invalid.
+
+def select_steps(_config: config.Config) -> StepSource:
     """
+    Return the step iterator of the configured generation algorithm.
+
+    Args:
+        _config (config.Config): The configuration object.
+
+    Returns:
+        StepSource: The function yielding the algorithm steps.
+    """
+    algo_list: dict[bool, StepSource] = {
+        False: prim.steps,
+        True: stacking.steps,
+    }
+    named_algos: dict[str, StepSource] = {
+        "eller": eller.steps,
+        "kruskal": kruskal.steps,
+        "binary_tree": vectorized.binary_tree_steps,
+        "sidewinder": vectorized.sidewinder_steps,
+    }
+    return named_algos.get(_config.ALGORITHM, algo_list[_config.PERFECT])
+
+
+def _start_generation(_config: config.Config, xvar: XVar) -> MazeGrid:
+    """Allocate the mold with its symbol, draw it and seed the RNG."""
     global maze
     xvar.show_path = False
-    algo_list = {False: prim, True: stacking}
     xvar.path = []
-    maze = maze_mold(maze, _config)
+    maze = maze_mold(_config)
     add_symbol(maze, ft_symbol)
     if _config.ANIMATION and xvar:
         render_maze_to_mlx(
@@ -143,28 +240,101 @@ def generate_maze(_config: config.Config, xvar: XVar) -> List[List[int]]:
             _config,
             xvar
         )
-    try:
-        random.seed(_config.SEED)
-        print(f"Maze Seed: {_config.SEED}")
-        result: List[List[int]] = algo_list[_config.PERFECT].generate(
-            maze,
-            _config,
-            xvar
-        )
-    except RecursionError:
-        raise exception.MazeException("Grid too large\
-for recursive algorithm.")
-    path = resolve(
-        (_config.ENTRY[0], _config.ENTRY[1]),
-        0,
-        result,
-        None,
-        _config,
-        xvar
-    )
-    if not _config.PERFECT:
-        make_non_perfect(result, xvar.path)
+    random.seed(_config.SEED)
+    print(f"Maze Seed: {_config.SEED}")
+    return maze
+
+
+def _complete_generation(result: MazeGrid, _config: config.Config,
+                         xvar: XVar) -> MazeGrid:
+    """Add loops, place the endpoints and solve the carved maze."""
+    result.bump_version()
+    if _config.ANIMATION and xvar:
+        flush_frame(xvar, _config)
+    inject = not _config.PERFECT and (_config.BRAID > 0
+                                      or _config.LOOP_DENSITY > 0)
+    if inject:
+        loops.inject(result, _config)
+    if _config.PLACEMENT != "fixed":
+        # The placement sweep caches its path for the BFS solver.
+        placed = place_endpoints(result, _config.PLACEMENT == "border")
+        _config.ENTRY = list(placed.start)
+        _config.EXIT = list(placed.end)
+    entry = (_config.ENTRY[0], _config.ENTRY[1])
+    if not _config.PERFECT and not inject:
+        # The few walls opened along the path are repaired into the BFS
+        # tree instead of solving the whole maze a second time.
+        solver = DynamicSolver(result, entry,
+                               (_config.EXIT[0], _config.EXIT[1]))
+        opened = make_non_perfect(result, solver.solution().cells)
+        solver.relax(opened)
+    # Solved last so the cached solution matches the final walls.
+    path = resolve(entry, 0, result, None, _config, xvar, _config.SOLVER)
     if type(path) is not list:
         raise exception.MazeException("Could not find a valid path")
     _config.SEED = secrets.token_hex(8)
     return result
+
+
+def generation_steps(_config: config.Config,
+                     xvar: XVar) -> Generator[Step, None, MazeGrid]:
+    """
+    Run the maze generation process as a resumable iterator.
+
+    Every carving step of the algorithm is yielded, so the caller decides
+    how much work happens at once: the MLX loop hook advances it within
+    a frame budget and closing the iterator cancels the generation.
+    Tiled generation runs in one go.
+
+    Args:
+        _config (config.Config): The configuration object.
+        xvar (XVar): The graphics context.
+
+    Yields:
+        Step: The cells changed by every carving step.
+
+    Returns:
+        MazeGrid: The final generated maze.
+
+    Raises:
+        exception.MazeException: If no valid path can be found.
+    """
+    maze = _start_generation(_config, xvar)
+    if _config.TILE_SIZE > 0:
+        result = tiled.generate(maze, _config, xvar,
+                                select_algorithm(_config))
+    else:
+        yield from animate(select_steps(_config)(maze, _config), maze,
+                           _config, xvar)
+        result = maze
+    return _complete_generation(result, _config, xvar)
+
+
+def generate_maze(_config: config.Config, xvar: XVar) -> MazeGrid:
+    """
+    Orchestrate the maze generation process.
+
+    Initializes the maze, adds symbols, calls the selected algorithm,
+    and validates entry/exit points.
+
+    Args:
+        _config (config.Config): The configuration object.
+        xvar (XVar): The graphics context.
+
+    Returns:
+        MazeGrid: The final generated maze.
+
+    Raises:
+        exception.ConfigException: If entry/exit points are invalid.
+    """
+    maze = _start_generation(_config, xvar)
+    try:
+        algo = select_algorithm(_config)
+        if _config.TILE_SIZE > 0:
+            result = tiled.generate(maze, _config, xvar, algo)
+        else:
+            result = algo(maze, _config, xvar)
+    except RecursionError:
+        raise exception.MazeException("Grid too large\
+for recursive algorithm.")
+    return _complete_generation(result, _config, xvar)
@@ -1,10 +1,443 @@
 """MLX utility functions for the maze generator."""
 from .. import config
 from .. import exception
-from mlx import Mlx
 import time
-from typing import Any, List, Union
+from typing import TYPE_CHECKING, Any, List, Union
 from ..utils.generate_utils import Bit_position
+from ..utils.maze_grid import MazeGrid
+
+if TYPE_CHECKING:
+    from mlx import Mlx
+    from .tasks import GenerationTask
+
+
+# Pixel classes of the index buffer, which are also the Config.COLORS
+# keys, with their default colors.
+EMPTY, WALL, SYMBOL, START, END, PATH = range(6)
+DEFAULT_COLORS = (0xFFFFFF, 0x000000, 0xFF0000, 0x00FF00, 0x0000FF,
+                  0x00FF00)
+# Background kinds of a cell tile and their pixel class.
+PASSAGE, ISOLATED, START_TILE, END_TILE = range(4)
+BACKGROUNDS = (EMPTY, SYMBOL, START, END)
+# Tile key of a cell: kind * 16 + wall mask, cells without opening are
+# isolated (symbol) tiles.
+TILE_KEYS = bytes((cell & 15) or ISOLATED * 16 for cell in range(256))
+
+
+def is_wall_pixel(mask: int, dx: int, dy: int, scale: int,
+                  border_thick: int) -> bool:
+    """
+    Tell whether pixel (dx, dy) of a cell tile belongs to a closed wall.
+
+    Args:
+        mask (int): The cell wall mask.
+        dx (int): Pixel column inside the tile.
+        dy (int): Pixel row inside the tile.
+        scale (int): Tile side in pixels.
+        border_thick (int): Wall thickness in pixels.
+
+    Returns:
+        bool: True for a wall pixel.
+    """
+    return (dy < border_thick and not mask & Bit_position.NORTH.value
+            or dx >= scale - border_thick
+            and not mask & Bit_position.EAST.value
+            or dy >= scale - border_thick
+            and not mask & Bit_position.SOUTH.value
+            or dx < border_thick and not mask & Bit_position.WEST.value)
+
+
+class TileSet:
+    """
+    Pre-rendered pixel class rows of every cell tile for one scale.
+
+    A tile is identified by its key (see TILE_KEYS); `rows[dy][key]` is
+    row `dy` of that tile as one class byte per pixel, so drawing a cell
+    is `scale` slice copies and drawing a maze row is one join per pixel
+    row. Tiles hold no color, the palette is applied by the Framebuffer.
+
+    Attributes:
+        scale (int): Tile side in pixels.
+        rows (list[list[bytes]]): Tile rows, by pixel row then tile key.
+    """
+
+    def __init__(self, scale: int) -> None:
+        """
+        Render the 16 wall masks for each background kind.
+
+        Args:
+            scale (int): Tile side in pixels.
+        """
+        self.scale = scale
+        border_thick = max(1, scale // 5)
+        self.rows = [[b""] * (len(BACKGROUNDS) * 16) for _ in range(scale)]
+        for kind, background in enumerate(BACKGROUNDS):
+            for mask in range(16):
+                for dy in range(scale):
+                    self.rows[dy][kind * 16 + mask] = bytes(
+                        WALL if is_wall_pixel(mask, dx, dy, scale,
+                                              border_thick)
+                        else background for dx in range(scale))
+
+    def stamp(self, frame: "Framebuffer", mx: int, my: int,
+              key: int) -> None:
+        """
+        Copy one tile into a framebuffer and color it.
+
+        Args:
+            frame (Framebuffer): The image and its class buffer.
+            mx (int): Cell column.
+            my (int): Cell row.
+            key (int): Tile key.
+        """
+        off = my * self.scale * frame.width + mx * self.scale
+        classes = frame.classes
+        for rows in self.rows:
+            classes[off:off + self.scale] = rows[key]
+            frame.expand(off, self.scale)
+            off += frame.width
+
+    def draw(self, classes: bytearray, keys: Union[bytes, bytearray],
+             width: int) -> None:
+        """
+        Draw a whole grid of tiles, one joined line per pixel row.
+
+        Args:
+            classes (bytearray): The class buffer, one byte per pixel.
+            keys (bytes | bytearray): Tile key of every cell, row-major.
+            width (int): Cells per row.
+        """
+        size = width * self.scale
+        lookups = [rows.__getitem__ for rows in self.rows]
+        off = 0
+        for y in range(0, len(keys), width):
+            row = keys[y:y + width]
+            for lookup in lookups:
+                classes[off:off + size] = b"".join(map(lookup, row))
+                off += size
+
+
+class Palette:
+    """
+    A Config.COLORS palette compiled into lookup tables.
+
+    `lanes[k]` maps a pixel class to byte `k` of its little-endian BGRA
+    color, so a class buffer becomes image bytes with four
+    `bytes.translate` calls, whatever its size.
+
+    Attributes:
+        pixels (tuple[bytes, ...]): The 4-byte color of every class.
+        lanes (tuple[bytes, ...]): One 256-byte translate table per byte
+            of a pixel.
+    """
+
+    def __init__(self, colors: dict[int, int]) -> None:
+        """
+        Compile a palette.
+
+        Args:
+            colors (dict[int, int]): The palette, from Config.COLORS.
+        """
+        self.pixels = tuple(colors.get(key, default).to_bytes(4, 'little')
+                            for key, default in enumerate(DEFAULT_COLORS))
+        self.lanes = tuple(
+            bytes(self.pixels[c][k] if c < len(self.pixels) else 0
+                  for c in range(256)) for k in range(4))
+
+    def expand(self, classes: Union[bytes, bytearray]) -> bytearray:
+        """
+        Return the image bytes of a run of pixel classes.
+
+        Args:
+            classes (bytes | bytearray): One class byte per pixel.
+
+        Returns:
+            bytearray: Four bytes per pixel.
+        """
+        out = bytearray(len(classes) * 4)
+        for k, lane in enumerate(self.lanes):
+            out[k::4] = classes.translate(lane)
+        return out
+
+
+def compile_palettes(colors: list[dict[int, int]]) -> list[Palette]:
+    """
+    Compile every palette of Config.COLORS.
+
+    Args:
+        colors (list[dict[int, int]]): The palettes.
+
+    Returns:
+        list[Palette]: The compiled palettes, in the same order.
+    """
+    return [Palette(palette) for palette in colors]
+
+
+class Framebuffer:
+    """
+    An MLX image with the pixel class of every pixel alongside it.
+
+    Drawing writes classes, then expands the touched runs through the
+    palette into the image; changing the palette re-expands the whole
+    class buffer without redrawing any geometry.
+
+    Attributes:
+        classes (bytearray): One class byte per pixel, row-major.
+        data (Any): The MLX image buffer.
+        width (int): Image width in pixels.
+        sl (int): Bytes per image line.
+        palette (Palette): The palette applied to the classes.
+    """
+
+    def __init__(self, data: Any, width: int, height: int, sl: int,
+                 palette: Palette) -> None:
+        """
+        Create an empty class buffer for an image.
+
+        Args:
+            data (Any): The MLX image buffer.
+            width (int): Image width in pixels.
+            height (int): Image height in pixels.
+            sl (int): Bytes per image line.
+            palette (Palette): The palette applied to the classes.
+        """
+        self.classes = bytearray(width * height)
+        self.data = data
+        self.width = width
+        self.sl = sl
+        self.palette = palette
+
+    def expand(self, off: int, size: int) -> None:
+        """
+        Color a run of pixels inside one image row.
+
+        Args:
+            off (int): Pixel offset of the run in the class buffer.
+            size (int): Pixels in the run.
+        """
+        y, x = divmod(off, self.width)
+        start = y * self.sl + x * 4
+        self.data[start:start + size * 4] = self.palette.expand(
+            self.classes[off:off + size])
+
+    def refresh(self, palette: Palette | None = None) -> None:
+        """
+        Color the whole image, optionally switching palette first.
+
+        Args:
+            palette (Palette | None): The new palette, None to keep it.
+        """
+        if palette is not None:
+            self.palette = palette
+        row = self.width * 4
+        if self.sl == row:
+            size = len(self.classes) * 4
+            self.data[:size] = self.palette.expand(self.classes)
+            return
+        for off in range(0, len(self.classes), self.width):
+            self.expand(off, self.width)
+
+
+class PathOverlay:
+    """
+    The solution path as pixel spans painted over the maze image.
+
+    A span is one horizontal run of path pixels, as (pixel offset, pixel
+    count) in the class buffer; runs that touch on the same row are
+    merged, so a straight corridor costs one span per pixel row.
+    Painting saves the covered classes first and erasing copies them
+    back, so toggling the path costs O(path pixels) and never touches
+    the rest of the image.
+
+    Attributes:
+        spans (list[tuple[int, int]]): Path pixel runs, by offset.
+        saved (list[bytes]): Classes under every span while painted.
+        painted (bool): Whether the path is currently on the image.
+    """
+
+    def __init__(self, spans: list[tuple[int, int]]) -> None:
+        """
+        Hold precomputed spans, not painted yet.
+
+        Args:
+            spans (list[tuple[int, int]]): Path pixel runs, by offset.
+        """
+        self.spans = spans
+        self.saved: list[bytes] = []
+        self.painted = False
+
+    def paint(self, frame: Framebuffer) -> None:
+        """
+        Save the spans' classes and mark them as path pixels.
+
+        Args:
+            frame (Framebuffer): The image and its class buffer.
+        """
+        if self.painted:
+            return
+        classes = frame.classes
+        self.saved = [bytes(classes[off:off + size])
+                      for off, size in self.spans]
+        path = bytes((PATH,))
+        for off, size in self.spans:
+            classes[off:off + size] = path * size
+            frame.expand(off, size)
+        self.painted = True
+
+    def erase(self, frame: Framebuffer) -> None:
+        """
+        Restore the saved classes of the spans.
+
+        Args:
+            frame (Framebuffer): The image and its class buffer.
+        """
+        if not self.painted:
+            return
+        for (off, size), background in zip(self.spans, self.saved):
+            frame.classes[off:off + size] = background
+            frame.expand(off, size)
+        self.saved = []
+        self.painted = False
+
+
+def path_spans(path: List[tuple[int, int]], maze: MazeGrid,
+               scale: int) -> list[tuple[int, int]]:
+    """
+    Compute the pixel runs of a path, walls of its cells excluded.
+
+    The pixels a path cell covers are the tile minus its closed walls,
+    which is a rectangle, so each of its pixel rows is a single run.
+
+    Args:
+        path (List[tuple[int, int]]): The path cells.
+        maze (MazeGrid): The maze the path goes through.
+        scale (int): Tile side in pixels.
+
+    Returns:
+        list[tuple[int, int]]: Merged (pixel offset, pixel count) runs in
+        the class buffer, sorted by offset.
+    """
+    border_thick = max(1, scale // 5)
+    far = scale - border_thick
+    w = maze.width
+    line = w * scale
+    cells = maze.cells
+    runs = []
+    for px, py in path:
+        mask = cells[py * w + px]
+        left = 0 if mask & Bit_position.WEST.value else border_thick
+        right = scale if mask & Bit_position.EAST.value else far
+        top = 0 if mask & Bit_position.NORTH.value else border_thick
+        bottom = scale if mask & Bit_position.SOUTH.value else far
+        off = (py * scale + top) * line + px * scale + left
+        for _ in range(top, bottom):
+            runs.append((off, right - left))
+            off += line
+    runs.sort()
+    spans: list[tuple[int, int]] = []
+    for off, size in runs:
+        if spans and spans[-1][0] + spans[-1][1] >= off \
+                and spans[-1][0] // line == off // line:
+            last, length = spans[-1]
+            spans[-1] = (last, max(length, off + size - last))
+        else:
+            spans.append((off, size))
+    return spans
+
+
+class FrameScheduler:
+    """
+    Batches animated cell updates into frames.
+
+    Updates only mark cells dirty; a frame stamps the dirty cells and
+    pushes the image to the window once. With a cells-per-frame budget a
+    frame is pushed every `cells_per_frame` dirty cells and lasts at
+    least 1 / fps seconds, so the animation speed is fixed: the scheduler
+    never sleeps itself, the driver checks `throttled` and either waits
+    (synchronous runs) or yields to the MLX loop (background tasks).
+    Without a budget, generation runs at full speed and a frame is pushed
+    whenever 1 / fps seconds have passed.
+
+    Attributes:
+        frame_time (float): Minimum seconds between two frames.
+        cells_per_frame (int): Dirty cells per frame, 0 for time-based.
+        dirty (dict[int, int]): Latest value of every dirty cell, by flat
+            index.
+        frames (int): Frames pushed so far.
+    """
+
+    def __init__(self, fps: float, cells_per_frame: int) -> None:
+        """
+        Create an empty scheduler.
+
+        Args:
+            fps (float): Target frames per second.
+            cells_per_frame (int): Dirty cells per frame, 0 to push
+                frames on time only.
+        """
+        self.frame_time = 1 / fps
+        self.cells_per_frame = cells_per_frame
+        self.dirty: dict[int, int] = {}
+        self.frames = 0
+        self.last = time.perf_counter()
+
+    def add(self, xvar: "XVar", i: int, val: int,
+            _config: config.Config) -> None:
+        """
+        Mark flat cell `i` dirty and push a frame if one is due.
+
+        Args:
+            xvar (XVar): The graphics context.
+            i (int): Flat index of the cell.
+            val (int): The new cell value.
+            _config (config.Config): The configuration instance.
+        """
+        self.dirty[i] = val
+        if self.cells_per_frame:
+            if len(self.dirty) >= self.cells_per_frame:
+                self.flush(xvar, _config)
+        elif time.perf_counter() - self.last >= self.frame_time:
+            self.flush(xvar, _config)
+
+    def throttled(self) -> bool:
+        """
+        Tell whether the current frame of a cells-per-frame budget is on.
+
+        Returns:
+            bool: True until 1 / fps seconds have passed since the last
+            frame, always False without a budget.
+        """
+        return bool(self.cells_per_frame) and \
+            time.perf_counter() < self.last + self.frame_time
+
+    def wait(self) -> None:
+        """Sleep until the current frame is over, if throttled."""
+        if self.cells_per_frame:
+            wait = self.last + self.frame_time - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+
+    def flush(self, xvar: "XVar", _config: config.Config) -> None:
+        """
+        Stamp the dirty cells and push the image to the window.
+
+        Args:
+            xvar (XVar): The graphics context.
+            _config (config.Config): The configuration instance.
+        """
+        frame = xvar.frame
+        if self.dirty and frame is not None:
+            w = _config.WIDTH
+            tiles = get_tiles(xvar, cell_scale(xvar, _config))
+            for i, val in self.dirty.items():
+                x, y = i % w, i // w
+                tiles.stamp(frame, x, y, tile_key(x, y, val, _config))
+            self.dirty.clear()
+            xvar.mlx.mlx_put_image_to_window(xvar.mlx_ptr, xvar.win_1,
+                                             xvar.img, 0, 0)
+            xvar.mlx.mlx_do_sync(xvar.mlx_ptr)
+            self.frames += 1
+        self.last = time.perf_counter()
 
 
 class XVar:
@@ -21,17 +454,22 @@ class XVar:
         self.win_2 = None
         self.imgidx = 0
         self.color_palette = 0
-        self.maze_data: List[List[int]] = []
+        self.maze_data: MazeGrid = MazeGrid(0, 0)
         self.path: List[tuple[int, int]] = []
         self.show_path = False
         self.img = None
-        self.path_img = None
+        self.overlay: PathOverlay | None = None
         self.img_data = None
         self.img_bpp = 0
         self.img_sl = 0
         self.img_format = 0
         self.img_w = 0
         self.img_h = 0
+        self.tiles: dict[int, TileSet] = {}
+        self.palettes: list[Palette] = []
+        self.frame: Framebuffer | None = None
+        self.scheduler: FrameScheduler | None = None
+        self.task: "GenerationTask | None" = None
 
 
 def manage_close(xvar: XVar) -> None:
@@ -89,6 +527,76 @@ required_height, cell_size).
     return win_w, win_h, scale
 
 
+def cell_scale(xvar: XVar, _config: config.Config) -> int:
+    """
+    Return the tile side in pixels for the current screen.
+
+    Args:
+        xvar (XVar): The graphics context.
+        _config (config.Config): The configuration instance.
+
+    Returns:
+        int: The scale, at most 16.
+    """
+    screen_w = xvar.screen_w if xvar.screen_w else 1920
+    screen_h = xvar.screen_h if xvar.screen_h else 1080
+    return calculate_window_size(_config, screen_w, screen_h)[2]
+
+
+def get_tiles(xvar: XVar, scale: int) -> TileSet:
+    """
+    Return the tile set of a scale, rendering it once.
+
+    Args:
+        xvar (XVar): The graphics context.
+        scale (int): Tile side in pixels.
+
+    Returns:
+        TileSet: The cached tile set.
+    """
+    tiles = xvar.tiles.get(scale)
+    if tiles is None:
+        tiles = TileSet(scale)
+        xvar.tiles[scale] = tiles
+    return tiles
+
+
+def get_palette(xvar: XVar, _config: config.Config) -> Palette:
+    """
+    Return the current compiled palette, compiling them all if needed.
+
+    Args:
+        xvar (XVar): The graphics context.
+        _config (config.Config): The configuration instance.
+
+    Returns:
+        Palette: The palette at `xvar.color_palette`.
+    """
+    if not xvar.palettes:
+        xvar.palettes = compile_palettes(_config.COLORS)
+    return xvar.palettes[xvar.color_palette]
+
+
+def tile_key(mx: int, my: int, mask: int, _config: config.Config) -> int:
+    """
+    Return the tile key of a cell, entry and exit taking precedence.
+
+    Args:
+        mx (int): Cell column.
+        my (int): Cell row.
+        mask (int): The cell value.
+        _config (config.Config): The configuration instance.
+
+    Returns:
+        int: The tile key.
+    """
+    if mx == _config.ENTRY[0] and my == _config.ENTRY[1]:
+        return START_TILE * 16 + (mask & 15)
+    if mx == _config.EXIT[0] and my == _config.EXIT[1]:
+        return END_TILE * 16 + (mask & 15)
+    return TILE_KEYS[mask & 0xFF]
+
+
 def manage_expose(xvar: XVar) -> None:
     """
     Manage the expose event to render the image.
@@ -96,20 +604,18 @@ def manage_expose(xvar: XVar) -> None:
     Args:
         xvar (XVar): The graphics context.
     """
-    target_img = xvar.path_img if (
-        xvar.show_path and xvar.path_img) else xvar.img
-    if target_img:
+    if xvar.img:
         xvar.mlx.mlx_put_image_to_window(
             xvar.mlx_ptr,
             xvar.win_1,
-            target_img,
+            xvar.img,
             0,
             0
         )
 
 
-def render_maze_to_mlx(mlx: Mlx, mlx_ptr: Any, win_ptr: Any,
-                       maze: List[List[int]],
+def render_maze_to_mlx(mlx: "Mlx", mlx_ptr: Any, win_ptr: Any,
+                       maze: MazeGrid,
                        _config: config.Config, xvar: XVar) -> None:
     """
     Render the maze to the MLX window.
@@ -118,28 +624,13 @@ def render_maze_to_mlx(mlx: Mlx, mlx_ptr: Any, win_ptr: Any,
         mlx (Mlx): The MLX instance.
         mlx_ptr (Any): The MLX pointer.
         win_ptr (Any): The window pointer.
-        maze (List[List[int]]): The maze data.
+        maze (MazeGrid): The maze data.
         _config (config.Config): The configuration instance.
         xvar (XVar): The graphics context.
     """
-    if xvar.path_img:
-        mlx.mlx_destroy_image(mlx_ptr, xvar.path_img)
-        xvar.path_img = None
+    xvar.overlay = None
 
-    try:
-        screen_w = xvar.screen_w if xvar.screen_w else 1920
-        screen_h = xvar.screen_h if xvar.screen_h else 1080
-    except Exception:
-        screen_w = 1920
-        screen_h = 1080
-
-    avail_w = screen_w - 250
-    avail_h = screen_h
-
-    scale_x = max(1, avail_w // _config.WIDTH)
-    scale_y = max(1, avail_h // _config.HEIGHT)
-    scale = min(scale_x, scale_y, 16)
-    border_thick = max(1, scale // 5)
+    scale = cell_scale(xvar, _config)
 
     img_w = _config.WIDTH * scale
     img_h = _config.HEIGHT * scale
@@ -154,59 +645,19 @@ rendering")
 
     data, bpp, sl, fmt = mlx.mlx_get_data_addr(img)
 
-    wall_bytes = _config.COLORS[xvar.color_palette].get(
-        1, 0x000000).to_bytes(4, 'little')
-    path_bytes = _config.COLORS[xvar.color_palette].get(
-        0, 0xFFFFFF).to_bytes(4, 'little')
-    isolated_bytes = _config.COLORS[xvar.color_palette].get(
-        2, 0xFF0000).to_bytes(4, 'little')
-    start_bytes = _config.COLORS[xvar.color_palette].get(
-        3, 0x00FF00).to_bytes(4, 'little')
-    end_bytes = _config.COLORS[xvar.color_palette].get(
-        4, 0x0000FF).to_bytes(4, 'little')
-
-    for my in range(_config.HEIGHT):
-        for mx in range(_config.WIDTH):
-            cell = maze[my][mx]
-            is_isolated = (cell & 15) == 0
-
-            if mx == _config.ENTRY[0] and my == _config.ENTRY[1]:
-                bg_bytes = start_bytes
-            elif mx == _config.EXIT[0] and my == _config.EXIT[1]:
-                bg_bytes = end_bytes
-            elif is_isolated:
-                bg_bytes = isolated_bytes
-            else:
-                bg_bytes = path_bytes
-
-            start_y = my * scale
-            start_x = mx * scale
-            for dy in range(scale):
-                py = start_y + dy
-                row_off = py * sl
-                for dx in range(scale):
-                    px = start_x + dx
-                    off = row_off + px * 4
-                    if off + 4 <= len(data):
-                        is_wall = False
-                        if dy < border_thick and not (
-                                cell & Bit_position.NORTH.value):
-                            is_wall = True
-                        elif dx >= scale - border_thick and not (
-                                cell & Bit_position.EAST.value):
-                            is_wall = True
-                        elif dy >= scale - border_thick and not (
-                                cell & Bit_position.SOUTH.value):
-                            is_wall = True
-                        elif dx < border_thick and not (
-                                cell & Bit_position.WEST.value):
-                            is_wall = True
-                        if is_wall:
-                            data[off:off+4] = wall_bytes
-                        else:
-                            data[off:off+4] = bg_bytes
+    w = _config.WIDTH
+    keys = bytearray(maze.cells.translate(TILE_KEYS))
+    for x, y in (_config.ENTRY, _config.EXIT):
+        if 0 <= x < w and 0 <= y < _config.HEIGHT:
+            keys[y * w + x] = tile_key(x, y, maze.cells[y * w + x], _config)
+    frame = Framebuffer(data, img_w, img_h, sl, get_palette(xvar, _config))
+    get_tiles(xvar, scale).draw(frame.classes, keys, w)
+    frame.refresh()
+    if xvar.scheduler is not None:
+        xvar.scheduler.dirty.clear()
 
     xvar.img = img
+    xvar.frame = frame
     xvar.img_data = data
     xvar.img_bpp = bpp
     xvar.img_sl = sl
@@ -216,13 +667,10 @@ rendering")
 
     mlx.mlx_put_image_to_window(mlx_ptr, win_ptr, img, 0, 0)
 
-    if hasattr(_config, 'DELAY') and _config.DELAY > 0:
-        time.sleep(_config.DELAY)
-
 
 def create_path_image(xvar: XVar, _config: config.Config) -> None:
     """
-    Create a secondary image that includes the solution path.
+    Compute the solution path overlay, painting it if the path is shown.
 
     Args:
         xvar (XVar): The graphics context.
@@ -232,41 +680,48 @@ def create_path_image(xvar: XVar, _config: config.Config) -> None:
         return
 
     scale = xvar.img_w // _config.WIDTH
-    border_thick = max(1, scale // 5)
-    sl = xvar.img_sl
-    xvar.path_img = xvar.mlx.mlx_new_image(
-        xvar.mlx_ptr, xvar.img_w, xvar.img_h)
-    src_data = xvar.img_data
-    dst_data, _, _, _ = xvar.mlx.mlx_get_data_addr(xvar.path_img)
-
-    dst_data[:] = src_data[:]
-    path_color = _config.COLORS[xvar.color_palette].get(
-        5, 0x00FF00).to_bytes(4, 'little')
-    for px, py in xvar.path:
-        start_y = py * scale
-        start_x = px * scale
-        cell_mask = xvar.maze_data[py][px]
-        for dy in range(scale):
-            row_off = (start_y + dy) * sl
-            for dx in range(scale):
-                if (dy < border_thick and
-                        not (cell_mask & Bit_position.NORTH.value)):
-                    continue
-
-                if (dx >= scale - border_thick and
-                        not (cell_mask & Bit_position.EAST.value)):
-                    continue
-
-                if (dy >= scale - border_thick and
-                        not (cell_mask & Bit_position.SOUTH.value)):
-                    continue
-
-                if (dx < border_thick and
-                        not (cell_mask & Bit_position.WEST.value)):
-                    continue
-                off = row_off + (start_x + dx) * 4
-                if off + 4 <= len(dst_data):
-                    dst_data[off:off+4] = path_color
+    xvar.overlay = PathOverlay(path_spans(xvar.path, xvar.maze_data, scale))
+    if xvar.show_path:
+        show_path_overlay(xvar, _config, True)
+
+
+def show_path_overlay(xvar: XVar, _config: config.Config,
+                      status: bool) -> None:
+    """
+    Paint or erase the path overlay on the maze image and show it.
+
+    Args:
+        xvar (XVar): The graphics context.
+        _config (config.Config): The configuration object.
+        status (bool): True to paint the path, False to erase it.
+    """
+    overlay = xvar.overlay
+    if overlay is None or xvar.frame is None:
+        return
+    if status:
+        overlay.paint(xvar.frame)
+    else:
+        overlay.erase(xvar.frame)
+    xvar.mlx.mlx_put_image_to_window(xvar.mlx_ptr, xvar.win_1, xvar.img,
+                                     0, 0)
+
+
+def recolor_maze(xvar: XVar, _config: config.Config) -> None:
+    """
+    Apply the current palette to the maze image and show it.
+
+    Only the class buffer is expanded again: walls, symbol, endpoints and
+    a painted path keep their pixels.
+
+    Args:
+        xvar (XVar): The graphics context.
+        _config (config.Config): The configuration object.
+    """
+    if xvar.frame is None:
+        return
+    xvar.frame.refresh(get_palette(xvar, _config))
+    xvar.mlx.mlx_put_image_to_window(xvar.mlx_ptr, xvar.win_1, xvar.img,
+                                     0, 0)
 
 
 def update_cell(xvar: XVar, mx: int, my: int, val: Union[int, List[int]],
@@ -274,6 +729,8 @@ def update_cell(xvar: XVar, mx: int, my: int, val: Union[int, List[int]],
     """
     Update a single cell in the maze rendering.
 
+    The cell is drawn and shown with the next frame of the scheduler.
+
     Args:
         xvar (XVar): The graphics context.
         mx (int): The x-coordinate of the cell.
@@ -281,77 +738,51 @@ def update_cell(xvar: XVar, mx: int, my: int, val: Union[int, List[int]],
         val (Union[int, List[int]]): The new value (int mask).
         _config (config.Config): The configuration instance.
     """
-    if not xvar or not xvar.img_data:
+    if not xvar or xvar.frame is None:
         return
 
-    try:
-        screen_w = xvar.screen_w if xvar.screen_w else 1920
-        screen_h = xvar.screen_h if xvar.screen_h else 1080
-    except Exception:
-        screen_w = 1920
-        screen_h = 1080
+    if xvar.scheduler is None:
+        xvar.scheduler = FrameScheduler(_config.ANIMATION_FPS,
+                                        _config.CELLS_PER_FRAME)
+    mask = val if isinstance(val, int) else 0
+    xvar.scheduler.add(xvar, my * _config.WIDTH + mx, mask, _config)
 
-    avail_w = screen_w - 250
-    avail_h = screen_h
 
-    scale_x = max(1, avail_w // _config.WIDTH)
-    scale_y = max(1, avail_h // _config.HEIGHT)
-    scale = min(scale_x, scale_y, 16)
-    border_thick = max(1, scale // 5)
+def frame_throttled(xvar: XVar) -> bool:
+    """
+    Tell whether animation must pause until the next frame.
 
-    data = xvar.img_data
-    sl = xvar.img_sl
-    start_y = my * scale
-    start_x = mx * scale
-
-    wall_bytes = _config.COLORS[xvar.color_palette].get(
-        1, 0x000000).to_bytes(4, 'little')
-    path_bytes = _config.COLORS[xvar.color_palette].get(
-        0, 0xFFFFFF).to_bytes(4, 'little')
-    isolated_bytes = _config.COLORS[xvar.color_palette].get(
-        2, 0xFF0000).to_bytes(4, 'little')
-    start_bytes = _config.COLORS[xvar.color_palette].get(
-        3, 0x00FF00).to_bytes(4, 'little')
-    end_bytes = _config.COLORS[xvar.color_palette].get(
-        4, 0x0000FF).to_bytes(4, 'little')
+    Args:
+        xvar (XVar): The graphics context.
 
-    mask = val if isinstance(val, int) else 0
-    is_isolated = (mask & 15) == 0
+    Returns:
+        bool: True while the cells-per-frame budget is used up.
+    """
+    return bool(xvar) and xvar.scheduler is not None \
+        and xvar.scheduler.throttled()
 
-    if mx == _config.ENTRY[0] and my == _config.ENTRY[1]:
-        bg_bytes = start_bytes
-    elif mx == _config.EXIT[0] and my == _config.EXIT[1]:
-        bg_bytes = end_bytes
-    elif is_isolated:
-        bg_bytes = isolated_bytes
-    else:
-        bg_bytes = path_bytes
-    for dy in range(scale):
-        py = start_y + dy
-        row_off = py * sl
-        for dx in range(scale):
-            px = start_x + dx
-            off = row_off + px * 4
-            if off + 4 <= len(data):
-                is_wall = False
-                if dy < border_thick and not (mask & Bit_position.NORTH.value):
-                    is_wall = True
-                elif (dx >= scale - border_thick and
-                        not (mask & Bit_position.EAST.value)):
-                    is_wall = True
-                elif (dy >= scale - border_thick and
-                        not (mask & Bit_position.SOUTH.value)):
-                    is_wall = True
-                elif dx < border_thick and not \
-                        (mask & Bit_position.WEST.value):
-                    is_wall = True
-
-                if is_wall:
-                    data[off:off+4] = wall_bytes
-                else:
-                    data[off:off+4] = bg_bytes
-
-    xvar.mlx.mlx_put_image_to_window(xvar.mlx_ptr, xvar.win_1, xvar.img, 0, 0)
+
+def wait_frame(xvar: XVar) -> None:
+    """
+    Sleep until the next frame may start, for synchronous animation.
+
+    Args:
+        xvar (XVar): The graphics context.
+    """
+    if xvar and xvar.scheduler is not None:
+        xvar.scheduler.wait()
+
+
+def flush_frame(xvar: XVar, _config: config.Config) -> None:
+    """
+    Push the cell updates still waiting for a frame.
+
+    Args:
+        xvar (XVar): The graphics context.
+        _config (config.Config): The configuration instance.
+    """
+    if xvar and xvar.scheduler is not None and xvar.frame is not None:
+        xvar.scheduler.flush(xvar, _config)
 
 
 __all__ = ["Bit_position"]
@@ -0,0 +1,188 @@
+"""Background maze generation driven by the MLX loop hook."""
+import time
+from .. import config
+from .. import exception
+from ..algorithms.steps import Step, finish
+from ..utils.mlx_utils import XVar, render_maze_to_mlx, \
+    create_path_image, frame_throttled
+from ..utils.maze_grid import MazeGrid
+from ..utils.maze_utils import generation_steps
+from typing import Callable, Generator
+
+# Steps run between two clock reads.
+CHECK_EVERY = 64
+# Seconds the loop hook sleeps when there is nothing to advance, so the
+# idle MLX loop does not spin.
+IDLE_WAIT = 1 / 60
+
+
+class GenerationTask:
+    """
+    A generation iterator advanced a little at a time.
+
+    Attributes:
+        steps (Generator): The generation steps, returning the maze.
+        budget (float): Seconds of work per `advance` call.
+        on_done (Callable[[MazeGrid], None]): Called with the finished
+            maze.
+        throttled (Callable[[], bool] | None): Tells when the animation
+            frame budget is used up, so `advance` returns early.
+        running (bool): False once finished or cancelled.
+        result (MazeGrid | None): The finished maze.
+    """
+
+    def __init__(self, steps: Generator[Step, None, MazeGrid], budget: float,
+                 on_done: Callable[[MazeGrid], None],
+                 throttled: Callable[[], bool] | None = None) -> None:
+        """
+        Wrap a generation iterator.
+
+        Args:
+            steps (Generator): The generation steps, returning the maze.
+            budget (float): Seconds of work per `advance` call.
+            on_done (Callable[[MazeGrid], None]): Called with the
+                finished maze.
+            throttled (Callable[[], bool] | None): Tells when the
+                animation frame budget is used up.
+        """
+        self.steps = steps
+        self.budget = budget
+        self.on_done = on_done
+        self.throttled = throttled
+        self.running = True
+        self.result: MazeGrid | None = None
+
+    def advance(self) -> bool:
+        """
+        Run steps until the time budget is spent or the maze is done.
+
+        At least `CHECK_EVERY` steps run per call, so the generation
+        always progresses, unless the animation frame budget is used up:
+        then the call stops right away and the next one carries on once
+        the frame is over, instead of sleeping in the MLX loop.
+
+        Returns:
+            bool: True once the task is no longer running.
+        """
+        if not self.running:
+            return True
+        steps = self.steps
+        throttled = self.throttled
+        if throttled is not None and throttled():
+            return False
+        deadline = time.perf_counter() + self.budget
+        try:
+            while True:
+                for _ in range(CHECK_EVERY):
+                    next(steps)
+                    if throttled is not None and throttled():
+                        return False
+                if time.perf_counter() >= deadline:
+                    break
+        except StopIteration as stop:
+            self.running = False
+            self.result = stop.value
+            self.on_done(stop.value)
+        return not self.running
+
+    def run(self) -> MazeGrid:
+        """
+        Run the remaining steps at full speed, as headless mode does.
+
+        Returns:
+            MazeGrid: The finished maze.
+        """
+        self.result = finish(self.steps)
+        self.running = False
+        self.on_done(self.result)
+        return self.result
+
+    def cancel(self) -> None:
+        """Stop the generation, leaving the partial maze unused."""
+        if self.running:
+            self.steps.close()
+            self.running = False
+
+
+def manage_loop(xvar: XVar) -> int:
+    """
+    MLX loop hook advancing the current generation task.
+
+    The hook is installed once and never replaced, since MLX would free
+    the running callback if it were changed from inside it. With no task
+    it sleeps for a frame so the idle loop does not busy-wait.
+
+    Args:
+        xvar (XVar): The graphics context.
+
+    Returns:
+        int: Always 0, as MLX hooks expect.
+    """
+    task = xvar.task
+    if task is None:
+        time.sleep(IDLE_WAIT)
+        return 0
+    try:
+        done = task.advance()
+    except exception.MazeException as e:
+        task.cancel()
+        exception.display_errors(f"Maze generation failed: {e.args[0]}")
+        done = True
+    if done:
+        xvar.task = None
+    return 0
+
+
+def start_generation(_config: config.Config, xvar: XVar) -> GenerationTask:
+    """
+    Generate a new maze in the background of the MLX loop.
+
+    The window keeps handling events while the maze is carved; the
+    current maze stays on screen until the new one is finished, unless
+    the carving is animated.
+
+    Args:
+        _config (config.Config): The configuration object.
+        xvar (XVar): The graphics context.
+
+    Returns:
+        GenerationTask: The scheduled task.
+    """
+    cancel_generation(_config, xvar)
+
+    def done(maze: MazeGrid) -> None:
+        xvar.maze_data = maze
+        render_maze_to_mlx(xvar.mlx, xvar.mlx_ptr, xvar.win_1, maze,
+                           _config, xvar)
+        create_path_image(xvar, _config)
+
+    task = GenerationTask(generation_steps(_config, xvar),
+                          1 / _config.ANIMATION_FPS, done,
+                          lambda: frame_throttled(xvar))
+    xvar.task = task
+    return task
+
+
+def cancel_generation(_config: config.Config, xvar: XVar) -> bool:
+    """
+    Cancel the background generation and show the previous maze again.
+
+    Args:
+        _config (config.Config): The configuration object.
+        xvar (XVar): The graphics context.
+
+    Returns:
+        bool: True if a generation was running.
+    """
+    task = xvar.task
+    if task is None or not task.running:
+        return False
+    task.cancel()
+    xvar.task = None
+    maze = xvar.maze_data
+    solution = maze.solution
+    xvar.path = list(solution.cells) if solution is not None else []
+    render_maze_to_mlx(xvar.mlx, xvar.mlx_ptr, xvar.win_1, maze, _config,
+                       xvar)
+    create_path_image(xvar, _config)
+    return True
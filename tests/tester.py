@@ -1,4 +1,6 @@
 import sys
+import random
+import time
 import os
 from typing import Any
 import pytest
@@ -10,6 +12,20 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from src.mazegen.utils import maze_utils  # noqa: E402
 from src.mazegen import exception  # noqa: E402
 from src.mazegen.MazeGenerator import MazeGenerator  # noqa: E402
+from src.mazegen.utils.maze_grid import MazeGrid  # noqa: E402
+from src.mazegen.utils.generate_utils import OPEN_COUNT  # noqa: E402
+from src.mazegen.algorithms.prim import Frontier  # noqa: E402
+from src.mazegen.algorithms import eller, vectorized, tiled  # noqa: E402
+from src.mazegen.algorithms import stacking, kruskal, loops  # noqa: E402
+from src.mazegen import batch  # noqa: E402
+from src.mazegen import parser  # noqa: E402
+from src.mazegen import resolve as resolve_module  # noqa: E402
+from src.mazegen import distance  # noqa: E402
+from src.mazegen.tree_index import TreeIndex  # noqa: E402
+from src.mazegen.incremental import DynamicSolver  # noqa: E402
+from src.mazegen import analytics  # noqa: E402
+from src.mazegen.utils import mlx_utils  # noqa: E402
+from src.mazegen.utils import tasks  # noqa: E402
 
 mg_module = importlib.import_module("src.mazegen.MazeGenerator")
 
@@ -21,9 +37,18 @@ class MockConfig:
         self.HEIGHT = 51
         self.SEED = "0"
         self.PERFECT = False
+        self.ALGORITHM = "auto"
+        self.SOLVER = "bfs"
+        self.PLACEMENT = "fixed"
+        self.TILE_SIZE = 0
+        self.WORKERS = 0
+        self.LOOP_DENSITY = 0.0
+        self.BRAID = 0.0
         self.ENTRY = [1, 1]
         self.EXIT = [49, 49]
         self.ANIMATION = False
+        self.ANIMATION_FPS = 60.0
+        self.CELLS_PER_FRAME = 0
         self.COLORS: list[dict[int, int]] = [{}, {}, {}, {}, {}]
         self.DELAY = 0
 
@@ -43,10 +68,47 @@ class MockXVar:
         self.img_data = None
 
 
+def mold(config: MockConfig) -> MazeGrid:
+    """Return an empty grid for `config` with the 42 symbol preset."""
+    grid = maze_utils.maze_mold(config)
+    maze_utils.add_symbol(grid, maze_utils.ft_symbol)
+    return grid
+
+
+def make_maze(config: MockConfig, symbol: bool = True) -> MazeGrid:
+    """Return a Kruskal maze for `config`, around the symbol if set."""
+    grid = mold(config) if symbol else maze_utils.maze_mold(config)
+    kruskal.generate(grid, config, None)
+    return grid
+
+
+def image_xvar(grid: MazeGrid) -> tuple[mlx_utils.XVar, list[bytearray]]:
+    """
+    Return an XVar fitting `grid` at scale 7 and the image buffers.
+
+    The mock MLX backs every new image with a bytearray, appended to the
+    returned list, so tests can read back the rendered pixels.
+    """
+    xvar = mlx_utils.XVar()
+    xvar.screen_w, xvar.screen_h = 250 + grid.width * 7, grid.height * 7
+    mlx = MagicMock()
+    buffers: list[bytearray] = []
+
+    def new_image(ptr: Any, w: int, h: int) -> int:
+        buffers.append(bytearray(w * h * 4))
+        return len(buffers)
+
+    mlx.mlx_new_image.side_effect = new_image
+    mlx.mlx_get_data_addr.side_effect = \
+        lambda img: (buffers[img - 1], 32, grid.width * 7 * 4, 0)
+    xvar.mlx = mlx
+    return xvar, buffers
+
+
 def test_add_symbol_perfect() -> None:
     """Verifies that the symbol is added correctly in a perfect maze."""
     width, height = 50, 50
-    maze = [[1 for _ in range(width)] for _ in range(height)]
+    maze = MazeGrid(width, height, 1)
 
     maze_utils.add_symbol(maze, maze_utils.ft_symbol)
 
@@ -61,7 +123,7 @@ def test_add_symbol_perfect() -> None:
 def test_add_symbol_imperfect() -> None:
     """Verifies that the symbol is added correctly in an imperfect maze."""
     width, height = 50, 50
-    maze = [[1 for _ in range(width)] for _ in range(height)]
+    maze = MazeGrid(width, height, 1)
 
     maze_utils.add_symbol(maze, maze_utils.ft_symbol)
 
@@ -73,6 +135,506 @@ def test_add_symbol_imperfect() -> None:
     assert found_symbol, "The symbol (value 2) should be present in the maze"
 
 
+def test_maze_grid_layout() -> None:
+    """Verifies the flat row-major layout and the row accessor."""
+    grid = MazeGrid(4, 3, 15)
+    grid.set(2, 1, 7)
+    assert grid.version == 1
+    with pytest.raises(TypeError):
+        grid[1][2] = 5
+    grid.cells[grid.index(3, 2)] = 9
+
+    assert len(grid.cells) == 12
+    assert grid.get(2, 1) == 7
+    assert grid.cells[1 * 4 + 2] == 7
+    assert grid.to_rows()[2][3] == 9
+    assert MazeGrid.from_rows(grid.to_rows()) == grid
+    view = memoryview(grid.cells)
+    view[0] = 3
+    assert grid.get(0, 0) == 3
+    with pytest.raises(TypeError):
+        memoryview(grid)
+
+
+def test_prim_frontier_no_duplicates() -> None:
+    """Verifies that the Prim frontier stores each cell once."""
+    frontier = Frontier(10)
+    for cell in (3, 5, 3, 7, 5):
+        frontier.add(cell)
+    assert len(frontier) == 3
+
+    popped = set()
+    while frontier:
+        popped.add(frontier.pop_random())
+    assert popped == {3, 5, 7}
+    assert 3 not in frontier
+
+
+def is_spanning_tree(grid: MazeGrid) -> bool:
+    """Return True if the non-symbol cells form one spanning tree."""
+    width = grid.width
+    free = [i for i, c in enumerate(grid.cells) if c != 16]
+    seen = {free[0]}
+    stack = [free[0]]
+    while stack:
+        i = stack.pop()
+        x, y = i % width, i // width
+        for bit, nx, ny in ((1, x, y - 1), (2, x + 1, y),
+                            (4, x, y + 1), (8, x - 1, y)):
+            j = ny * width + nx
+            if grid.cells[i] & bit and j not in seen:
+                seen.add(j)
+                stack.append(j)
+    edges = sum(bin(grid.cells[i] & 15).count("1") for i in free) // 2
+    return len(seen) == len(free) and edges == len(free) - 1
+
+
+def test_eller_rows_perfect() -> None:
+    """Verifies that streamed Eller rows form a single spanning tree."""
+    grid = MazeGrid.from_rows([list(row) for row in eller.rows(12, 9)])
+    assert is_spanning_tree(grid)
+
+
+def test_eller_stream_output_without_grid(tmp_path: Any) -> None:
+    """Verifies streamed output matches the grid run and needs no grid."""
+    config = MockConfig()
+    config.WIDTH, config.HEIGHT = 21, 15
+    config.OUTPUT_FILE = str(tmp_path / "stream.txt")
+    assert maze_utils.stream_maze(config)
+    grid = mold(config)
+    random.seed(config.SEED)
+    eller.generate(grid, config, None)
+    with open(config.OUTPUT_FILE) as f:
+        assert f.read() == parser.format_output(grid, [], config)
+
+    config.WIDTH, config.HEIGHT = 8, 20000
+    with patch.object(maze_utils, "MazeGrid", side_effect=MemoryError), \
+            patch.object(maze_utils, "maze_mold", side_effect=MemoryError):
+        assert maze_utils.stream_maze(config)
+    with open(config.OUTPUT_FILE) as f:
+        assert sum(1 for _ in f) == 20000 + 4
+
+
+@pytest.mark.parametrize("name", ["binary_tree", "sidewinder"])
+def test_vectorized_generators_perfect(name: str) -> None:
+    """Verifies the NumPy generators around the 42 symbol."""
+    pytest.importorskip("numpy")
+    config = MockConfig()
+    grid = mold(config)
+    getattr(vectorized, name)(grid, config, None)
+    assert is_spanning_tree(grid)
+
+
+def test_kruskal_perfect_around_symbol() -> None:
+    """Verifies that Kruskal spans every free cell and skips the symbol."""
+    config = MockConfig()
+    grid = mold(config)
+    symbol = [i for i, c in enumerate(grid.cells) if c == 16]
+    kruskal.generate(grid, config, None)
+
+    assert is_spanning_tree(grid)
+    assert all(grid.cells[i] == 16 for i in symbol)
+
+
+def test_tiled_generation_perfect_and_seeded() -> None:
+    """Verifies that stitched tiles form one reproducible spanning tree."""
+    config = MockConfig()
+    config.TILE_SIZE = 16
+    config.WORKERS = 2
+    mazes = []
+    for _ in range(2):
+        grid = mold(config)
+        mazes.append(tiled.generate(grid, config, None, stacking.generate))
+    assert is_spanning_tree(mazes[0])
+    assert mazes[0] == mazes[1]
+
+
+def test_resolve_reuses_cached_solution() -> None:
+    """Verifies that the BFS runs once per maze version."""
+    config = MockConfig()
+    xvar = MockXVar()
+    grid = make_maze(config)
+    start = (config.ENTRY[0], config.ENTRY[1])
+
+    first = resolve_module.resolve(start, 0, grid, None, config, xvar)
+    cached = grid.solution
+    path_cells = list(xvar.path)
+    second = resolve_module.resolve(start, 0, grid, None, config, xvar)
+    assert first == second and grid.solution is cached
+    assert xvar.path == path_cells
+    assert list(cached.iter_path()) == first
+    assert cached.rle() == resolve_module.run_length(first)
+    assert len(cached.route) == len(first)
+
+    maze_utils.make_non_perfect(grid, xvar.path)
+    resolve_module.resolve(start, 0, grid, None, config, xvar)
+    assert grid.solution is not cached
+
+
+def test_loop_injection_density_and_braid() -> None:
+    """Verifies that loops open the requested walls and braid dead ends."""
+    config = MockConfig()
+    grid = make_maze(config)
+    walls = len(loops.wall_index(grid))
+    dead_ends = sum(OPEN_COUNT[c] == 1 for c in grid.cells)
+
+    config.BRAID = 1.0
+    config.LOOP_DENSITY = 0.1
+    version = grid.version
+    opened = loops.inject(grid, config)
+
+    assert grid.version != version
+    closed = loops.wall_index(grid)
+    assert len(closed) == walls - opened
+    # Only dead ends walled in by the symbol may remain.
+    stuck = {wall >> 1 for wall in closed}
+    stuck |= {(wall >> 1) + (config.WIDTH if wall & 1 else 1)
+              for wall in closed}
+    assert all(i not in stuck for i, c in enumerate(grid.cells)
+               if OPEN_COUNT[c] == 1)
+    assert opened > dead_ends // 2
+
+    for opener in (loops.add_loops, loops.braid):
+        grid = make_maze(config, symbol=False)
+        version = grid.version
+        assert opener(grid, 0.5) and grid.version != version
+
+
+@pytest.mark.parametrize("method", ["bidirectional", "bitboard"])
+def test_solver_matches_bfs_length(method: str) -> None:
+    """Verifies that alternative solvers find a valid shortest path."""
+    config = MockConfig()
+    config.LOOP_DENSITY = 0.05
+    grid = make_maze(config)
+    loops.inject(grid, config)
+    start = (config.ENTRY[0], config.ENTRY[1])
+
+    bfs = resolve_module.resolve(start, 0, grid, None, config, None)
+    both = resolve_module.resolve(start, 0, grid, None, config, None,
+                                  method=method)
+    assert isinstance(bfs, list) and isinstance(both, list)
+    assert len(both) == len(bfs)
+    x, y = start
+    moves = {"N": (0, -1, 1), "E": (1, 0, 2), "S": (0, 1, 4), "W": (-1, 0, 8)}
+    for d in both:
+        dx, dy, bit = moves[d]
+        assert grid.get(x, y) & bit
+        x, y = x + dx, y + dy
+    assert [x, y] == config.EXIT
+
+
+def test_astar_shortest_with_fewer_expansions() -> None:
+    """Verifies that A* matches BFS length while reaching fewer cells."""
+    config = MockConfig()
+    config.LOOP_DENSITY = 0.5
+    grid = make_maze(config, symbol=False)
+    loops.inject(grid, config)
+    start = (config.ENTRY[0], config.ENTRY[1])
+    reached = {}
+    lengths = {}
+    for method in ("bfs", "astar"):
+        path = resolve_module.resolve(start, 0, grid, None, config, None,
+                                      method=method)
+        assert isinstance(path, list)
+        lengths[method] = len(path)
+        reached[method] = sum(m != resolve_module.UNREACHED
+                              for m in grid.solution.moves)
+    assert lengths["astar"] == lengths["bfs"]
+    assert reached["astar"] < reached["bfs"]
+
+
+@patch('src.mazegen.config.Config', side_effect=MockConfig)
+def test_get_solution_custom_heuristic(MockConfigClass: Any) -> None:
+    """Verifies that get_solution runs A* with a user heuristic."""
+    gen = MazeGenerator("dummy_path", headless=True)
+    maze = gen.generate_maze()
+    shortest = gen.get_solution(maze, "bfs")
+    calls = []
+
+    def zero(x: int, y: int, exit_x: int, exit_y: int) -> int:
+        calls.append((x, y))
+        return 0
+
+    assert len(gen.get_solution(maze, heuristic=zero)) == len(shortest)
+    assert calls
+    with pytest.raises(exception.ConfigException):
+        gen.get_solution(maze, "bfs", heuristic=zero)
+
+
+def test_distance_field_descends_to_bfs_path() -> None:
+    """Verifies the wavefront distances against BFS and descent paths."""
+    pytest.importorskip("numpy")
+    config = MockConfig()
+    config.LOOP_DENSITY = 0.1
+    grid = make_maze(config)
+    loops.inject(grid, config)
+    start = (config.ENTRY[0], config.ENTRY[1])
+    end = (config.EXIT[0], config.EXIT[1])
+
+    field = distance.distance_field(grid, end)
+    bfs = resolve_module.resolve(start, 0, grid, None, config, None)
+    assert isinstance(bfs, list)
+    assert field.dtype.name == "uint32"
+    assert field[start[1], start[0]] == len(bfs)
+    assert field[23, 22] == distance.UNREACHABLE  # symbol cell
+    path = distance.descend(grid, field, start)
+    assert path is not None and len(path) == len(bfs)
+    assert (distance.bfs_field(grid, end) == field).all()
+    with patch.object(distance, "np", None):
+        flat = distance.bfs_field(grid, end)
+        assert list(flat) == field.reshape(-1).tolist()
+        assert distance.descend(grid, flat, start) == path
+
+
+def test_tree_index_matches_bfs() -> None:
+    """Verifies LCA distances and paths against BFS on a perfect maze."""
+    config = MockConfig()
+    grid = make_maze(config)
+    index = TreeIndex(grid, (0, 0))
+    pairs = [((1, 1), (49, 49)), ((49, 0), (0, 49)), ((10, 30), (10, 30))]
+    for a, b in pairs:
+        config.EXIT = list(b)
+        bfs = resolve_module.resolve(a, 0, grid, None, config, None)
+        assert index.path(a, b) == bfs
+        assert index.distance(a, b) == index.distance(b, a) == len(bfs)
+
+    loops.add_loops(grid, 0.1)
+    with pytest.raises(exception.MazeException):
+        TreeIndex(grid)
+
+
+def test_multi_query_solver_shares_trees() -> None:
+    """Verifies batch solving against single BFS runs, both root sides."""
+    config = MockConfig()
+    config.LOOP_DENSITY = 0.05
+    grid = make_maze(config)
+    loops.inject(grid, config)
+    spawn, goals = (1, 1), [(49, 49), (0, 50), (30, 2), (22, 23)]
+    one_to_many = [(spawn, goal) for goal in goals]
+    many_to_one = [(goal, spawn) for goal in goals]
+
+    with patch.object(resolve_module, "bfs_moves",
+                      wraps=resolve_module.bfs_moves) as bfs:
+        paths = resolve_module.solve_many(grid, one_to_many)
+        lazy = resolve_module.iter_many(grid, many_to_one)
+        assert bfs.call_count == 2
+    assert paths[3] is None and lazy[3] is None  # symbol cell
+    for goal, path, it in zip(goals[:3], paths, lazy):
+        config.EXIT = list(goal)
+        bfs_path = resolve_module.resolve(spawn, 0, grid, None, config, None)
+        assert isinstance(bfs_path, list) and it is not None
+        assert path is not None and len(path) == len(bfs_path)
+        assert len("".join(it)) == len(bfs_path)
+
+
+def test_dynamic_solver_tracks_wall_edits() -> None:
+    """Verifies incremental repairs against a fresh BFS after each batch."""
+    config = MockConfig()
+    grid = make_maze(config)
+    start = (config.ENTRY[0], config.ENTRY[1])
+    dynamic = DynamicSolver(grid, start, (config.EXIT[0], config.EXIT[1]))
+    rng = random.Random(7)
+    walls = [((x, y), (x + 1, y)) for y in range(51) for x in range(50)]
+    walls += [((x, y), (x, y + 1)) for y in range(50) for x in range(51)]
+    walls = [(a, b) for a, b in walls
+             if grid.get(*a) != 16 and grid.get(*b) != 16]
+    for _ in range(20):
+        path = dynamic.apply(rng.sample(walls, 15), rng.sample(walls, 5))
+        fresh = resolve_module.resolve(start, 0, grid.copy(), None,
+                                       config, None)
+        if path is None:
+            assert fresh is False
+        else:
+            assert isinstance(fresh, list) and len(path) == len(fresh)
+        assert grid.solution is not None and grid.solution.path == path
+    assert grid.solution.moves is dynamic.moves
+    assert dynamic.solution(snapshot=True).moves is not dynamic.moves
+
+    grid = make_maze(config)
+    dynamic = DynamicSolver(grid, start, (config.EXIT[0], config.EXIT[1]))
+    opened = maze_utils.make_non_perfect(grid, dynamic.solution().cells)
+    path = dynamic.relax(opened)
+    fresh = resolve_module.resolve(start, 0, grid.copy(), None, config, None)
+    assert opened and isinstance(fresh, list) and path is not None
+    assert len(path) == len(fresh)
+
+
+def test_analytics_report_counts() -> None:
+    """Verifies the report on a perfect maze, then after adding loops."""
+    config = MockConfig()
+    grid = make_maze(config)
+    start = (config.ENTRY[0], config.ENTRY[1])
+    end = (config.EXIT[0], config.EXIT[1])
+
+    report = analytics.analyze(grid, start, end)
+    bfs = resolve_module.resolve(start, 0, grid, None, config, None)
+    assert isinstance(bfs, list)
+    assert report.solution_length == len(bfs)
+    assert report.loops == 0 and report.components == 1
+    assert report.passages == report.cells - 1
+    assert sum(k * n for k, n in report.corridors.items()) == report.passages
+    a, b = report.diameter_ends
+    far = analytics.bfs_distances(grid, a[1] * grid.width + a[0])[0]
+    assert report.diameter == max(far) == TreeIndex(grid).distance(a, b)
+
+    opened = loops.add_loops(grid, 0.05)
+    report = analytics.analyze(grid)
+    assert report.loops == opened and report.solution_length is None
+    assert sum(k * n for k, n in report.corridors.items()) == report.passages
+
+
+def test_tile_renderer_matches_pixel_rules() -> None:
+    """Verifies full renders and single-cell stamps pixel by pixel."""
+    config = MockConfig()
+    config.COLORS = [{0: 0xFF000000, 1: 0xFF111111, 2: 0xFF222222,
+                      3: 0xFF333333, 4: 0xFF444444}]
+    grid = make_maze(config)
+    xvar, buffers = image_xvar(grid)
+    mlx = xvar.mlx
+    mlx_utils.render_maze_to_mlx(mlx, None, None, grid, config, xvar)
+    mlx_utils.update_cell(xvar, 1, 2, 0, config)
+    mlx_utils.flush_frame(xvar, config)
+    grid.set(1, 2, 0)
+
+    scale, sl = 7, xvar.img_sl
+    data = buffers[-1]
+    kinds = {tuple(config.ENTRY): 3, tuple(config.EXIT): 4}
+    for y in range(grid.height):
+        for x in range(grid.width):
+            cell = grid.get(x, y)
+            kind = kinds.get((x, y), 0 if cell & 15 else 2)
+            for dy in range(scale):
+                for dx in range(scale):
+                    wall = mlx_utils.is_wall_pixel(cell, dx, dy, scale, 1)
+                    off = (y * scale + dy) * sl + (x * scale + dx) * 4
+                    expected = config.COLORS[0][1 if wall else kind]
+                    assert data[off:off + 4] == \
+                        expected.to_bytes(4, "little")
+
+
+def test_path_overlay_paints_and_restores() -> None:
+    """Verifies path spans, erasing and palette swaps on the class buffer."""
+    config = MockConfig()
+    config.COLORS = [{0: 0xFF000000, 1: 0xFF111111, 5: 0xFF555555},
+                     {0: 0xFF666666, 1: 0xFF777777, 2: 0xFF888888,
+                      5: 0xFF999999}]
+    grid = make_maze(config)
+    resolve_module.resolve(tuple(config.ENTRY), 0, grid, None, config, None)
+    assert grid.solution is not None
+    path = list(grid.solution.cells)
+    xvar, buffers = image_xvar(grid)
+    mlx = xvar.mlx
+    xvar.maze_data, xvar.path = grid, path
+    mlx_utils.render_maze_to_mlx(mlx, None, None, grid, config, xvar)
+    mlx_utils.create_path_image(xvar, config)
+    assert xvar.overlay is not None and not xvar.overlay.painted
+    assert xvar.frame is not None
+    classes, data = bytes(xvar.frame.classes), buffers[-1]
+    background = bytes(data)
+
+    mlx_utils.show_path_overlay(xvar, config, True)
+    mlx_utils.show_path_overlay(xvar, config, True)
+    scale, sl = 7, xvar.img_sl
+    expected = bytearray(background)
+    for x, y in path:
+        cell = grid.get(x, y)
+        for dy in range(scale):
+            for dx in range(scale):
+                if not mlx_utils.is_wall_pixel(cell, dx, dy, scale, 1):
+                    off = (y * scale + dy) * sl + (x * scale + dx) * 4
+                    expected[off:off + 4] = (0xFF555555).to_bytes(4, "little")
+    assert data == expected
+    assert len(xvar.overlay.spans) < len(path) * scale
+
+    xvar.color_palette = 1
+    mlx_utils.recolor_maze(xvar, config)
+    mlx_utils.show_path_overlay(xvar, config, False)
+    assert xvar.frame.classes == classes and not xvar.overlay.painted
+    recolored = bytes(data)
+    mlx_utils.render_maze_to_mlx(mlx, None, None, grid, config, xvar)
+    assert buffers[-1] == recolored and len(buffers) == 2
+
+
+def test_frame_scheduler_batches_cell_updates() -> None:
+    """Verifies one window push per frame and deduplicated cells."""
+    config = MockConfig()
+    config.CELLS_PER_FRAME = 10
+    config.ANIMATION_FPS = 10000.0
+    xvar = mlx_utils.XVar()
+    xvar.mlx = MagicMock()
+    xvar.frame = MagicMock()
+    with patch.object(mlx_utils.TileSet, "stamp") as stamp:
+        for i in range(10):
+            mlx_utils.update_cell(xvar, i % 5, 0, 15, config)
+        assert xvar.mlx.mlx_put_image_to_window.call_count == 0
+        mlx_utils.flush_frame(xvar, config)
+        for i in range(25):
+            mlx_utils.update_cell(xvar, i, 1, 15, config)
+        assert xvar.mlx.mlx_put_image_to_window.call_count == 3
+        mlx_utils.flush_frame(xvar, config)
+        mlx_utils.flush_frame(xvar, config)
+    assert xvar.scheduler is not None and xvar.scheduler.frames == 4
+    assert xvar.mlx.mlx_put_image_to_window.call_count == 4
+    assert stamp.call_count == 5 + 25
+
+
+def test_generation_task_resumes_and_cancels() -> None:
+    """Verifies budgeted steps match a direct run and cancel stops them."""
+    expected = maze_utils.generate_maze(MockConfig(), MockXVar())
+    done: list[MazeGrid] = []
+    task = tasks.GenerationTask(
+        maze_utils.generation_steps(MockConfig(), MockXVar()), 0.0,
+        done.append)
+    advances = 1
+    while not task.advance():
+        advances += 1
+    assert advances > 1 and done == [task.result]
+    assert task.result is not None
+    assert task.result.cells == expected.cells
+
+    task = tasks.GenerationTask(
+        maze_utils.generation_steps(MockConfig(), MockXVar()), 0.0,
+        done.append)
+    assert not task.advance()
+    task.cancel()
+    assert task.advance() and len(done) == 1
+    with pytest.raises(StopIteration):
+        next(task.steps)
+
+    scheduler = mlx_utils.FrameScheduler(1.0, 1)
+    xvar = mlx_utils.XVar()
+    xvar.mlx, xvar.frame = MagicMock(), MagicMock()
+    with patch.object(mlx_utils.TileSet, "stamp"):
+        started = time.perf_counter()
+        scheduler.add(xvar, 0, 15, MockConfig())
+        scheduler.add(xvar, 1, 15, MockConfig())
+    assert time.perf_counter() - started < 0.5 and scheduler.throttled()
+    steps = maze_utils.generation_steps(MockConfig(), MockXVar())
+    task = tasks.GenerationTask(steps, 10.0, done.append,
+                                scheduler.throttled)
+    assert not task.advance() and task.running
+    task.cancel()
+
+
+def test_endpoint_placement_by_diameter() -> None:
+    """Verifies diameter and border placement and the cached solution."""
+    config = MockConfig()
+    grid = make_maze(config)
+    diameter = analytics.analyze(grid).diameter
+
+    placed = analytics.place_endpoints(grid)
+    assert placed.route is not None and len(placed.route) == diameter
+    assert TreeIndex(grid).distance(placed.start, placed.end) == diameter
+    config.ENTRY, config.EXIT = list(placed.start), list(placed.end)
+    path = resolve_module.resolve(placed.start, 0, grid, None, config, None)
+    assert grid.solution is placed and path == placed.path
+
+    placed = analytics.place_endpoints(grid, border=True)
+    assert placed.route is not None and len(placed.route) <= diameter
+    for x, y in (placed.start, placed.end):
+        assert x in (0, grid.width - 1) or y in (0, grid.height - 1)
+
+
 @patch.object(mg_module, 'Mlx')
 @patch('src.mazegen.config.Config', side_effect=MockConfig)
 @patch('src.mazegen.utils.maze_utils.resolve')
@@ -90,8 +652,7 @@ def test_generate_maze_prim_success(mock_prim: Any,
 
     # The maze that will be "generated"
     config = MockConfig()
-    fake_maze = [[1 for _ in range(config.WIDTH)]
-                 for _ in range(config.HEIGHT)]
+    fake_maze = MazeGrid(config.WIDTH, config.HEIGHT, 1)
     mock_prim.generate.return_value = fake_maze
     mock_resolve.return_value = [(1, 1), (2, 2)]
 
@@ -133,8 +694,7 @@ def test_generate_maze_stacking_success(mock_stacking: Any,
 
     config = custom_config()  # just for assertions
 
-    fake_maze = [[1 for _ in range(config.WIDTH)]
-                 for _ in range(config.HEIGHT)]
+    fake_maze = MazeGrid(config.WIDTH, config.HEIGHT, 1)
     mock_stacking.generate.return_value = fake_maze
     mock_resolve.return_value = [(1, 1), (2, 2)]
 
@@ -151,6 +711,49 @@ def test_generate_maze_stacking_success(mock_stacking: Any,
     mock_stacking.generate.assert_called_once()
 
 
+@patch.object(mg_module, 'Mlx')
+@patch('src.mazegen.config.Config', side_effect=MockConfig)
+def test_headless_never_touches_mlx(MockConfigClass: Any,
+                                    MockMlx: Any) -> None:
+    """Verifies that a headless generator generates and solves
+    without initializing MLX."""
+    gen = MazeGenerator("dummy_path", headless=True)
+    maze = gen.generate_maze()
+    solution = gen.get_solution(maze)
+
+    assert len(solution) > 0
+    MockMlx.assert_not_called()
+    with pytest.raises(exception.ConfigException):
+        gen.draw_maze(maze)
+
+
+def test_batch_seed_and_size_specs() -> None:
+    """Verifies the batch seed ranges and size sweeps parsing."""
+    assert batch.parse_seeds("1-3,abc,7") == ["1", "2", "3", "abc", "7"]
+    assert batch.parse_sizes("21x21,51X31") == [(21, 21), (51, 31)]
+    with pytest.raises(exception.ArgsException):
+        batch.parse_sizes("21")
+
+
+def test_batch_seed_zero_is_reproducible(tmp_path: Any) -> None:
+    """Verifies seed 0 is a real seed and worker failures are reported."""
+    path = tmp_path / "config.txt"
+    path.write_text("WIDTH=21\nHEIGHT=21\nENTRY=1,1\nEXIT=20,20\n"
+                    "OUTPUT_FILE=out.txt\nPERFECT=True\nANIMATION=0\n")
+    results = list(batch.run_batch(str(path), ["0", "0"], [(-1, -1)], 2))
+    assert [error for *_, error in results] == [None, None]
+    assert results[0][2] == results[1][2]
+
+    with patch.object(batch, "MazeGenerator", side_effect=OSError("disk")):
+        seed, _, text, error = batch._run_job((str(path), "1", (-1, -1),
+                                               None, False))
+    assert (seed, text, error) == ("1", "", "OSError: disk")
+    # The config file is not a directory, so writing the maze fails.
+    _, _, text, error = batch._run_job((str(path), "1", (-1, -1),
+                                        str(path), False))
+    assert text == "" and error
+
+
 @patch.object(mg_module, 'Mlx')
 @patch('src.mazegen.config.Config', side_effect=MockConfig)
 def test_generate_maze_invalid_entry_exit(MockConfigClass: Any,